@@ -14,20 +14,40 @@ DATA_DIR = PROJECT_ROOT / "data"
 RAW_DATA_DIR = DATA_DIR / "raw"
 OUTPUT_DIR = PROJECT_ROOT / "output"
 CACHE_DIR = "cache"  # Directory for caching fish survey data
+SNAPSHOT_DIR = DATA_DIR / "snapshots"  # GeoParquet snapshots of validated input data
+STORE_DIR = DATA_DIR / "store"  # Lake-sorted columnar stores
 
 # Input file paths
 BATHYMETRY_FILE = RAW_DATA_DIR / "bathymetry_contours.shp"
 FISH_SURVEY_FILE = RAW_DATA_DIR / "fish_survey.shp"
 
+# Input formats the loader looks for next to the configured files, fastest first.
+# Converted copies (scripts/convert_inputs.py) are used instead of the shapefiles.
+INPUT_FORMAT_SUFFIXES = ['.parquet', '.fgb', '.gpkg', '.shp']
+
+# Lake-sorted bathymetry store and its per-lake row range index
+BATHYMETRY_STORE_FILE = STORE_DIR / "bathymetry_by_lake.parquet"
+BATHYMETRY_STORE_INDEX_FILE = STORE_DIR / "bathymetry_by_lake_index.json"
+
+# Match table of the last run, used to find lakes that changed between data drops
+MATCH_TABLE_FILE = DATA_DIR / "match_table.parquet"
+
+# Content-addressed cache of merged lake geometries
+MERGE_CACHE_FILE = DATA_DIR / "merge_cache.parquet"
+MERGE_CACHE_MAX_AGE_DAYS = 30  # Entries unused for this long are pruned when the cache is saved
+
 # Output directory structure
 GEOJSON_DIR = OUTPUT_DIR / "geojson"
 RASTER_DIR = OUTPUT_DIR / "raster"
 METADATA_DIR = OUTPUT_DIR / "metadata"
+LOD_DIR = OUTPUT_DIR / "lod"  # Simplified level-of-detail lake geometries
+DEPTH_BANDS_DIR = OUTPUT_DIR / "depth_bands"  # Filled depth-band polygons per lake
 CONTOURS_DIR = OUTPUT_DIR / "contours"
 
 # Geometry processing settings
 BUFFER_DISTANCE_METERS = 10.0  # Buffer distance for merging bathymetry contours
 CRS_EPSG = 26915  # UTM Zone 15N (Minnesota) - NAD83
+WEB_CRS_EPSG = 4326  # WGS84 for GeoJSON web map exports
 
 # Field mappings
 BATHYMETRY_FIELDS = {
@@ -47,6 +67,34 @@ FISH_SURVEY_FIELDS = {
     'shape_area': 'SHAPE_Area'
 }
 
+# Canonical DOWLKNUM columns added to both datasets by the loader
+DOWLKNUM_KEY_FIELD = 'dowlknum_key'  # Zero-padded 8-character string (missing when invalid)
+DOWLKNUM_INT_FIELD = 'dowlknum_int'  # int64 twin of the key (-1 when invalid)
+DOWLKNUM_VALID_FIELD = 'dowlknum_valid'  # Boolean validity mask
+SPATIAL_MATCH_FIELD = 'spatial_match'  # True for contours keyed by the spatial fallback matcher
+BASIN_KEY_FIELD = 'basin_dowlknum'  # Original basin key when lakes are grouped by parent lake
+
+# Optional columns read alongside the required fields when present
+BATHYMETRY_OPTIONAL_FIELDS = []
+FISH_SURVEY_OPTIONAL_FIELDS = ['PW_BASIN_N']
+
+# Memory-compact dtypes applied by the loader when loading with compact=True
+BATHYMETRY_COMPACT_DTYPES = {
+    BATHYMETRY_FIELDS['dowlknum']: 'category',
+    BATHYMETRY_FIELDS['lake_name']: 'category',
+    DOWLKNUM_KEY_FIELD: 'category',  # Repeated for every contour of a lake
+    DOWLKNUM_INT_FIELD: 'int32',
+    BATHYMETRY_FIELDS['depth']: 'float32',
+    BATHYMETRY_FIELDS['abs_depth']: 'float32',
+    BATHYMETRY_FIELDS['shape_leng']: 'float32'
+}
+
+FISH_SURVEY_COMPACT_DTYPES = {
+    FISH_SURVEY_FIELDS['city_name']: 'category',
+    DOWLKNUM_INT_FIELD: 'int32',
+    FISH_SURVEY_FIELDS['shape_leng']: 'float32'
+}
+
 # Logging configuration
 LOG_LEVEL = "INFO"
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -54,10 +102,53 @@ LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 # Processing settings
 BATCH_SIZE = 100  # Number of lakes to process in each batch for progress reporting
 MAX_WORKERS = 10  # Maximum number of concurrent threads for parallel processing
+STORE_ROW_GROUP_SIZE = 8192  # Rows per Parquet row group in the bathymetry store
+STREAM_BATCH_SIZE = 50000  # Contours per record batch when streaming bathymetry data
+MERGE_WORKERS = None  # Worker processes for parallel merging (None uses os.cpu_count())
+MERGE_TASKS_PER_WORKER = 2  # Lakes queued per merge worker, bounding the WKB held in flight
+
+# Lake grouping settings
+# 'dowlknum' matches and merges every basin separately; 'parent' groups basins whose
+# DOWLKNUMs share the first PARENT_LAKE_DIGITS digits (e.g. the Lake Minnetonka
+# basins 27013301, 27013302, ...) into one parent lake keyed 27013300
+LAKE_GROUPINGS = ('dowlknum', 'parent')
+LAKE_GROUPING = 'dowlknum'
+PARENT_LAKE_DIGITS = 6
+
+# Contour union settings
+# 'unary_union' is the legacy shapely.ops call on a list of geometries, 'union_all'
+# the vectorized shapely.union_all on a geometry array, and 'coverage' uses the much
+# faster shapely.coverage_union_all when a lake's contours form a valid coverage
+# (non-overlapping, edge-matched polygons), falling back to 'union_all' otherwise
+UNION_STRATEGIES = ('unary_union', 'union_all', 'coverage')
+UNION_STRATEGY = 'unary_union'
+UNION_GRID_SIZE = None  # Precision grid in meters to snap union output to (None keeps full precision)
+
+# Tiled union settings
+# Lakes whose contours have more vertices than the threshold (None disables tiling)
+# are unioned per cell of a grid over their extent, on a thread pool, and the cell
+# results stitched with a final union instead of one giant superlinear union
+TILED_UNION_MIN_VERTICES = 200000
+TILED_UNION_CELLS_PER_SIDE = 4
+TILED_UNION_WORKERS = None  # Threads unioning cells (None uses os.cpu_count())
+
+# Level-of-detail settings
+# Simplification tolerances in meters, one LOD file per tolerance (level 1 is the finest)
+LOD_TOLERANCES_METERS = [2.0, 10.0, 50.0]
+
+# Depth band settings
+# Contours are rounded down to multiples of the interval, giving filled bands of
+# 0-5 ft, 5-10 ft, ... between consecutive contour levels
+DEPTH_BAND_INTERVAL_FEET = 5.0
+DEPTH_BAND_COORDINATE_PRECISION = 6  # Decimal places of the WGS84 depth-band GeoJSON coordinates
+
+# Spatial fallback matching settings
+SPATIAL_FALLBACK_MIN_OVERLAP = 0.5  # Minimum share of a contour inside an outline to assign it
 
 # Validation settings
 MIN_LAKE_AREA_ACRES = 1.0  # Minimum lake area to include in processing
 MAX_LAKE_AREA_ACRES = 1000000.0  # Maximum lake area (sanity check)
+REPAIR_GEOMETRIES = False  # Make merged geometries valid MultiPolygons before export
 
 # Web scraping settings (for future fish survey data extraction)
 REQUEST_TIMEOUT = 30  # seconds
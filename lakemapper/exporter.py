@@ -8,22 +8,31 @@ GeoJSON, metadata JSON, and raster formats.
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 
 import geopandas as gpd
 import pandas as pd
 import numpy as np
 
-from .config import GEOJSON_DIR, METADATA_DIR, RASTER_DIR, CONTOURS_DIR
-from .utils import format_lake_filename, ensure_directories
+from .config import (
+    GEOJSON_DIR, METADATA_DIR, RASTER_DIR, CONTOURS_DIR, LOD_DIR, DEPTH_BANDS_DIR, CRS_EPSG, WEB_CRS_EPSG,
+    DEPTH_BAND_COORDINATE_PRECISION
+)
+from .merger import get_original_contours, get_original_contour_geometries
+from .projection import is_same_crs, to_crs, transform_geometries
+from .utils import format_lake_filename, ensure_directories, widen_float32_columns
 
 
 logger = logging.getLogger(__name__)
 
+# Merged lake record entries that are not lake properties
+NON_PROPERTY_KEYS = ('contour_source', 'contour_rows', 'lods', 'depth_bands')
+
 
 def export_lake_geojson(
     lake_data: Dict[str, Any],
-    output_dir: Optional[Path] = None
+    output_dir: Optional[Path] = None,
+    web_geometry: Optional[Any] = None
 ) -> Path:
     """
     Export a single lake to GeoJSON format.
@@ -31,7 +40,9 @@ def export_lake_geojson(
     Args:
         lake_data: Dictionary containing lake data with geometry and metadata
         output_dir: Optional output directory (defaults to GEOJSON_DIR)
-        
+        web_geometry: Optional lake geometry already reprojected to WGS84
+            (see export_all_lakes); reprojected here when not given
+            
     Returns:
         Path to the exported GeoJSON file
     """
@@ -42,9 +53,11 @@ def export_lake_geojson(
     filename = format_lake_filename(dowlknum, "geojson")
     output_path = output_dir / filename
     
-    # Create GeoDataFrame for this lake and reproject to WGS84 for web maps
-    lake_gdf = gpd.GeoDataFrame([lake_data], crs="EPSG:26915")
-    lake_gdf_wgs84 = lake_gdf.to_crs(epsg=4326)
+    # Create GeoDataFrame for this lake in WGS84 for web maps
+    if web_geometry is None:
+        web_geometry = transform_geometries([lake_data['geometry']], CRS_EPSG, WEB_CRS_EPSG)[0]
+    properties = {key: value for key, value in lake_data.items() if key not in NON_PROPERTY_KEYS}
+    lake_gdf_wgs84 = gpd.GeoDataFrame([{**properties, 'geometry': web_geometry}], crs=f"EPSG:{WEB_CRS_EPSG}")
     
     # Export to GeoJSON
     lake_gdf_wgs84.to_file(output_path, driver="GeoJSON")
@@ -55,22 +68,26 @@ def export_lake_geojson(
 
 def export_lake_contours_geojson(
     lake_data: Dict[str, Any],
-    output_dir: Optional[Path] = None
+    output_dir: Optional[Path] = None,
+    web_geometries: Optional[np.ndarray] = None
 ) -> Optional[Path]:
     """
     Export the original bathymetry contours for a single lake as GeoJSON.
     
     Args:
-        lake_data: Dictionary containing lake data with 'original_contours' GeoDataFrame
+        lake_data: Dictionary containing merged lake data (contours are read through
+            merger.get_original_contours)
         output_dir: Optional output directory (defaults to CONTOURS_DIR)
-        
+        web_geometries: Optional contour geometries already reprojected to WGS84,
+            in the order of the original contours; reprojected here when not given
+            
     Returns:
         Path to the exported GeoJSON file, or None if no contours are available
     """
     ensure_directories()
     output_dir = output_dir or CONTOURS_DIR
     dowlknum = lake_data['dowlknum']
-    contours_gdf = lake_data.get('original_contours')
+    contours_gdf = get_original_contours(lake_data)
     
     if contours_gdf is None or len(contours_gdf) == 0:
         logger.debug(f"No original contours to export for lake {dowlknum}")
@@ -81,10 +98,18 @@ def export_lake_contours_geojson(
     output_path = output_dir / filename
     
     try:
+        # Compact float32 attributes would be written as 12.300000190734863
+        contours_gdf = widen_float32_columns(contours_gdf)
+        
         # Ensure CRS is set for export
         if contours_gdf.crs is None:
-            contours_gdf.set_crs("EPSG:26915", inplace=True)
-        contours_wgs84 = contours_gdf.to_crs(epsg=4326)
+            contours_gdf.set_crs(epsg=CRS_EPSG, inplace=True)
+        if web_geometries is None:
+            contours_wgs84 = to_crs(contours_gdf, WEB_CRS_EPSG)
+        else:
+            contours_wgs84 = contours_gdf.set_geometry(
+                gpd.GeoSeries(web_geometries, index=contours_gdf.index), crs=f"EPSG:{WEB_CRS_EPSG}"
+            )
         contours_wgs84.to_file(output_path, driver="GeoJSON")
         logger.debug(f"Exported contours for lake {dowlknum} to {output_path}")
         return output_path
@@ -93,6 +118,125 @@ def export_lake_contours_geojson(
         return None
 
 
+def export_lake_lods(
+    lake_data: Dict[str, Any],
+    output_dir: Optional[Path] = None,
+    web_geometries: Optional[List[Any]] = None
+) -> List[Path]:
+    """
+    Export the level-of-detail geometries of a single lake, one GeoJSON file per level.
+    
+    The file name and size of each level are recorded in its 'lods' entry for the
+    lake index.
+    
+    Args:
+        lake_data: Dictionary containing lake data with 'lods' from lod.build_lake_lods
+        output_dir: Optional output directory (defaults to LOD_DIR)
+        web_geometries: Optional LOD geometries already reprojected to WGS84, in the
+            order of 'lods'; reprojected here when not given
+            
+    Returns:
+        List of paths to the exported LOD files
+    """
+    ensure_directories()
+    output_dir = output_dir or LOD_DIR
+    dowlknum = lake_data['dowlknum']
+    lods = lake_data.get('lods', [])
+    
+    if web_geometries is None:
+        web_geometries = transform_geometries([lod['geometry'] for lod in lods], CRS_EPSG, WEB_CRS_EPSG)
+    
+    output_paths = []
+    for lod, web_geometry in zip(lods, web_geometries):
+        output_path = output_dir / lod_filename(dowlknum, lod['level'])
+        lod_gdf = gpd.GeoDataFrame([{
+            'dowlknum': dowlknum,
+            'level': lod['level'],
+            'tolerance': lod['tolerance'],
+            'vertex_count': lod['vertex_count'],
+            'geometry': web_geometry
+        }], crs=f"EPSG:{WEB_CRS_EPSG}")
+        lod_gdf.to_file(output_path, driver="GeoJSON")
+        
+        lod['file'] = output_path.name
+        lod['bytes'] = output_path.stat().st_size
+        output_paths.append(output_path)
+    
+    logger.debug(f"Exported {len(output_paths)} LOD files for lake {dowlknum}")
+    return output_paths
+
+
+def lod_filename(dowlknum: str, level: int) -> str:
+    """
+    Generate the LOD file name of a lake and level.
+    
+    Args:
+        dowlknum: The lake's DOWLKNUM
+        level: LOD level (1 is the finest)
+        
+    Returns:
+        Formatted filename
+    """
+    return format_lake_filename(f"{dowlknum}_lod{level}", "geojson")
+
+
+def export_lake_depth_bands(
+    lake_data: Dict[str, Any],
+    output_dir: Optional[Path] = None,
+    web_geometries: Optional[List[Any]] = None
+) -> Optional[Path]:
+    """
+    Export the depth-band polygons of a single lake as one compact GeoJSON layer.
+    
+    Features only carry their min_depth and max_depth, and coordinates are rounded
+    to DEPTH_BAND_COORDINATE_PRECISION decimal places.
+    
+    Args:
+        lake_data: Dictionary containing lake data with 'depth_bands' from
+            merger.build_lake_depth_bands
+        output_dir: Optional output directory (defaults to DEPTH_BANDS_DIR)
+        web_geometries: Optional band geometries already reprojected to WGS84, in the
+            order of 'depth_bands'; reprojected here when not given
+            
+    Returns:
+        Path to the exported GeoJSON file, or None if the lake has no depth bands
+    """
+    ensure_directories()
+    output_dir = output_dir or DEPTH_BANDS_DIR
+    dowlknum = lake_data['dowlknum']
+    depth_bands = lake_data.get('depth_bands', [])
+    
+    if not depth_bands:
+        logger.debug(f"No depth bands to export for lake {dowlknum}")
+        return None
+    
+    if web_geometries is None:
+        web_geometries = transform_geometries([band['geometry'] for band in depth_bands], CRS_EPSG, WEB_CRS_EPSG)
+    
+    output_path = output_dir / depth_bands_filename(dowlknum)
+    bands_gdf = gpd.GeoDataFrame({
+        'min_depth': [band['min_depth'] for band in depth_bands],
+        'max_depth': [band['max_depth'] for band in depth_bands]
+    }, geometry=list(web_geometries), crs=f"EPSG:{WEB_CRS_EPSG}")
+    bands_gdf.to_file(output_path, driver="GeoJSON", COORDINATE_PRECISION=DEPTH_BAND_COORDINATE_PRECISION)
+    
+    logger.debug(f"Exported {len(depth_bands)} depth bands for lake {dowlknum} to {output_path}")
+    return output_path
+
+
+def depth_bands_filename(dowlknum: str) -> str:
+    """
+    Generate the depth-band file name of a lake.
+    
+    Args:
+        dowlknum: The lake's DOWLKNUM
+        
+    Returns:
+        Formatted filename
+    """
+    return f"depth_bands_{dowlknum}.geojson"
+
+
 def export_lake_metadata(
     lake_data: Dict[str, Any],
     fish_survey_data: Optional[Dict[str, Any]] = None,
@@ -128,6 +272,7 @@ def export_lake_metadata(
         'survey_url': lake_data.get('survey_url'),
         'geometry_type': geometry.geom_type if geometry else None,
         'area_sq_meters': float(geometry.area) if geometry else None,
+        'basin_dowlknums': lake_data.get('basin_dowlknums', [lake_data['dowlknum']]),
         'export_timestamp': pd.Timestamp.now().isoformat()
     }
     
@@ -151,7 +296,9 @@ def export_all_lakes(
     export_metadata: bool = True,
     export_raster: bool = False,
     export_contours: bool = True,
-    include_fish_surveys: bool = True
+    include_fish_surveys: bool = True,
+    export_lods: bool = True,
+    export_depth_bands: bool = True
 ) -> Dict[str, Any]:
     """
     Export all merged lakes to the specified formats.
@@ -162,7 +309,10 @@ def export_all_lakes(
         export_metadata: Whether to export metadata JSON files
         export_raster: Whether to export raster files (not implemented yet)
         include_fish_surveys: Whether to fetch and include fish survey data
-        
+        export_lods: Whether to export the LOD files of lakes that have 'lods'
+        export_depth_bands: Whether to export the depth-band layers of lakes that have
+            'depth_bands'
+            
     Returns:
         Dictionary containing export statistics
     """
@@ -197,11 +347,22 @@ def export_all_lakes(
         'metadata_exported': 0,
         'raster_exported': 0,
         'contours_exported': 0,
+        'lods_exported': 0,
+        'depth_bands_exported': 0,
         'failed_exports': 0,
         'fish_surveys_fetched': len([data for data in fish_survey_data.values() if data is not None]),
         'exported_files': []
     }
     
+    # Reproject every lake (and its contours) to WGS84 in bulk rather than per lake
+    web_geometries = _project_lake_geometries(merged_lakes) if export_geojson else None
+    web_contours = _project_lake_contours(merged_lakes) if export_contours else None
+    web_lods = _project_lake_lods(merged_lakes) if export_lods else None
+    web_depth_bands = _project_lake_depth_bands(merged_lakes) if export_depth_bands else None
+    
+    # Lakes with at least one failed export, so callers can retry them on the next run
+    failed_dowlknums = set()
+    
     for i, lake_data in enumerate(merged_lakes):
         if (i + 1) % 50 == 0:
             logger.info(f"Exported {i + 1}/{len(merged_lakes)} lakes...")
@@ -212,12 +373,13 @@ def export_all_lakes(
             # Export GeoJSON
             if export_geojson:
                 try:
-                    geojson_path = export_lake_geojson(lake_data)
+                    geojson_path = export_lake_geojson(lake_data, web_geometry=web_geometries[i])
                     export_stats['geojson_exported'] += 1
                     export_stats['exported_files'].append(str(geojson_path))
                 except Exception as e:
                     logger.error(f"Failed to export GeoJSON for lake {dowlknum}: {e}")
                     export_stats['failed_exports'] += 1
+                    failed_dowlknums.add(dowlknum)
             
             # Export metadata
             if export_metadata:
@@ -230,26 +392,56 @@ def export_all_lakes(
                 except Exception as e:
                     logger.error(f"Failed to export metadata for lake {dowlknum}: {e}")
                     export_stats['failed_exports'] += 1
+                    failed_dowlknums.add(dowlknum)
             
             # Export original contours GeoJSON for UI mapping
             if export_contours:
                 try:
-                    contours_path = export_lake_contours_geojson(lake_data)
+                    contours_path = export_lake_contours_geojson(
+                        lake_data, web_geometries=web_contours[i]
+                    )
                     if contours_path is not None:
                         export_stats['contours_exported'] += 1
                         export_stats['exported_files'].append(str(contours_path))
                 except Exception as e:
                     logger.error(f"Failed to export contours for lake {dowlknum}: {e}")
                     export_stats['failed_exports'] += 1
+                    failed_dowlknums.add(dowlknum)
+            
+            # Export simplified level-of-detail geometries
+            if export_lods and lake_data.get('lods'):
+                try:
+                    lod_paths = export_lake_lods(lake_data, web_geometries=web_lods[i])
+                    export_stats['lods_exported'] += len(lod_paths)
+                    export_stats['exported_files'].extend(str(path) for path in lod_paths)
+                except Exception as e:
+                    logger.error(f"Failed to export LODs for lake {dowlknum}: {e}")
+                    export_stats['failed_exports'] += 1
+                    failed_dowlknums.add(dowlknum)
+            
+            # Export filled depth-band polygons
+            if export_depth_bands and lake_data.get('depth_bands'):
+                try:
+                    depth_bands_path = export_lake_depth_bands(lake_data, web_geometries=web_depth_bands[i])
+                    export_stats['depth_bands_exported'] += 1
+                    export_stats['exported_files'].append(str(depth_bands_path))
+                except Exception as e:
+                    logger.error(f"Failed to export depth bands for lake {dowlknum}: {e}")
+                    export_stats['failed_exports'] += 1
+                    failed_dowlknums.add(dowlknum)
             
             # Export raster (placeholder for future implementation)
             if export_raster:
                 logger.warning("Raster export not yet implemented")
                 export_stats['raster_exported'] += 0  # Placeholder
-                
+        
         except Exception as e:
             logger.error(f"Failed to export lake {lake_data.get('dowlknum', 'unknown')}: {e}")
             export_stats['failed_exports'] += 1
+            if 'dowlknum' in lake_data:
+                failed_dowlknums.add(lake_data['dowlknum'])
+    
+    export_stats['failed_dowlknums'] = sorted(failed_dowlknums)
     
     # Log final statistics
     logger.info(f"Export completed:")
@@ -257,15 +449,99 @@ def export_all_lakes(
     logger.info(f"  Metadata: {export_stats['metadata_exported']}")
     logger.info(f"  Raster: {export_stats['raster_exported']}")
     logger.info(f"  Contours: {export_stats['contours_exported']}")
+    logger.info(f"  LOD files: {export_stats['lods_exported']}")
+    logger.info(f"  Depth bands: {export_stats['depth_bands_exported']}")
     logger.info(f"  Fish surveys: {export_stats['fish_surveys_fetched']}")
     logger.info(f"  Failed: {export_stats['failed_exports']}")
     
     return export_stats
 
 
+def _project_lake_geometries(merged_lakes: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Reproject the merged geometries of all lakes to WGS84 in one call.
+    
+    Args:
+        merged_lakes: List of merged lake data dictionaries
+        
+    Returns:
+        Array of WGS84 geometries in the order of merged_lakes
+    """
+    geometries = [lake_data.get('geometry') for lake_data in merged_lakes]
+    return transform_geometries(geometries, CRS_EPSG, WEB_CRS_EPSG)
+
+
+def _project_lake_contours(merged_lakes: List[Dict[str, Any]]) -> List[Optional[np.ndarray]]:
+    """
+    Reproject the original contours of all lakes to WGS84 in one call.
+    
+    Lakes whose contours carry a CRS other than the processing CRS are left as
+    None so export_lake_contours_geojson reprojects them itself.
+    
+    Args:
+        merged_lakes: List of merged lake data dictionaries
+        
+    Returns:
+        List with an array of WGS84 contour geometries (or None) per lake
+    """
+    contour_geometries = []
+    lake_positions = []
+    for i, lake_data in enumerate(merged_lakes):
+        lake_contours = get_original_contour_geometries(lake_data)
+        if lake_contours is None or len(lake_contours) == 0:
+            continue
+        contours_crs = lake_data['contour_source'].crs
+        if contours_crs is not None and not is_same_crs(contours_crs, CRS_EPSG):
+            continue
+        contour_geometries.append(lake_contours)
+        lake_positions.append(i)
+    
+    web_contours: List[Optional[np.ndarray]] = [None] * len(merged_lakes)
+    if not contour_geometries:
+        return web_contours
+    
+    projected = transform_geometries(np.concatenate(contour_geometries), CRS_EPSG, WEB_CRS_EPSG)
+    splits = np.cumsum([len(geometries) for geometries in contour_geometries])[:-1]
+    for i, lake_contours in zip(lake_positions, np.split(projected, splits)):
+        web_contours[i] = lake_contours
+    
+    return web_contours
+
+
+def _project_lake_lods(merged_lakes: List[Dict[str, Any]]) -> List[List[Any]]:
+    """
+    Reproject the LOD geometries of all lakes to WGS84 in one call.
+    
+    Args:
+        merged_lakes: List of merged lake data dictionaries
+        
+    Returns:
+        List with the WGS84 LOD geometries (in the order of 'lods') per lake
+    """
+    lod_geometries = [lod['geometry'] for lake_data in merged_lakes for lod in lake_data.get('lods', [])]
+    projected = iter(transform_geometries(lod_geometries, CRS_EPSG, WEB_CRS_EPSG) if lod_geometries else [])
+    return [[next(projected) for _ in lake_data.get('lods', [])] for lake_data in merged_lakes]
+
+
+def _project_lake_depth_bands(merged_lakes: List[Dict[str, Any]]) -> List[List[Any]]:
+    """
+    Reproject the depth-band geometries of all lakes to WGS84 in one call.
+    
+    Args:
+        merged_lakes: List of merged lake data dictionaries
+        
+    Returns:
+        List with the WGS84 band geometries (in the order of 'depth_bands') per lake
+    """
+    band_geometries = [band['geometry'] for lake_data in merged_lakes for band in lake_data.get('depth_bands', [])]
+    projected = iter(transform_geometries(band_geometries, CRS_EPSG, WEB_CRS_EPSG) if band_geometries else [])
+    return [[next(projected) for _ in lake_data.get('depth_bands', [])] for lake_data in merged_lakes]
+
+
 def export_merged_geodataframe(
     merged_gdf: gpd.GeoDataFrame,
-    output_path: Optional[Path] = None
+    output_path: Optional[Path] = None,
+    removed_dowlknums: Optional[Iterable[str]] = None
 ) -> Path:
     """
     Export the complete merged GeoDataFrame to a single file.
@@ -273,7 +549,9 @@ def export_merged_geodataframe(
     Args:
         merged_gdf: GeoDataFrame containing all merged lakes
         output_path: Optional output path (defaults to output/merged_lakes.geojson)
-        
+        removed_dowlknums: If given, the existing file is patched instead of
+            rewritten (see _patch_lake_rows)
+            
     Returns:
         Path to the exported file
     """
@@ -285,13 +563,50 @@ def export_merged_geodataframe(
     logger.info(f"Exporting merged GeoDataFrame to {output_path}")
     
     # Reproject to WGS84 for web maps and export to GeoJSON
-    merged_wgs84 = merged_gdf.to_crs(epsg=4326)
+    merged_wgs84 = to_crs(merged_gdf, WEB_CRS_EPSG)
+    if removed_dowlknums is not None and output_path.exists():
+        merged_wgs84 = _patch_lake_rows(
+            gpd.read_file(output_path), merged_wgs84, 'dowlknum', removed_dowlknums
+        )
     merged_wgs84.to_file(output_path, driver="GeoJSON")
     
-    logger.info(f"Successfully exported {len(merged_gdf)} lakes to {output_path}")
+    logger.info(f"Successfully exported {len(merged_wgs84)} lakes to {output_path}")
     return output_path
 
 
+def _patch_lake_rows(
+    previous: pd.DataFrame,
+    current: pd.DataFrame,
+    dowlknum_column: str,
+    removed_dowlknums: Iterable[str]
+) -> pd.DataFrame:
+    """
+    Update an aggregate table of a previous run with the lakes exported by a --changed-only run.
+    
+    Rows of the exported lakes replace their previous rows, rows of removed lakes
+    are dropped, and every other lake keeps its previous row.
+    
+    Args:
+        previous: Table read back from the previous run's output
+        current: Rows of the lakes exported by this run
+        dowlknum_column: Column holding the lake DOWLKNUM
+        removed_dowlknums: DOWLKNUMs of lakes that are no longer matched
+        
+    Returns:
+        Patched table
+    """
+    replaced = set(removed_dowlknums)
+    if len(current) > 0:
+        replaced |= set(current[dowlknum_column].astype(str))
+    kept = previous[~previous[dowlknum_column].astype(str).isin(replaced)]
+    
+    if len(kept) == 0:
+        return current
+    if len(current) == 0:
+        return kept.reset_index(drop=True)
+    return pd.concat([kept, current], ignore_index=True)
+
+
 def export_summary_report(
     merged_lakes: List[Dict[str, Any]],
     matching_stats: Dict[str, Any],
@@ -374,9 +689,36 @@ def export_summary_report(
     return output_path
 
 
+def export_lake_validation_table(
+    lake_table: pd.DataFrame,
+    output_path: Optional[Path] = None
+) -> Path:
+    """
+    Export the per-lake validation table from validate_matching_data as Parquet.
+    
+    Args:
+        lake_table: DataFrame with one row per matching lake
+        output_path: Optional output path (defaults to output/lake_validation.parquet,
+            next to the summary report)
+            
+    Returns:
+        Path to the exported table
+    """
+    ensure_directories()
+    
+    if output_path is None:
+        output_path = Path("output") / "lake_validation.parquet"
+    
+    lake_table.to_parquet(output_path, index=False)
+    
+    logger.info(f"Successfully exported validation table for {len(lake_table)} lakes to {output_path}")
+    return output_path
+
+
 def create_lake_index(
     merged_lakes: List[Dict[str, Any]],
-    output_path: Optional[Path] = None
+    output_path: Optional[Path] = None,
+    removed_dowlknums: Optional[Iterable[str]] = None
 ) -> Path:
     """
     Create a simple index file listing all processed lakes.
@@ -384,7 +726,9 @@ def create_lake_index(
     Args:
         merged_lakes: List of merged lake data dictionaries
         output_path: Optional output path (defaults to output/lake_index.csv)
-        
+        removed_dowlknums: If given, the existing index is patched instead of
+            rewritten (see _patch_lake_rows)
+            
     Returns:
         Path to the exported index file
     """
@@ -408,11 +752,20 @@ def create_lake_index(
             'max_depth': lake_data.get('depth_range', {}).get('max', 0.0),
             'geojson_file': format_lake_filename(lake_data['dowlknum'], "geojson"),
             'metadata_file': format_lake_filename(lake_data['dowlknum'], "json"),
-            'contours_file': f"contours_{lake_data['dowlknum']}.geojson"
+            'contours_file': f"contours_{lake_data['dowlknum']}.geojson",
+            **{
+                f"lod{lod['level']}_{field}": lod.get(field)
+                for lod in lake_data.get('lods', [])
+                for field in ('vertex_count', 'bytes')
+            }
         })
     
     # Create DataFrame and export
     index_df = pd.DataFrame(index_data)
+    if removed_dowlknums is not None and output_path.exists():
+        index_df = _patch_lake_rows(
+            pd.read_csv(output_path, dtype={'dowlknum': str}), index_df, 'dowlknum', removed_dowlknums
+        )
     index_df = index_df.sort_values('acres', ascending=False)
     index_df.to_csv(output_path, index=False)
     
@@ -422,7 +775,8 @@ def create_lake_index(
 
 def create_lake_index_json(
     merged_lakes: List[Dict[str, Any]],
-    output_path: Optional[Path] = None
+    output_path: Optional[Path] = None,
+    removed_dowlknums: Optional[Iterable[str]] = None
 ) -> Path:
     """
     Create a JSON index listing all processed lakes for frontend consumption.
@@ -430,7 +784,10 @@ def create_lake_index_json(
     Args:
         merged_lakes: List of merged lake data dictionaries
         output_path: Optional output path (defaults to output/lake_index.json)
-        
+        removed_dowlknums: If given, the existing index is patched instead of
+            rewritten: records of the exported lakes are replaced, records of
+            these removed lakes dropped, and all other lakes kept
+            
     Returns:
         Path to the exported JSON file
     """
@@ -453,9 +810,22 @@ def create_lake_index_json(
             'max_depth': lake_data.get('depth_range', {}).get('max', 0.0),
             'geojson_file': format_lake_filename(lake_data['dowlknum'], "geojson"),
             'metadata_file': format_lake_filename(lake_data['dowlknum'], "json"),
-            'contours_file': f"contours_{lake_data['dowlknum']}.geojson"
+            'contours_file': f"contours_{lake_data['dowlknum']}.geojson",
+            'basin_dowlknums': lake_data.get('basin_dowlknums', [lake_data['dowlknum']]),
+            'lods': [
+                {key: lod.get(key) for key in ('level', 'tolerance', 'file', 'vertex_count', 'bytes')}
+                for lod in lake_data.get('lods', [])
+            ]
         })
     
+    if removed_dowlknums is not None and output_path.exists():
+        replaced = {record['dowlknum'] for record in index_records} | set(removed_dowlknums)
+        with open(output_path, 'r') as f:
+            previous_records = json.load(f)
+        index_records = [
+            record for record in previous_records if record['dowlknum'] not in replaced
+        ] + index_records
+    
     # Sort by acres descending
     index_records.sort(key=lambda r: r.get('acres', 0.0), reverse=True)
     
@@ -463,4 +833,99 @@ def create_lake_index_json(
         json.dump(index_records, f, indent=2)
     
     logger.info(f"Successfully created JSON lake index with {len(index_records)} lakes")
-    return output_path
\ No newline at end of file
+    return output_path
+
+
+def export_basin_mapping(
+    merged_lakes: List[Dict[str, Any]],
+    output_path: Optional[Path] = None,
+    removed_dowlknums: Optional[Iterable[str]] = None
+) -> Path:
+    """
+    Export the mapping of basin DOWLKNUMs to the lake they were merged into.
+    
+    Lakes that were not grouped by parent lake map to themselves.
+    
+    Args:
+        merged_lakes: List of merged lake data dictionaries
+        output_path: Optional output path (defaults to output/basin_mapping.csv)
+        removed_dowlknums: If given, the existing mapping is patched instead of
+            rewritten (see _patch_lake_rows)
+            
+    Returns:
+        Path to the exported mapping file
+    """
+    ensure_directories()
+    
+    if output_path is None:
+        output_path = Path("output") / "basin_mapping.csv"
+    
+    mapping_data = [
+        {'basin_dowlknum': basin, 'lake_dowlknum': lake_data['dowlknum']}
+        for lake_data in merged_lakes
+        for basin in lake_data.get('basin_dowlknums', [lake_data['dowlknum']])
+    ]
+    mapping_df = pd.DataFrame(mapping_data, columns=['basin_dowlknum', 'lake_dowlknum'])
+    if removed_dowlknums is not None and output_path.exists():
+        mapping_df = _patch_lake_rows(
+            pd.read_csv(output_path, dtype=str), mapping_df, 'lake_dowlknum', removed_dowlknums
+        )
+    mapping_df.sort_values('basin_dowlknum').to_csv(output_path, index=False)
+    
+    logger.info(f"Successfully exported basin mapping with {len(mapping_df)} basins to {output_path}")
+    return output_path
+
+
+def export_match_diff(
+    match_diff: Dict[str, List[str]],
+    output_path: Optional[Path] = None
+) -> Path:
+    """
+    Export the match table diff against the previous run.
+    
+    Args:
+        match_diff: Diff from match_table.diff_match_tables
+        output_path: Optional output path (defaults to output/match_diff.json)
+        
+    Returns:
+        Path to the exported diff file
+    """
+    ensure_directories()
+    
+    if output_path is None:
+        output_path = Path("output") / "match_diff.json"
+    
+    with open(output_path, 'w') as f:
+        json.dump(match_diff, f, indent=2)
+    
+    logger.info(f"Successfully exported match diff to {output_path}")
+    return output_path
+
+
+def remove_lake_outputs(dowlknums: List[str]) -> int:
+    """
+    Delete the per-lake GeoJSON, metadata, contour, LOD and depth-band files of lakes.
+    
+    Args:
+        dowlknums: DOWLKNUMs of lakes that are no longer matched
+        
+    Returns:
+        Number of files deleted
+    """
+    removed_files = 0
+    
+    for dowlknum in dowlknums:
+        lake_files = [
+            GEOJSON_DIR / format_lake_filename(dowlknum, "geojson"),
+            METADATA_DIR / format_lake_filename(dowlknum, "json"),
+            CONTOURS_DIR / f"contours_{dowlknum}.geojson",
+            DEPTH_BANDS_DIR / depth_bands_filename(dowlknum),
+            *LOD_DIR.glob(lod_filename(dowlknum, '*'))
+        ]
+        for lake_file in lake_files:
+            if lake_file.exists():
+                lake_file.unlink()
+                removed_files += 1
+    
+    logger.info(f"Removed {removed_files} output files of {len(dowlknums)} lakes")
+    return removed_files
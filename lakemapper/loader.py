@@ -1,45 +1,539 @@
 """
 Data loader module for LakeMapper.
 
-This module handles loading and basic validation of the Minnesota DNR shapefiles.
+This module handles loading and basic validation of the Minnesota DNR shapefiles
+(or their GeoParquet, FlatGeobuf or GeoPackage conversions).
 """
 
+import functools
+import json
 import logging
+import operator
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Set, Tuple, Optional
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import pyogrio
+import shapely
+from pyogrio.raw import open_arrow
+from pyproj import CRS
 
 from .config import (
-    BATHYMETRY_FILE, FISH_SURVEY_FILE, CRS_EPSG,
+    BATHYMETRY_FILE, FISH_SURVEY_FILE, INPUT_FORMAT_SUFFIXES, CRS_EPSG,
     BATHYMETRY_FIELDS, FISH_SURVEY_FIELDS,
-    MIN_LAKE_AREA_ACRES, MAX_LAKE_AREA_ACRES
+    BATHYMETRY_OPTIONAL_FIELDS, FISH_SURVEY_OPTIONAL_FIELDS,
+    BATHYMETRY_COMPACT_DTYPES, FISH_SURVEY_COMPACT_DTYPES,
+    MIN_LAKE_AREA_ACRES, MAX_LAKE_AREA_ACRES,
+    DOWLKNUM_KEY_FIELD, DOWLKNUM_INT_FIELD, DOWLKNUM_VALID_FIELD,
+    STREAM_BATCH_SIZE
 )
-from .utils import validate_dowlknum
+from .projection import get_transformer, to_crs
+from .snapshot import compute_snapshot_key, load_snapshot, save_snapshot
+from .utils import add_dowlknum_key, normalize_dowlknums
 
 
 logger = logging.getLogger(__name__)
 
 
-def load_bathymetry_data() -> gpd.GeoDataFrame:
+def _bathymetry_settings(all_columns: bool, compact: bool) -> Dict[str, Any]:
+    """Get the loader settings that affect the loaded bathymetry data."""
+    return {
+        'dataset': 'bathymetry',
+        'fields': BATHYMETRY_FIELDS,
+        'columns': _read_columns(BATHYMETRY_FIELDS, BATHYMETRY_OPTIONAL_FIELDS, all_columns),
+        'compact_dtypes': BATHYMETRY_COMPACT_DTYPES if compact else None,
+        'crs_epsg': CRS_EPSG
+    }
+
+
+def _fish_survey_settings(all_columns: bool, compact: bool) -> Dict[str, Any]:
+    """Get the loader settings that affect the loaded fish survey data."""
+    return {
+        'dataset': 'fish_survey',
+        'fields': FISH_SURVEY_FIELDS,
+        'columns': _read_columns(FISH_SURVEY_FIELDS, FISH_SURVEY_OPTIONAL_FIELDS, all_columns),
+        'compact_dtypes': FISH_SURVEY_COMPACT_DTYPES if compact else None,
+        'crs_epsg': CRS_EPSG,
+        'min_lake_area_acres': MIN_LAKE_AREA_ACRES,
+        'max_lake_area_acres': MAX_LAKE_AREA_ACRES
+    }
+
+
+def _read_columns(
+    fields: Dict[str, str],
+    optional_fields: List[str],
+    all_columns: bool
+) -> Optional[List[str]]:
+    """
+    Get the attribute columns to read from a source file.
+    
+    Args:
+        fields: Field mapping of required columns
+        optional_fields: Columns to read when present in the source file
+        all_columns: Whether to read every attribute column
+        
+    Returns:
+        List of column names, or None to read all columns
+    """
+    if all_columns:
+        return None
+    return list(fields.values()) + [field for field in optional_fields if field not in fields.values()]
+
+
+def resolve_input_file(source_file: Path) -> Path:
+    """
+    Find the fastest available format of an input dataset.
+    
+    Looks for files with the same name and one of INPUT_FORMAT_SUFFIXES next to
+    the configured file, in order of preference. Converted copies older than the
+    configured file are ignored so an updated shapefile is never shadowed by a
+    stale conversion.
+    
+    Args:
+        source_file: Configured path of the input dataset
+        
+    Returns:
+        Path of the file to read (the configured path if no alternative exists)
+    """
+    candidates = [source_file.with_suffix(suffix) for suffix in INPUT_FORMAT_SUFFIXES]
+    if source_file not in candidates:
+        candidates.append(source_file)
+    
+    source_mtime = source_file.stat().st_mtime_ns if source_file.exists() else None
+    for candidate in candidates:
+        if not candidate.exists():
+            continue
+        if candidate != source_file and source_mtime is not None and candidate.stat().st_mtime_ns < source_mtime:
+            logger.warning(
+                f"Ignoring {candidate.name}: older than {source_file.name} "
+                f"(rerun scripts/convert_inputs.py)"
+            )
+            continue
+        return candidate
+    
+    return source_file
+
+
+def _is_geoparquet(path: Path) -> bool:
+    """Check whether a source file is GeoParquet (read with pyarrow instead of GDAL)."""
+    return path.suffix.lower() in ('.parquet', '.geoparquet')
+
+
+def _geoparquet_metadata(schema) -> Tuple[str, Any, Dict[str, Any]]:
+    """
+    Get the primary geometry column of a GeoParquet schema.
+    
+    Args:
+        schema: Arrow schema of the GeoParquet file
+        
+    Returns:
+        Tuple of (geometry column name, CRS, geometry column metadata)
+        
+    Raises:
+        ValueError: If the file has no GeoParquet metadata
+    """
+    if not schema.metadata or b'geo' not in schema.metadata:
+        raise ValueError("Parquet file has no GeoParquet 'geo' metadata")
+    
+    geo_metadata = json.loads(schema.metadata[b'geo'])
+    geometry_name = geo_metadata['primary_column']
+    column_metadata = geo_metadata['columns'][geometry_name]
+    # GeoParquet files without a CRS are defined to be in OGC:CRS84
+    crs = column_metadata.get('crs', 'OGC:CRS84')
+    if isinstance(crs, dict):
+        crs = CRS.from_json_dict(crs)
+    return geometry_name, crs, column_metadata
+
+
+def _source_crs(path: Path) -> Optional[Any]:
+    """Get the CRS of a source file without reading its features."""
+    if _is_geoparquet(path):
+        return _geoparquet_metadata(pq.read_schema(path))[1]
+    return pyogrio.read_info(path).get('crs')
+
+
+def _read_source(
+    path: Path,
+    columns: Optional[List[str]],
+    read_filters: Optional[Dict[str, Any]] = None
+) -> gpd.GeoDataFrame:
+    """
+    Read a source file through pyogrio's Arrow path (or pyarrow for GeoParquet).
+    
+    Args:
+        path: Path to the source file
+        columns: Attribute columns to read, or None for all columns
+        read_filters: Optional where-clause/bbox filters from _build_read_filters
+        
+    Returns:
+        GeoDataFrame with the requested columns plus geometry
+    """
+    if _is_geoparquet(path):
+        return _read_geoparquet(path, columns, read_filters)
+    
+    # Columns missing from the file are skipped by pyogrio, so the required
+    # field validation below still reports them. FlatGeobuf and GeoPackage
+    # answer bbox filters from their spatial index.
+    return gpd.read_file(
+        path,
+        columns=columns,
+        engine="pyogrio",
+        use_arrow=True,
+        **(read_filters or {})
+    )
+
+
+def _read_geoparquet(
+    path: Path,
+    columns: Optional[List[str]],
+    read_filters: Optional[Dict[str, Any]] = None
+) -> gpd.GeoDataFrame:
+    """
+    Read a GeoParquet source file with pyarrow.
+    
+    Attribute filters are pushed down to the row group statistics. Bounding boxes
+    use the file's bbox covering column when present (as written by
+    scripts/convert_inputs.py) and are then refined to features that intersect the
+    box, matching the result of a GDAL spatial filter.
+    
+    Args:
+        path: Path to the GeoParquet file
+        columns: Attribute columns to read, or None for all columns
+        read_filters: Optional filter expression/bbox filters from _build_read_filters
+        
+    Returns:
+        GeoDataFrame with the requested columns plus geometry
+    """
+    read_filters = read_filters or {}
+    schema = pq.read_schema(path)
+    geometry_name, _, column_metadata = _geoparquet_metadata(schema)
+    
+    if columns is not None:
+        # Skip missing columns like pyogrio does, so field validation reports them
+        columns = [column for column in columns if column in schema.names] + [geometry_name]
+    
+    bbox = read_filters.get('bbox')
+    gdf = gpd.read_parquet(
+        path,
+        columns=columns,
+        filters=read_filters.get('filters'),
+        bbox=bbox if 'covering' in column_metadata else None
+    )
+    
+    if bbox is not None:
+        gdf = gdf[gdf.intersects(shapely.box(*bbox))].reset_index(drop=True)
+    
+    return gdf
+
+
+def _subset_keys(
+    dowlknums: Optional[Sequence[str]] = None,
+    counties: Optional[Sequence[str]] = None
+) -> Tuple[List[str], List[str]]:
+    """
+    Validate and normalize the DOWLKNUM and county subset filters.
+    
+    Args:
+        dowlknums: Optional DOWLKNUMs to load
+        counties: Optional county codes to load
+        
+    Returns:
+        Tuple of (canonical DOWLKNUM keys, zero-padded 2-digit county codes)
+        
+    Raises:
+        ValueError: If a DOWLKNUM or county code is invalid
+    """
+    keys = []
+    if dowlknums:
+        normalized = normalize_dowlknums(pd.Series(list(dowlknums), dtype=object))
+        invalid = normalized.index[~normalized[DOWLKNUM_VALID_FIELD]]
+        if len(invalid) > 0:
+            raise ValueError(f"Invalid DOWLKNUMs in subset filter: {[dowlknums[i] for i in invalid]}")
+        keys = list(normalized[DOWLKNUM_KEY_FIELD].unique())
+    
+    county_codes = set()
+    for county in counties or []:
+        county = str(county).strip()
+        if not county.isdigit() or len(county) > 2:
+            raise ValueError(f"Invalid county code in subset filter: {county}")
+        county_codes.add(county.zfill(2))
+    
+    return keys, sorted(county_codes)
+
+
+def _is_numeric_field(path: Path, field: str) -> bool:
+    """Check whether a source file stores a field as a number rather than text."""
+    if _is_geoparquet(path):
+        schema = pq.read_schema(path)
+        if field not in schema.names:
+            return False
+        field_type = schema.field(field).type
+        return pa.types.is_integer(field_type) or pa.types.is_floating(field_type)
+    
+    info = pyogrio.read_info(path)
+    field_dtypes = dict(zip(info['fields'], info['dtypes']))
+    return field in field_dtypes and np.dtype(field_dtypes[field]).kind in 'iuf'
+
+
+def _build_read_filters(
+    path: Path,
+    dowlknum_field: str,
+    dowlknums: Optional[Sequence[str]] = None,
+    counties: Optional[Sequence[str]] = None,
+    bbox: Optional[Tuple[float, float, float, float]] = None
+) -> Dict[str, Any]:
+    """
+    Build the filters that restrict a source file read to a subset of lakes.
+    
+    DOWLKNUM and county filters become a SQL where-clause (or a pyarrow filter
+    expression for GeoParquet) on the raw DOWLKNUM field (the first two digits of a
+    DOWLKNUM are the county code) and the bounding box is transformed to the source
+    file's CRS, so both are applied during the read.
+    
+    Raw DOWLKNUMs are not canonical (numeric fields, 7-digit values that lost their
+    leading zero, whitespace or a ".0" suffix), so the pushed-down DOWLKNUM and
+    county predicates only select a superset of the subset; _filter_subset applies
+    the exact filter on the canonical keys after the read.
+    
+    Args:
+        path: Path to the source file
+        dowlknum_field: Name of the raw DOWLKNUM field in the source file
+        dowlknums: Optional DOWLKNUMs to load
+        counties: Optional county codes to load
+        bbox: Optional (minx, miny, maxx, maxy) bounding box in EPSG:26915
+        
+    Returns:
+        Keyword arguments for _read_source (empty when no filter is given)
+        
+    Raises:
+        ValueError: If a DOWLKNUM, county code or bounding box is invalid
+    """
+    read_filters: Dict[str, Any] = {}
+    keys, county_codes = _subset_keys(dowlknums, counties)
+    
+    if keys or county_codes:
+        if _is_numeric_field(path, dowlknum_field):
+            conditions, expressions = _numeric_subset_predicates(dowlknum_field, keys, county_codes)
+        else:
+            conditions, expressions = _text_subset_predicates(dowlknum_field, keys, county_codes)
+        
+        # DOWLKNUM and county filters are alternatives: a lake matching any is loaded.
+        # GeoParquet is read with pyarrow, which takes a filter expression instead of SQL.
+        if _is_geoparquet(path):
+            read_filters['filters'] = functools.reduce(operator.or_, expressions)
+        else:
+            read_filters['where'] = " OR ".join(conditions)
+    
+    if bbox is not None:
+        if len(bbox) != 4 or bbox[0] > bbox[2] or bbox[1] > bbox[3]:
+            raise ValueError(f"Invalid bounding box (expected minx, miny, maxx, maxy): {bbox}")
+        
+        source_crs = _source_crs(path)
+        if source_crs and CRS.from_user_input(source_crs).to_epsg() != CRS_EPSG:
+            transformer = get_transformer(CRS_EPSG, source_crs)
+            bbox = transformer.transform_bounds(*bbox)
+        read_filters['bbox'] = tuple(bbox)
+    
+    if read_filters:
+        logger.info(f"Applying subset filter to {path.name}: {read_filters}")
+    
+    return read_filters
+
+
+def _numeric_subset_predicates(
+    field: str,
+    keys: List[str],
+    county_codes: List[str]
+) -> Tuple[List[str], List[Any]]:
+    """
+    Build the subset predicates for a DOWLKNUM field stored as a number.
+    
+    Numbers carry no leading zeros, padding or suffixes, so DOWLKNUMs are compared
+    by value and counties become a range of values.
+    
+    Args:
+        field: Name of the raw DOWLKNUM field
+        keys: Canonical DOWLKNUM keys
+        county_codes: Zero-padded 2-digit county codes
+        
+    Returns:
+        Tuple of (SQL conditions, pyarrow filter expressions)
+    """
+    conditions = []
+    expressions = []
+    
+    if keys:
+        values = [int(key) for key in keys]
+        conditions.append(f'"{field}" IN ({", ".join(str(value) for value in values)})')
+        expressions.append(pc.field(field).isin(values))
+    
+    for code in county_codes:
+        low, high = int(code) * 1000000, (int(code) + 1) * 1000000
+        conditions.append(f'("{field}" >= {low} AND "{field}" < {high})')
+        expressions.append((pc.field(field) >= low) & (pc.field(field) < high))
+    
+    return conditions, expressions
+
+
+def _text_subset_predicates(
+    field: str,
+    keys: List[str],
+    county_codes: List[str]
+) -> Tuple[List[str], List[Any]]:
+    """
+    Build superset subset predicates for a DOWLKNUM field stored as text.
+    
+    A DOWLKNUM is matched by the part of its key every raw variant contains (the
+    last 7 digits when the key starts with a zero, since 7-digit values lost it).
+    A county is matched by its code as a prefix, by its second digit as a prefix
+    for codes starting with a zero, and by any value with leading whitespace.
+    
+    Args:
+        field: Name of the raw DOWLKNUM field
+        keys: Canonical DOWLKNUM keys
+        county_codes: Zero-padded 2-digit county codes
+        
+    Returns:
+        Tuple of (SQL conditions, pyarrow filter expressions)
+    """
+    conditions = []
+    expressions = []
+    
+    for key in keys:
+        core = key[1:] if key.startswith('0') else key
+        conditions.append(f'"{field}" LIKE \'%{core}%\'')
+        expressions.append(pc.match_substring(pc.field(field), core))
+    
+    prefixes = set()
+    for code in county_codes:
+        prefixes.add(code)
+        if code.startswith('0'):
+            prefixes.add(code[1:])
+    if prefixes:
+        prefixes.add(' ')
+    
+    for prefix in sorted(prefixes):
+        conditions.append(f'"{field}" LIKE \'{prefix}%\'')
+        expressions.append(pc.starts_with(pc.field(field), pattern=prefix))
+    
+    return conditions, expressions
+
+
+def _filter_subset(
+    gdf: gpd.GeoDataFrame,
+    dowlknums: Optional[Sequence[str]] = None,
+    counties: Optional[Sequence[str]] = None
+) -> gpd.GeoDataFrame:
+    """
+    Apply the exact DOWLKNUM and county subset filter on the canonical keys.
+    
+    Args:
+        gdf: GeoDataFrame read with the superset filters from _build_read_filters,
+            with the canonical key columns added
+        dowlknums: Optional DOWLKNUMs to load
+        counties: Optional county codes to load
+        
+    Returns:
+        GeoDataFrame restricted to the subset (unchanged when no filter is given)
+    """
+    keys, county_codes = _subset_keys(dowlknums, counties)
+    if not keys and not county_codes:
+        return gdf
+    
+    gdf_keys = gdf[DOWLKNUM_KEY_FIELD].astype('string')
+    mask = gdf_keys.isin(keys) | gdf_keys.str[:2].isin(county_codes)
+    return gdf[mask.fillna(False).to_numpy(dtype=bool)]
+
+
+def load_bathymetry_data(
+    use_snapshot: bool = True,
+    all_columns: bool = False,
+    compact: bool = False,
+    dowlknums: Optional[Sequence[str]] = None,
+    counties: Optional[Sequence[str]] = None,
+    bbox: Optional[Tuple[float, float, float, float]] = None
+) -> gpd.GeoDataFrame:
     """
     Load and validate bathymetry contours shapefile.
     
+    Args:
+        use_snapshot: Whether to load from (and save to) the GeoParquet snapshot cache
+        all_columns: Whether to read every attribute column instead of only the
+            configured fields
+        compact: Whether to convert attributes to memory-compact dtypes
+        dowlknums: Optional DOWLKNUMs to load instead of the whole state
+        counties: Optional county codes (first two DOWLKNUM digits) to load
+        bbox: Optional (minx, miny, maxx, maxy) bounding box in EPSG:26915
+        
     Returns:
         GeoDataFrame containing bathymetry contour data
         
     Raises:
         FileNotFoundError: If bathymetry file doesn't exist
-        ValueError: If required fields are missing or data is invalid
+        ValueError: If required fields are missing, data is invalid or a subset
+            filter is invalid
     """
-    logger.info(f"Loading bathymetry data from {BATHYMETRY_FILE}")
+    source_file = resolve_input_file(BATHYMETRY_FILE)
+    logger.info(f"Loading bathymetry data from {source_file}")
     
-    if not BATHYMETRY_FILE.exists():
-        raise FileNotFoundError(f"Bathymetry file not found: {BATHYMETRY_FILE}")
+    if not source_file.exists():
+        raise FileNotFoundError(f"Bathymetry file not found: {source_file}")
     
-    # Load the shapefile
-    gdf = gpd.read_file(BATHYMETRY_FILE)
+    read_filters = _build_read_filters(
+        source_file, BATHYMETRY_FIELDS['dowlknum'], dowlknums, counties, bbox
+    )
+    if read_filters:
+        # Subset loads only read part of the source, so they bypass the snapshot cache
+        use_snapshot = False
+    
+    if use_snapshot:
+        snapshot_key = compute_snapshot_key(source_file, _bathymetry_settings(all_columns, compact))
+        gdf = load_snapshot('bathymetry', snapshot_key)
+        if gdf is not None:
+            logger.info(f"Bathymetry memory usage: {_memory_usage(gdf).sum() / 1e6:.1f} MB")
+            return gdf
+    
+    gdf = _read_bathymetry_data(source_file, all_columns, read_filters)
+    gdf = _filter_subset(gdf, dowlknums, counties)
+    
+    if compact:
+        gdf = compact_dtypes(gdf, BATHYMETRY_COMPACT_DTYPES, 'bathymetry')
+    
+    if use_snapshot:
+        save_snapshot('bathymetry', snapshot_key, gdf)
+    
+    return gdf
+
+
+def _read_bathymetry_data(
+    source_file: Path,
+    all_columns: bool = False,
+    read_filters: Optional[Dict[str, Any]] = None
+) -> gpd.GeoDataFrame:
+    """
+    Read, validate and reproject the bathymetry contours source file.
+    
+    Args:
+        source_file: Path to the source file (any supported input format)
+        all_columns: Whether to read every attribute column
+        read_filters: Optional where-clause/bbox filters from _build_read_filters
+        
+    Returns:
+        GeoDataFrame containing bathymetry contour data
+        
+    Raises:
+        ValueError: If required fields are missing or data is invalid
+    """
+    # Load the source file, projected to the configured columns unless all_columns is set
+    columns = _read_columns(BATHYMETRY_FIELDS, BATHYMETRY_OPTIONAL_FIELDS, all_columns)
+    gdf = _read_source(source_file, columns, read_filters)
     
     # Log basic info
     logger.info(f"Loaded {len(gdf)} bathymetry contours")
@@ -52,16 +546,14 @@ def load_bathymetry_data() -> gpd.GeoDataFrame:
     if missing_fields:
         raise ValueError(f"Missing required fields in bathymetry data: {missing_fields}")
     
-    # Validate DOWLKNUM format
-    invalid_dowlknums = []
-    for idx, dowlknum in enumerate(gdf[BATHYMETRY_FIELDS['dowlknum']]):
-        if not validate_dowlknum(str(dowlknum)):
-            invalid_dowlknums.append((idx, dowlknum))
+    # Validate DOWLKNUM format and add the canonical key columns
+    gdf = add_dowlknum_key(gdf, BATHYMETRY_FIELDS['dowlknum'])
+    invalid_positions = np.flatnonzero(~gdf[DOWLKNUM_VALID_FIELD].to_numpy())
     
-    if invalid_dowlknums:
-        logger.warning(f"Found {len(invalid_dowlknums)} invalid DOWLKNUMs in bathymetry data")
-        for idx, dowlknum in invalid_dowlknums[:5]:  # Log first 5
-            logger.warning(f"  Row {idx}: {dowlknum}")
+    if len(invalid_positions) > 0:
+        logger.warning(f"Found {len(invalid_positions)} invalid DOWLKNUMs in bathymetry data")
+        for idx in invalid_positions[:5]:  # Log first 5
+            logger.warning(f"  Row {idx}: {gdf[BATHYMETRY_FIELDS['dowlknum']].iloc[idx]}")
     
     # Ensure CRS is set correctly
     if gdf.crs is None:
@@ -69,7 +561,7 @@ def load_bathymetry_data() -> gpd.GeoDataFrame:
         gdf.set_crs(epsg=CRS_EPSG, inplace=True)
     elif gdf.crs.to_epsg() != CRS_EPSG:
         logger.info(f"Reprojecting bathymetry data from {gdf.crs} to EPSG:{CRS_EPSG}")
-        gdf = gdf.to_crs(epsg=CRS_EPSG)
+        gdf = to_crs(gdf, CRS_EPSG)
     
     # Basic data validation
     logger.info(f"Bathymetry data bounds: {gdf.total_bounds}")
@@ -78,24 +570,88 @@ def load_bathymetry_data() -> gpd.GeoDataFrame:
     return gdf
 
 
-def load_fish_survey_data() -> gpd.GeoDataFrame:
+def load_fish_survey_data(
+    use_snapshot: bool = True,
+    all_columns: bool = False,
+    compact: bool = False,
+    dowlknums: Optional[Sequence[str]] = None,
+    counties: Optional[Sequence[str]] = None,
+    bbox: Optional[Tuple[float, float, float, float]] = None
+) -> gpd.GeoDataFrame:
     """
     Load and validate fish survey lake outlines shapefile.
     
+    Args:
+        use_snapshot: Whether to load from (and save to) the GeoParquet snapshot cache
+        all_columns: Whether to read every attribute column instead of only the
+            configured fields
+        compact: Whether to convert attributes to memory-compact dtypes
+        dowlknums: Optional DOWLKNUMs to load instead of the whole state
+        counties: Optional county codes (first two DOWLKNUM digits) to load
+        bbox: Optional (minx, miny, maxx, maxy) bounding box in EPSG:26915
+        
     Returns:
         GeoDataFrame containing fish survey lake data
         
     Raises:
         FileNotFoundError: If fish survey file doesn't exist
-        ValueError: If required fields are missing or data is invalid
+        ValueError: If required fields are missing, data is invalid or a subset
+            filter is invalid
     """
-    logger.info(f"Loading fish survey data from {FISH_SURVEY_FILE}")
+    source_file = resolve_input_file(FISH_SURVEY_FILE)
+    logger.info(f"Loading fish survey data from {source_file}")
+    
+    if not source_file.exists():
+        raise FileNotFoundError(f"Fish survey file not found: {source_file}")
+    
+    read_filters = _build_read_filters(
+        source_file, FISH_SURVEY_FIELDS['dowlknum'], dowlknums, counties, bbox
+    )
+    if read_filters:
+        # Subset loads only read part of the source, so they bypass the snapshot cache
+        use_snapshot = False
+    
+    if use_snapshot:
+        snapshot_key = compute_snapshot_key(source_file, _fish_survey_settings(all_columns, compact))
+        gdf = load_snapshot('fish_survey', snapshot_key)
+        if gdf is not None:
+            logger.info(f"Fish survey memory usage: {_memory_usage(gdf).sum() / 1e6:.1f} MB")
+            return gdf
+    
+    gdf = _read_fish_survey_data(source_file, all_columns, read_filters)
+    gdf = _filter_subset(gdf, dowlknums, counties)
     
-    if not FISH_SURVEY_FILE.exists():
-        raise FileNotFoundError(f"Fish survey file not found: {FISH_SURVEY_FILE}")
+    if compact:
+        gdf = compact_dtypes(gdf, FISH_SURVEY_COMPACT_DTYPES, 'fish_survey')
     
-    # Load the shapefile
-    gdf = gpd.read_file(FISH_SURVEY_FILE)
+    if use_snapshot:
+        save_snapshot('fish_survey', snapshot_key, gdf)
+    
+    return gdf
+
+
+def _read_fish_survey_data(
+    source_file: Path,
+    all_columns: bool = False,
+    read_filters: Optional[Dict[str, Any]] = None
+) -> gpd.GeoDataFrame:
+    """
+    Read, validate, filter and reproject the fish survey lake outlines source file.
+    
+    Args:
+        source_file: Path to the source file (any supported input format)
+        all_columns: Whether to read every attribute column
+        read_filters: Optional where-clause/bbox filters from _build_read_filters
+        
+    Returns:
+        GeoDataFrame containing fish survey lake data
+        
+    Raises:
+        ValueError: If required fields are missing or data is invalid
+    """
+    # Load the source file, projected to the configured columns unless all_columns is set
+    columns = _read_columns(FISH_SURVEY_FIELDS, FISH_SURVEY_OPTIONAL_FIELDS, all_columns)
+    gdf = _read_source(source_file, columns, read_filters)
     
     # Log basic info
     logger.info(f"Loaded {len(gdf)} fish survey lakes")
@@ -108,16 +664,14 @@ def load_fish_survey_data() -> gpd.GeoDataFrame:
     if missing_fields:
         raise ValueError(f"Missing required fields in fish survey data: {missing_fields}")
     
-    # Validate DOWLKNUM format
-    invalid_dowlknums = []
-    for idx, dowlknum in enumerate(gdf[FISH_SURVEY_FIELDS['dowlknum']]):
-        if not validate_dowlknum(str(dowlknum)):
-            invalid_dowlknums.append((idx, dowlknum))
+    # Validate DOWLKNUM format and add the canonical key columns
+    gdf = add_dowlknum_key(gdf, FISH_SURVEY_FIELDS['dowlknum'])
+    invalid_positions = np.flatnonzero(~gdf[DOWLKNUM_VALID_FIELD].to_numpy())
     
-    if invalid_dowlknums:
-        logger.warning(f"Found {len(invalid_dowlknums)} invalid DOWLKNUMs in fish survey data")
-        for idx, dowlknum in invalid_dowlknums[:5]:  # Log first 5
-            logger.warning(f"  Row {idx}: {dowlknum}")
+    if len(invalid_positions) > 0:
+        logger.warning(f"Found {len(invalid_positions)} invalid DOWLKNUMs in fish survey data")
+        for idx in invalid_positions[:5]:  # Log first 5
+            logger.warning(f"  Row {idx}: {gdf[FISH_SURVEY_FIELDS['dowlknum']].iloc[idx]}")
     
     # Filter by lake area
     area_field = FISH_SURVEY_FIELDS['acres']
@@ -138,7 +692,7 @@ def load_fish_survey_data() -> gpd.GeoDataFrame:
         gdf.set_crs(epsg=CRS_EPSG, inplace=True)
     elif gdf.crs.to_epsg() != CRS_EPSG:
         logger.info(f"Reprojecting fish survey data from {gdf.crs} to EPSG:{CRS_EPSG}")
-        gdf = gdf.to_crs(epsg=CRS_EPSG)  # type: ignore
+        gdf = to_crs(gdf, CRS_EPSG)
     
     # Basic data validation
     logger.info(f"Fish survey data bounds: {gdf.total_bounds}")
@@ -147,10 +701,31 @@ def load_fish_survey_data() -> gpd.GeoDataFrame:
     return gdf
 
 
-def load_all_data() -> Tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]:
+def load_all_data(
+    use_snapshot: bool = True,
+    all_columns: bool = False,
+    compact: bool = False,
+    concurrent: bool = True,
+    dowlknums: Optional[Sequence[str]] = None,
+    counties: Optional[Sequence[str]] = None,
+    bbox: Optional[Tuple[float, float, float, float]] = None
+) -> Tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]:
     """
     Load both bathymetry and fish survey datasets.
     
+    The two datasets are independent and GDAL releases the GIL while reading, so
+    by default they are read, validated and reprojected concurrently. Per-dataset
+    timings are logged and stored in each GeoDataFrame's attrs['load_timing'].
+    
+    Args:
+        use_snapshot: Whether to use the GeoParquet snapshot cache
+        all_columns: Whether to read every attribute column (e.g. for inspect_data_sample)
+        compact: Whether to convert attributes to memory-compact dtypes
+        concurrent: Whether to load both datasets at the same time
+        dowlknums: Optional DOWLKNUMs to load instead of the whole state
+        counties: Optional county codes (first two DOWLKNUM digits) to load
+        bbox: Optional (minx, miny, maxx, maxy) bounding box in EPSG:26915
+        
     Returns:
         Tuple of (bathymetry_gdf, fish_survey_gdf)
         
@@ -158,10 +733,69 @@ def load_all_data() -> Tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]:
         FileNotFoundError: If either file doesn't exist
         ValueError: If required fields are missing or data is invalid
     """
-    logger.info("Loading all shapefile data...")
+    mode = "concurrently" if concurrent else "sequentially"
+    logger.info(f"Loading all shapefile data {mode}...")
     
-    bathymetry_gdf = load_bathymetry_data()
-    fish_survey_gdf = load_fish_survey_data()
+    load_options = {
+        'use_snapshot': use_snapshot,
+        'all_columns': all_columns,
+        'compact': compact,
+        'dowlknums': dowlknums,
+        'counties': counties,
+        'bbox': bbox
+    }
+    loaders = {
+        'bathymetry': lambda: load_bathymetry_data(**load_options),
+        'fish_survey': lambda: load_fish_survey_data(**load_options)
+    }
+    
+    start_time = time.perf_counter()
+    results: Dict[str, Any] = {}
+    errors: Dict[str, BaseException] = {}
+    
+    if concurrent:
+        with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+            future_to_name = {
+                executor.submit(_timed_load, loader, start_time): name
+                for name, loader in loaders.items()
+            }
+            for future in as_completed(future_to_name):
+                name = future_to_name[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to load {name} data: {e}")
+                    errors[name] = e
+    else:
+        for name, loader in loaders.items():
+            try:
+                results[name] = _timed_load(loader, start_time)
+            except Exception as e:
+                logger.error(f"Failed to load {name} data: {e}")
+                errors[name] = e
+                break
+    
+    # Re-raise the original exception so callers see the underlying error type
+    for name in loaders:
+        if name in errors:
+            raise errors[name]
+    
+    total_seconds = time.perf_counter() - start_time
+    for name, (gdf, timing) in results.items():
+        gdf.attrs['load_timing'] = timing
+        logger.info(
+            f"Loaded {name} data in {timing['seconds']:.2f}s "
+            f"(started +{timing['started']:.2f}s, finished +{timing['finished']:.2f}s)"
+        )
+    
+    dataset_seconds = sum(timing['seconds'] for _, timing in results.values())
+    logger.info(
+        f"Total load time: {total_seconds:.2f}s "
+        f"(sum of datasets {dataset_seconds:.2f}s, overlap {max(dataset_seconds - total_seconds, 0.0):.2f}s)"
+    )
+    
+    bathymetry_gdf = results['bathymetry'][0]
+    fish_survey_gdf = results['fish_survey'][0]
     
     logger.info("Data loading completed successfully")
     logger.info(f"Bathymetry contours: {len(bathymetry_gdf)}")
@@ -170,10 +804,274 @@ def load_all_data() -> Tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]:
     return bathymetry_gdf, fish_survey_gdf
 
 
+def _timed_load(
+    loader: Callable[[], gpd.GeoDataFrame],
+    start_time: float
+) -> Tuple[gpd.GeoDataFrame, Dict[str, float]]:
+    """
+    Run a dataset loader and record when it started and finished.
+    
+    Args:
+        loader: Function that loads one dataset
+        start_time: perf_counter() value the timings are relative to
+        
+    Returns:
+        Tuple of (gdf, timing) where timing holds 'started', 'finished' and
+        'seconds' values in seconds
+    """
+    started = time.perf_counter() - start_time
+    gdf = loader()
+    finished = time.perf_counter() - start_time
+    return gdf, {'started': started, 'finished': finished, 'seconds': finished - started}
+
+
+def iter_bathymetry_batches(
+    batch_size: Optional[int] = None,
+    source_file: Optional[Path] = None
+) -> Iterator[gpd.GeoDataFrame]:
+    """
+    Stream the bathymetry contours as validated, reprojected record batches.
+    
+    Only one batch is held in memory at a time. Shapefiles and other OGR formats are
+    streamed through pyogrio's Arrow reader, GeoParquet files (such as the lake-sorted
+    bathymetry store) through pyarrow. Each batch gets the canonical DOWLKNUM key
+    columns and is reprojected to EPSG:26915; its index holds the rows' positions
+    in the source file.
+    
+    Args:
+        batch_size: Optional number of contours per batch (defaults to STREAM_BATCH_SIZE)
+        source_file: Optional source file (defaults to the fastest available
+            format of BATHYMETRY_FILE)
+            
+    Yields:
+        GeoDataFrame batches of bathymetry contour data
+        
+    Raises:
+        FileNotFoundError: If the source file doesn't exist
+        ValueError: If required fields are missing
+    """
+    batch_size = batch_size or STREAM_BATCH_SIZE
+    source_file = source_file or resolve_input_file(BATHYMETRY_FILE)
+    
+    if not source_file.exists():
+        raise FileNotFoundError(f"Bathymetry file not found: {source_file}")
+    
+    logger.info(f"Streaming bathymetry data from {source_file} in batches of {batch_size}")
+    
+    columns = _read_columns(BATHYMETRY_FIELDS, BATHYMETRY_OPTIONAL_FIELDS, all_columns=False)
+    row_offset = 0
+    invalid_count = 0
+    
+    for batch, crs in _iter_record_batches(source_file, columns, batch_size):
+        if row_offset == 0:
+            missing_fields = [field for field in BATHYMETRY_FIELDS.values() if field not in batch.columns]
+            if missing_fields:
+                raise ValueError(f"Missing required fields in bathymetry data: {missing_fields}")
+        
+        batch.index = pd.RangeIndex(row_offset, row_offset + len(batch))
+        row_offset += len(batch)
+        
+        if DOWLKNUM_KEY_FIELD not in batch.columns:
+            batch = add_dowlknum_key(batch, BATHYMETRY_FIELDS['dowlknum'])
+        invalid_count += int((~batch[DOWLKNUM_VALID_FIELD]).sum())
+        
+        if crs is None:
+            batch = batch.set_crs(epsg=CRS_EPSG)
+        elif CRS.from_user_input(crs).to_epsg() != CRS_EPSG:
+            batch = to_crs(batch.set_crs(crs), CRS_EPSG)
+        else:
+            batch = batch.set_crs(crs)
+        
+        yield batch
+    
+    if invalid_count > 0:
+        logger.warning(f"Found {invalid_count} invalid DOWLKNUMs in bathymetry data")
+    logger.info(f"Streamed {row_offset} bathymetry contours")
+
+
+def _iter_record_batches(
+    source_file: Path,
+    columns: List[str],
+    batch_size: int
+) -> Iterator[Tuple[gpd.GeoDataFrame, Optional[Any]]]:
+    """
+    Read a source file as Arrow record batches converted to GeoDataFrames.
+    
+    Args:
+        source_file: Path to the source file
+        columns: Attribute columns to read
+        batch_size: Number of rows per batch
+        
+    Yields:
+        Tuples of (batch_gdf without CRS, source CRS or None)
+    """
+    if _is_geoparquet(source_file):
+        with pq.ParquetFile(source_file) as parquet_file:
+            geometry_name, crs, _ = _geoparquet_metadata(parquet_file.schema_arrow)
+            
+            available = set(parquet_file.schema_arrow.names)
+            read_columns = [column for column in columns if column in available]
+            # Keep precomputed key columns (e.g. from the bathymetry store)
+            read_columns += [column for column in (DOWLKNUM_KEY_FIELD, DOWLKNUM_INT_FIELD, DOWLKNUM_VALID_FIELD) if column in available]
+            
+            for record_batch in parquet_file.iter_batches(batch_size=batch_size, columns=read_columns + [geometry_name]):
+                yield _record_batch_to_geodataframe(record_batch, geometry_name), crs
+    else:
+        with open_arrow(source_file, columns=columns, batch_size=batch_size, use_pyarrow=True) as (meta, reader):
+            geometry_name = meta.get('geometry_name') or 'wkb_geometry'
+            for record_batch in reader:
+                yield _record_batch_to_geodataframe(record_batch, geometry_name), meta.get('crs')
+
+
+def _record_batch_to_geodataframe(record_batch, geometry_name: str) -> gpd.GeoDataFrame:
+    """
+    Convert an Arrow record batch with a WKB geometry column into a GeoDataFrame.
+    
+    Args:
+        record_batch: Arrow record batch
+        geometry_name: Name of the WKB geometry column
+        
+    Returns:
+        GeoDataFrame without a CRS
+    """
+    geometry_index = record_batch.schema.get_field_index(geometry_name)
+    geometry = shapely.from_wkb(record_batch.column(geometry_index).to_numpy(zero_copy_only=False))
+    attributes = record_batch.remove_column(geometry_index).to_pandas()
+    return gpd.GeoDataFrame(attributes, geometry=geometry)
+
+
+def iter_lake_groups(
+    batches: Iterable[gpd.GeoDataFrame]
+) -> Iterator[Tuple[str, gpd.GeoDataFrame]]:
+    """
+    Group a stream of bathymetry batches into one GeoDataFrame per lake.
+    
+    The input must hold each lake's contours contiguously, as the lake-sorted bathymetry
+    store does; a lake spanning a batch boundary is carried over to the next batch, so
+    memory is bounded by the batch size plus the largest lake. Contours with invalid
+    DOWLKNUMs are skipped.
+    
+    Args:
+        batches: Batches from iter_bathymetry_batches
+        
+    Yields:
+        Tuples of (dowlknum, lake_contours_gdf)
+        
+    Raises:
+        ValueError: If a lake's contours are not contiguous in the input
+    """
+    current_dowlknum: Optional[str] = None
+    pending: List[gpd.GeoDataFrame] = []
+    completed: Set[str] = set()
+    
+    for batch in batches:
+        batch = batch[batch[DOWLKNUM_VALID_FIELD].to_numpy()]
+        if len(batch) == 0:
+            continue
+        
+        # Split the batch into runs of equal keys
+        keys = batch[DOWLKNUM_KEY_FIELD].astype(str).to_numpy()
+        boundaries = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+        starts = np.concatenate([[0], boundaries])
+        stops = np.concatenate([boundaries, [len(keys)]])
+        
+        for start, stop in zip(starts, stops):
+            dowlknum = str(keys[start])
+            run = batch.iloc[start:stop]
+            
+            if dowlknum == current_dowlknum:
+                pending.append(run)
+                continue
+            
+            if current_dowlknum is not None:
+                yield current_dowlknum, pd.concat(pending) if len(pending) > 1 else pending[0]
+                completed.add(current_dowlknum)
+            
+            if dowlknum in completed:
+                raise ValueError(
+                    f"Contours of lake {dowlknum} are not contiguous; stream from the "
+                    f"lake-sorted bathymetry store (scripts/build_store.py) instead"
+                )
+            
+            current_dowlknum = dowlknum
+            pending = [run]
+    
+    if current_dowlknum is not None:
+        yield current_dowlknum, pd.concat(pending) if len(pending) > 1 else pending[0]
+
+
+def compact_dtypes(
+    gdf: gpd.GeoDataFrame,
+    dtypes: Dict[str, str],
+    name: str
+) -> gpd.GeoDataFrame:
+    """
+    Convert attribute columns to memory-compact dtypes and log the savings.
+    
+    Args:
+        gdf: GeoDataFrame to convert
+        dtypes: Mapping of column name to compact dtype (columns not present are skipped)
+        name: Name of the dataset for logging
+        
+    Returns:
+        GeoDataFrame with the compact dtypes applied
+    """
+    memory_before = _memory_usage(gdf)
+    
+    conversions = {column: dtype for column, dtype in dtypes.items() if column in gdf.columns}
+    gdf = gdf.astype(conversions)
+    
+    memory_after = _memory_usage(gdf)
+    log_memory_report(memory_before, memory_after, name)
+    
+    return gdf
+
+
+def _memory_usage(gdf: pd.DataFrame) -> pd.Series:
+    """Get the memory usage in bytes of each column, including string contents."""
+    return gdf.memory_usage(deep=True, index=False)
+
+
+def log_memory_report(
+    memory_before: pd.Series,
+    memory_after: pd.Series,
+    name: str
+) -> pd.DataFrame:
+    """
+    Log the per-column memory usage before and after a dtype conversion.
+    
+    Args:
+        memory_before: Bytes per column before the conversion
+        memory_after: Bytes per column after the conversion
+        name: Name of the dataset for logging
+        
+    Returns:
+        DataFrame with 'before', 'after' and 'saved' bytes per column
+    """
+    report = pd.DataFrame({'before': memory_before, 'after': memory_after}).fillna(0).astype(np.int64)
+    report['saved'] = report['before'] - report['after']
+    
+    logger.info(f"{name} memory report (bytes per column):")
+    for column, row in report.iterrows():
+        logger.info(f"  {column}: {row['before']:,} -> {row['after']:,}")
+    
+    total_before = report['before'].sum()
+    total_after = report['after'].sum()
+    logger.info(
+        f"  Total: {total_before / 1e6:.1f} MB -> {total_after / 1e6:.1f} MB "
+        f"({(1 - total_after / total_before) * 100 if total_before else 0:.1f}% saved)"
+    )
+    
+    return report
+
+
 def inspect_data_sample(gdf: gpd.GeoDataFrame, name: str, sample_size: int = 3) -> None:
     """
     Log a sample of the data for inspection.
     
+    Only the columns that were loaded are shown; load the data with
+    all_columns=True to inspect every attribute column of the source files.
+    
     Args:
         gdf: GeoDataFrame to inspect
         name: Name of the dataset for logging
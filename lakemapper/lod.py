@@ -0,0 +1,76 @@
+"""
+Level-of-detail module for LakeMapper.
+
+This module builds topology-preserving simplified versions of the merged lake
+geometries at the configured tolerances, so web maps and LakeSim can load a
+lighter geometry at low zoom levels. Each level is computed for all lakes in a
+single vectorized shapely call.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import shapely
+
+from .config import LOD_TOLERANCES_METERS
+
+
+logger = logging.getLogger(__name__)
+
+
+def build_lake_lods(
+    merged_lakes: List[Dict[str, Any]],
+    tolerances: Optional[Sequence[float]] = None
+) -> Dict[str, Any]:
+    """
+    Add simplified level-of-detail geometries to every merged lake record.
+    
+    Each record gets a 'lods' list with one entry per tolerance (finest first)
+    holding the level number, tolerance, simplified geometry and vertex count.
+    
+    Args:
+        merged_lakes: List of merged lake data dictionaries (updated in place)
+        tolerances: Simplification tolerances in meters (defaults to LOD_TOLERANCES_METERS)
+        
+    Returns:
+        Dictionary containing LOD statistics
+    """
+    tolerances = sorted(LOD_TOLERANCES_METERS if tolerances is None else tolerances)
+    geometries = np.array([lake_data['geometry'] for lake_data in merged_lakes], dtype=object)
+    full_vertices = int(shapely.get_num_coordinates(geometries).sum()) if len(geometries) else 0
+    
+    lod_stats = {
+        'tolerances': tolerances,
+        'full_vertex_count': full_vertices,
+        'levels': []
+    }
+    
+    for lake_data in merged_lakes:
+        lake_data['lods'] = []
+    
+    for level, tolerance in enumerate(tolerances, start=1):
+        simplified = shapely.simplify(geometries, tolerance, preserve_topology=True)
+        vertex_counts = shapely.get_num_coordinates(simplified)
+        
+        for lake_data, geometry, vertex_count in zip(merged_lakes, simplified, vertex_counts):
+            lake_data['lods'].append({
+                'level': level,
+                'tolerance': tolerance,
+                'geometry': geometry,
+                'vertex_count': int(vertex_count)
+            })
+        
+        level_vertices = int(vertex_counts.sum())
+        lod_stats['levels'].append({
+            'level': level,
+            'tolerance': tolerance,
+            'vertex_count': level_vertices,
+            'vertex_ratio': level_vertices / full_vertices if full_vertices else 0.0
+        })
+        logger.info(
+            f"LOD {level} ({tolerance} m): {level_vertices} vertices "
+            f"({lod_stats['levels'][-1]['vertex_ratio'] * 100:.1f}% of {full_vertices})"
+        )
+    
+    return lod_stats
@@ -0,0 +1,281 @@
+"""
+Match table module for LakeMapper.
+
+This module persists the result of the matching stage as a compact Parquet table
+with one row per matched lake and content hashes of its bathymetry contours and
+fish survey outline, and diffs it against the table of the previous run so later
+stages can be limited to lakes that are new or changed in a DNR data drop.
+
+Each row also carries a hash of the run settings that shape the merged outputs,
+so changing them marks every lake as changed.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+
+from .config import (
+    BATHYMETRY_FIELDS, FISH_SURVEY_FIELDS, MATCH_TABLE_FILE, BUFFER_DISTANCE_METERS,
+    LAKE_GROUPING, UNION_STRATEGY, UNION_GRID_SIZE, LOD_TOLERANCES_METERS,
+    DEPTH_BAND_INTERVAL_FEET, REPAIR_GEOMETRIES
+)
+from .utils import dowlknum_keys, float64_values
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when the hashed content or settings change so every lake is re-exported
+MATCH_TABLE_VERSION = 2
+
+# Columns compared by diff_match_tables
+HASH_COLUMNS = ['contour_hash', 'outline_hash', 'settings_hash']
+
+# Lake classes reported by diff_match_tables
+DIFF_CLASSES = ['new', 'removed', 'changed', 'unchanged']
+
+
+def _row_hashes(gdf: gpd.GeoDataFrame, fields: Dict[str, str]) -> np.ndarray:
+    """
+    Hash the configured attributes and geometry of every row in one vectorized pass.
+    
+    Floats are rounded to float32 precision and hashed as the float64 of their
+    shortest decimal form (see utils.float64_values), and categoricals by value,
+    so hashes do not depend on whether the data was loaded with compact dtypes.
+    
+    Args:
+        gdf: Bathymetry or fish survey GeoDataFrame
+        fields: Field mapping of the attributes to hash
+        
+    Returns:
+        Array of uint64 row hashes
+    """
+    columns = {}
+    for field in fields.values():
+        if field not in gdf.columns:
+            continue
+        values = gdf[field]
+        if pd.api.types.is_float_dtype(values):
+            columns[field] = float64_values(values.astype(np.float32))
+        elif pd.api.types.is_numeric_dtype(values):
+            columns[field] = values.astype(np.int64)
+        else:
+            columns[field] = values.astype('string')
+    columns['geometry'] = shapely.to_wkb(gdf.geometry.to_numpy())
+    
+    return pd.util.hash_pandas_object(pd.DataFrame(columns), index=False).to_numpy()
+
+
+def _lake_hashes(
+    gdf: gpd.GeoDataFrame,
+    fields: Dict[str, str],
+    dowlknums: Iterable[str]
+) -> pd.DataFrame:
+    """
+    Compute an order-independent content hash of each lake's rows.
+    
+    Args:
+        gdf: Bathymetry or fish survey GeoDataFrame
+        fields: Field mapping of the dataset (its 'dowlknum' field is the raw key)
+        dowlknums: DOWLKNUMs to hash
+        
+    Returns:
+        DataFrame indexed by DOWLKNUM with 'row_count' and 'hash' columns
+    """
+    rows = pd.DataFrame({
+        'dowlknum': dowlknum_keys(gdf, fields['dowlknum']).astype('string').to_numpy(),
+        'row_hash': _row_hashes(gdf, fields)
+    })
+    rows = rows[rows['dowlknum'].isin(set(dowlknums))]
+    
+    # Sorting by row hash within each lake makes the lake hash independent of row order
+    rows = rows.sort_values(['dowlknum', 'row_hash'])
+    lake_keys, starts, counts = np.unique(
+        rows['dowlknum'].to_numpy(dtype=str), return_index=True, return_counts=True
+    )
+    row_hashes = rows['row_hash'].to_numpy()
+    
+    return pd.DataFrame({
+        'row_count': counts,
+        'hash': [
+            hashlib.sha256(row_hashes[start:start + count].tobytes()).hexdigest()[:16]
+            for start, count in zip(starts, counts)
+        ]
+    }, index=pd.Index(lake_keys, name='dowlknum'))
+
+
+def compute_settings_hash(settings: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Hash the run settings that shape a lake's merged outputs.
+    
+    Args:
+        settings: Optional overrides of the configured settings ('lake_grouping',
+            'union_strategy', 'grid_size', 'lod_tolerances', 'depth_band_interval',
+            'depth_bands', 'repair_geometries'); None values keep the configured default
+            
+    Returns:
+        Hex digest of the settings
+    """
+    resolved = {
+        'version': MATCH_TABLE_VERSION,
+        'buffer_distance_meters': BUFFER_DISTANCE_METERS,
+        'lake_grouping': LAKE_GROUPING,
+        'union_strategy': UNION_STRATEGY,
+        'grid_size': UNION_GRID_SIZE,
+        'lod_tolerances': LOD_TOLERANCES_METERS,
+        'depth_band_interval': DEPTH_BAND_INTERVAL_FEET,
+        'depth_bands': True,
+        'repair_geometries': REPAIR_GEOMETRIES
+    }
+    resolved.update({name: value for name, value in (settings or {}).items() if value is not None})
+    return hashlib.sha256(json.dumps(resolved, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+def build_match_table(
+    bathymetry_gdf: gpd.GeoDataFrame,
+    fish_survey_gdf: gpd.GeoDataFrame,
+    matching_dowlknums: Iterable[str],
+    settings: Optional[Dict[str, Any]] = None
+) -> pd.DataFrame:
+    """
+    Build the match table of the current run.
+    
+    Args:
+        bathymetry_gdf: GeoDataFrame containing bathymetry contour data
+        fish_survey_gdf: GeoDataFrame containing fish survey lake data
+        matching_dowlknums: DOWLKNUMs that exist in both datasets
+        settings: Optional run settings passed to compute_settings_hash
+        
+    Returns:
+        DataFrame sorted by DOWLKNUM with columns 'dowlknum', 'contour_count',
+        'contour_hash', 'outline_hash' and 'settings_hash'
+    """
+    matching_dowlknums = sorted(matching_dowlknums)
+    contours = _lake_hashes(bathymetry_gdf, BATHYMETRY_FIELDS, matching_dowlknums)
+    outlines = _lake_hashes(fish_survey_gdf, FISH_SURVEY_FIELDS, matching_dowlknums)
+    
+    match_table = pd.DataFrame({
+        'dowlknum': pd.array(matching_dowlknums, dtype='string'),
+        'contour_count': contours['row_count'].reindex(matching_dowlknums, fill_value=0).to_numpy(np.int32),
+        'contour_hash': contours['hash'].reindex(matching_dowlknums).to_numpy(),
+        'outline_hash': outlines['hash'].reindex(matching_dowlknums).to_numpy(),
+        'settings_hash': compute_settings_hash(settings)
+    })
+    
+    logger.info(f"Built match table for {len(match_table)} lakes")
+    return match_table
+
+
+def invalidate_lakes(match_table: pd.DataFrame, dowlknums: Iterable[str]) -> pd.DataFrame:
+    """
+    Clear the hashes of lakes whose outputs were not written.
+    
+    The lakes stay in the table, so they are still reported as removed if they
+    disappear, but diff as changed on the next run and are merged and exported again.
+    
+    Args:
+        match_table: Match table from build_match_table
+        dowlknums: DOWLKNUMs of lakes that failed to merge or export
+        
+    Returns:
+        Copy of the match table with the lakes' hash columns set to missing
+    """
+    match_table = match_table.copy()
+    failed = match_table['dowlknum'].isin(set(dowlknums))
+    match_table.loc[failed, HASH_COLUMNS] = None
+    
+    if failed.any():
+        logger.info(f"Cleared match table hashes of {int(failed.sum())} lakes that were not exported")
+    return match_table
+
+
+def save_match_table(match_table: pd.DataFrame, table_file: Optional[Path] = None) -> Path:
+    """
+    Save a match table, replacing the previous run's table.
+    
+    Args:
+        match_table: Match table from build_match_table
+        table_file: Optional table path (defaults to MATCH_TABLE_FILE)
+        
+    Returns:
+        Path to the saved table
+    """
+    table_file = table_file or MATCH_TABLE_FILE
+    table_file.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Write to a temporary file first so an interrupted run keeps the previous table
+    temp_file = table_file.with_suffix('.parquet.tmp')
+    match_table.to_parquet(temp_file, index=False)
+    temp_file.replace(table_file)
+    
+    logger.info(f"Saved match table for {len(match_table)} lakes to {table_file}")
+    return table_file
+
+
+def load_match_table(table_file: Optional[Path] = None) -> Optional[pd.DataFrame]:
+    """
+    Load the match table of the previous run.
+    
+    Args:
+        table_file: Optional table path (defaults to MATCH_TABLE_FILE)
+        
+    Returns:
+        Match table, or None if no previous table exists
+    """
+    table_file = table_file or MATCH_TABLE_FILE
+    
+    if not table_file.exists():
+        logger.info(f"No previous match table found at {table_file}")
+        return None
+    
+    try:
+        return pd.read_parquet(table_file)
+    except Exception as e:
+        logger.warning(f"Error reading match table {table_file}: {e}")
+        return None
+
+
+def diff_match_tables(
+    previous_table: Optional[pd.DataFrame],
+    current_table: pd.DataFrame
+) -> Dict[str, List[str]]:
+    """
+    Classify lakes as new, removed, changed or unchanged between two runs.
+    
+    Args:
+        previous_table: Match table of the previous run (None treats every lake as new)
+        current_table: Match table of the current run
+        
+    Returns:
+        Dictionary mapping each of DIFF_CLASSES to a sorted list of DOWLKNUMs
+    """
+    current = current_table.set_index('dowlknum')
+    if previous_table is None:
+        previous = current.iloc[:0]
+    else:
+        previous = previous_table.set_index('dowlknum')
+    
+    # Tables written before a hash column existed compare as changed
+    previous = previous.reindex(columns=HASH_COLUMNS)
+    
+    common = current.index.intersection(previous.index)
+    same = (current.loc[common, HASH_COLUMNS] == previous.loc[common, HASH_COLUMNS]).all(axis=1)
+    
+    diff = {
+        'new': current.index.difference(previous.index),
+        'removed': previous.index.difference(current.index),
+        'changed': common[~same.to_numpy()],
+        'unchanged': common[same.to_numpy()]
+    }
+    diff = {name: sorted(str(dowlknum) for dowlknum in diff[name]) for name in DIFF_CLASSES}
+    
+    logger.info(
+        "Match table diff: " + ", ".join(f"{len(diff[name])} {name}" for name in DIFF_CLASSES)
+    )
+    return diff
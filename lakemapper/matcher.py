@@ -2,21 +2,41 @@
 Data matching module for LakeMapper.
 
 This module handles finding lakes that exist in both bathymetry and fish survey datasets
-by comparing their DOWLKNUM values.
+by comparing their DOWLKNUM values, with an optional spatial fallback for contours
+whose DOWLKNUM is missing or does not match any fish survey lake.
 """
 
 import logging
-from typing import List, Set, Tuple, Dict, Any
+from typing import Iterable, List, Set, Tuple, Dict, Any, Optional
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 
-from .config import BATHYMETRY_FIELDS, FISH_SURVEY_FIELDS
-from .utils import validate_dowlknum
+from .config import (
+    BATHYMETRY_FIELDS, FISH_SURVEY_FIELDS, DOWLKNUM_KEY_FIELD, DOWLKNUM_INT_FIELD,
+    DOWLKNUM_VALID_FIELD, SPATIAL_MATCH_FIELD, SPATIAL_FALLBACK_MIN_OVERLAP,
+    BASIN_KEY_FIELD, LAKE_GROUPINGS, LAKE_GROUPING, PARENT_LAKE_DIGITS
+)
+from .utils import add_dowlknum_key, dowlknum_keys
 
 
 logger = logging.getLogger(__name__)
 
+# Column-name prefixes for shapely geometry type ids in the lake validation table
+GEOMETRY_TYPE_NAMES = {
+    -1: 'missing',
+    0: 'point',
+    1: 'linestring',
+    2: 'linearring',
+    3: 'polygon',
+    4: 'multipoint',
+    5: 'multilinestring',
+    6: 'multipolygon',
+    7: 'geometrycollection'
+}
+
 
 def find_matching_lakes(
     bathymetry_gdf: gpd.GeoDataFrame,
@@ -34,21 +54,32 @@ def find_matching_lakes(
     """
     logger.info("Finding lakes that exist in both datasets...")
     
-    # Extract DOWLKNUMs from both datasets
-    bathymetry_dowlknums = set()
-    fish_survey_dowlknums = set()
+    # Extract valid DOWLKNUM keys from the bathymetry (invalid keys are missing)
+    bathymetry_keys = dowlknum_keys(bathymetry_gdf, BATHYMETRY_FIELDS['dowlknum'])
+    bathymetry_dowlknums = set(bathymetry_keys.dropna().unique())
+    
+    return find_matching_lake_ids(bathymetry_dowlknums, fish_survey_gdf)
+
+
+def find_matching_lake_ids(
+    bathymetry_dowlknums: Set[str],
+    fish_survey_gdf: gpd.GeoDataFrame
+) -> Tuple[Set[str], Dict[str, Any]]:
+    """
+    Find fish survey lakes among a known set of bathymetry DOWLKNUMs.
     
-    # Get bathymetry DOWLKNUMs
-    bathymetry_field = BATHYMETRY_FIELDS['dowlknum']
-    for dowlknum in bathymetry_gdf[bathymetry_field]:
-        if validate_dowlknum(str(dowlknum)):
-            bathymetry_dowlknums.add(str(dowlknum))
+    Used when the bathymetry lakes are known without loading the contours, e.g. from
+    the lake-sorted bathymetry store index in streaming mode.
     
-    # Get fish survey DOWLKNUMs
-    fish_survey_field = FISH_SURVEY_FIELDS['dowlknum']
-    for dowlknum in fish_survey_gdf[fish_survey_field]:
-        if validate_dowlknum(str(dowlknum)):
-            fish_survey_dowlknums.add(str(dowlknum))
+    Args:
+        bathymetry_dowlknums: Set of DOWLKNUMs that have bathymetry contours
+        fish_survey_gdf: GeoDataFrame containing fish survey lake data
+        
+    Returns:
+        Tuple of (matching_dowlknums, matching_stats)
+    """
+    fish_survey_keys = dowlknum_keys(fish_survey_gdf, FISH_SURVEY_FIELDS['dowlknum'])
+    fish_survey_dowlknums = set(fish_survey_keys.dropna().unique())
     
     # Find intersection
     matching_dowlknums = bathymetry_dowlknums.intersection(fish_survey_dowlknums)
@@ -75,6 +106,245 @@ def find_matching_lakes(
     return matching_dowlknums, stats
 
 
+def parent_lake_keys(keys: pd.Series) -> pd.Series:
+    """
+    Compute parent lake keys from canonical DOWLKNUM keys.
+    
+    Basins of a lake share the first PARENT_LAKE_DIGITS digits, so the parent lake
+    key keeps those digits and zeroes the basin suffix (27013301 -> 27013300).
+    
+    Args:
+        keys: Canonical DOWLKNUM keys (missing where invalid)
+        
+    Returns:
+        Series of parent lake keys with the index of keys (missing where invalid)
+    """
+    keys = keys.astype('string')
+    suffix = '0' * (8 - PARENT_LAKE_DIGITS)
+    return keys.str[:PARENT_LAKE_DIGITS] + suffix
+
+
+def group_lake_ids(dowlknums: Iterable[str], grouping: Optional[str] = None) -> Set[str]:
+    """
+    Map a set of DOWLKNUMs to their lake grouping keys.
+    
+    Args:
+        dowlknums: Canonical DOWLKNUM keys (e.g. from the bathymetry store index)
+        grouping: Optional lake grouping, one of LAKE_GROUPINGS (defaults to LAKE_GROUPING)
+        
+    Returns:
+        Set of grouping keys
+        
+    Raises:
+        ValueError: If the grouping is unknown
+    """
+    grouping = _check_grouping(grouping)
+    if grouping == 'dowlknum':
+        return set(dowlknums)
+    return set(parent_lake_keys(pd.Series(list(dowlknums), dtype='string')).dropna())
+
+
+def apply_lake_grouping(
+    gdf: gpd.GeoDataFrame,
+    field: str,
+    grouping: Optional[str] = None
+) -> gpd.GeoDataFrame:
+    """
+    Re-key a dataset by its lake grouping key.
+    
+    With 'parent' grouping the canonical key columns are replaced by the parent lake
+    key, so matching, filtering and merging treat all basins of a lake as one lake,
+    and the original basin key is kept in BASIN_KEY_FIELD. With 'dowlknum' grouping
+    the dataset is returned unchanged.
+    
+    Args:
+        gdf: Bathymetry or fish survey GeoDataFrame
+        field: Name of the raw DOWLKNUM column
+        grouping: Optional lake grouping, one of LAKE_GROUPINGS (defaults to LAKE_GROUPING)
+        
+    Returns:
+        GeoDataFrame keyed by the grouping key
+        
+    Raises:
+        ValueError: If the grouping is unknown
+    """
+    grouping = _check_grouping(grouping)
+    if grouping == 'dowlknum' or BASIN_KEY_FIELD in gdf.columns:
+        return gdf
+    
+    gdf = gdf.copy()
+    if DOWLKNUM_KEY_FIELD not in gdf.columns:
+        gdf = add_dowlknum_key(gdf, field)
+    
+    basin_keys = gdf[DOWLKNUM_KEY_FIELD]
+    parent_keys = parent_lake_keys(basin_keys)
+    gdf[BASIN_KEY_FIELD] = basin_keys.astype('string')
+    
+    # Keep compact (categorical / int32) key dtypes
+    if isinstance(basin_keys.dtype, pd.CategoricalDtype):
+        parent_keys = parent_keys.astype('category')
+    gdf[DOWLKNUM_KEY_FIELD] = parent_keys
+    gdf[DOWLKNUM_INT_FIELD] = pd.to_numeric(parent_keys, errors='coerce').fillna(-1).astype(
+        gdf[DOWLKNUM_INT_FIELD].dtype
+    )
+    
+    basin_count = basin_keys.nunique()
+    parent_count = parent_keys.nunique()
+    logger.debug(f"Grouped {basin_count} basins into {parent_count} parent lakes")
+    
+    return gdf
+
+
+def _check_grouping(grouping: Optional[str]) -> str:
+    """Resolve and validate a lake grouping name."""
+    grouping = grouping or LAKE_GROUPING
+    if grouping not in LAKE_GROUPINGS:
+        raise ValueError(f"Unknown lake grouping '{grouping}' (expected one of {LAKE_GROUPINGS})")
+    return grouping
+
+
+def apply_spatial_fallback(
+    bathymetry_gdf: gpd.GeoDataFrame,
+    fish_survey_gdf: gpd.GeoDataFrame,
+    min_overlap: Optional[float] = None
+) -> Tuple[gpd.GeoDataFrame, Dict[str, Any]]:
+    """
+    Assign contours with a missing or unmatched DOWLKNUM to the lake outline they overlap most.
+    
+    All unmatched contours are queried against an STRtree of the fish survey outlines
+    in one vectorized call and the overlap of every candidate pair is computed in bulk,
+    so the cost stays near-linear in the number of unmatched contours.
+    
+    Keys are compared at the fish survey's lake grouping: when the outlines were
+    re-keyed by parent lake, the bathymetry is grouped the same way first, and
+    recovered contours take the basin key of the outline they overlap.
+    
+    Args:
+        bathymetry_gdf: GeoDataFrame containing bathymetry contour data
+        fish_survey_gdf: GeoDataFrame containing fish survey lake data
+        min_overlap: Optional minimum share of a contour's area (length for line
+            contours) that must lie inside the outline (defaults to
+            SPATIAL_FALLBACK_MIN_OVERLAP)
+            
+    Returns:
+        Tuple of (bathymetry_gdf with the canonical keys of recovered contours set to
+        their outline's DOWLKNUM and SPATIAL_MATCH_FIELD marking them, fallback_stats)
+    """
+    min_overlap = SPATIAL_FALLBACK_MIN_OVERLAP if min_overlap is None else min_overlap
+    
+    logger.info("Matching contours with missing or unmatched DOWLKNUMs spatially...")
+    
+    bathymetry_gdf = bathymetry_gdf.copy()
+    if DOWLKNUM_KEY_FIELD not in bathymetry_gdf.columns:
+        bathymetry_gdf = add_dowlknum_key(bathymetry_gdf, BATHYMETRY_FIELDS['dowlknum'])
+    
+    # Basin keys must not be compared against outlines already re-keyed by parent lake
+    grouped = BASIN_KEY_FIELD in fish_survey_gdf.columns
+    if grouped:
+        bathymetry_gdf = apply_lake_grouping(bathymetry_gdf, BATHYMETRY_FIELDS['dowlknum'], 'parent')
+    
+    fish_survey_keys = dowlknum_keys(fish_survey_gdf, FISH_SURVEY_FIELDS['dowlknum'])
+    bathymetry_keys = bathymetry_gdf[DOWLKNUM_KEY_FIELD]
+    matched_before = set(bathymetry_keys.dropna().unique()) & set(fish_survey_keys.dropna().unique())
+    
+    # Contours whose key is invalid or has no fish survey outline
+    unmatched_positions = np.flatnonzero(~bathymetry_keys.isin(set(fish_survey_keys.dropna())).to_numpy())
+    outline_positions = np.flatnonzero(fish_survey_keys.notna().to_numpy())
+    
+    contour_geometries = bathymetry_gdf.geometry.to_numpy()[unmatched_positions]
+    outline_geometries = fish_survey_gdf.geometry.to_numpy()[outline_positions]
+    
+    # Candidate (contour, outline) pairs from one bulk STRtree query
+    tree = shapely.STRtree(outline_geometries)
+    contour_index, outline_index = tree.query(contour_geometries, predicate='intersects')
+    
+    # Overlap as area for polygon contours and length for line contours
+    pair_contours = contour_geometries[contour_index]
+    intersections = shapely.intersection(pair_contours, outline_geometries[outline_index])
+    polygonal = shapely.get_dimensions(pair_contours) == 2
+    overlap = np.where(polygonal, shapely.area(intersections), shapely.length(intersections))
+    size = np.where(polygonal, shapely.area(pair_contours), shapely.length(pair_contours))
+    share = np.divide(overlap, size, out=np.zeros_like(overlap), where=size > 0)
+    
+    # Keep the outline with the largest overlap per contour
+    keep = share >= min_overlap
+    contour_index, outline_index, overlap = contour_index[keep], outline_index[keep], overlap[keep]
+    order = np.lexsort((-overlap, contour_index))
+    contour_index, outline_index = contour_index[order], outline_index[order]
+    _, first = np.unique(contour_index, return_index=True)
+    
+    recovered_positions = unmatched_positions[contour_index[first]]
+    recovered_outlines = outline_positions[outline_index[first]]
+    recovered_keys = fish_survey_keys.to_numpy()[recovered_outlines].astype(str)
+    recovered_basins = None
+    if grouped:
+        recovered_basins = fish_survey_gdf[BASIN_KEY_FIELD].to_numpy()[recovered_outlines]
+    
+    _set_contour_keys(bathymetry_gdf, recovered_positions, recovered_keys, recovered_basins)
+    
+    recovered_lakes = sorted(str(dowlknum) for dowlknum in set(recovered_keys) - matched_before)
+    fallback_stats = {
+        'unmatched_contours': int(len(unmatched_positions)),
+        'candidate_pairs': int(len(keep)),
+        'recovered_contours': int(len(recovered_positions)),
+        'still_unmatched_contours': int(len(unmatched_positions) - len(recovered_positions)),
+        'recovered_lakes': recovered_lakes
+    }
+    
+    logger.info(f"Spatial fallback results:")
+    logger.info(f"Unmatched contours: {fallback_stats['unmatched_contours']}")
+    logger.info(f"Recovered contours: {fallback_stats['recovered_contours']}")
+    logger.info(f"Recovered lakes: {len(recovered_lakes)}")
+    for dowlknum in recovered_lakes[:10]:  # Log first 10
+        logger.info(f"  {dowlknum}: {int((recovered_keys == dowlknum).sum())} contours")
+    
+    return bathymetry_gdf, fallback_stats
+
+
+def _set_contour_keys(
+    bathymetry_gdf: gpd.GeoDataFrame,
+    positions: np.ndarray,
+    keys: np.ndarray,
+    basin_keys: Optional[np.ndarray] = None
+) -> None:
+    """
+    Overwrite the canonical key columns of the given contour rows in place.
+    
+    Args:
+        bathymetry_gdf: Bathymetry GeoDataFrame with all canonical key columns
+        positions: Row positions to update
+        keys: Canonical DOWLKNUM key for each position
+        basin_keys: Optional basin key for each position, for bathymetry grouped by
+            parent lake
+    """
+    key_column = bathymetry_gdf[DOWLKNUM_KEY_FIELD]
+    if isinstance(key_column.dtype, pd.CategoricalDtype):
+        # Compact loads store keys as categoricals, which need the new keys as categories
+        new_categories = pd.Index(np.unique(keys)).difference(key_column.cat.categories)
+        key_column = key_column.cat.add_categories(new_categories)
+    
+    key_column = key_column.copy()
+    key_column.iloc[positions] = keys
+    bathymetry_gdf[DOWLKNUM_KEY_FIELD] = key_column
+    
+    int_column = bathymetry_gdf[DOWLKNUM_INT_FIELD].copy()
+    int_column.iloc[positions] = keys.astype(np.int64).astype(int_column.dtype)
+    bathymetry_gdf[DOWLKNUM_INT_FIELD] = int_column
+    
+    valid_column = bathymetry_gdf[DOWLKNUM_VALID_FIELD].copy()
+    valid_column.iloc[positions] = True
+    bathymetry_gdf[DOWLKNUM_VALID_FIELD] = valid_column
+    
+    if basin_keys is not None:
+        basin_column = bathymetry_gdf[BASIN_KEY_FIELD].copy()
+        basin_column.iloc[positions] = basin_keys
+        bathymetry_gdf[BASIN_KEY_FIELD] = basin_column
+    
+    spatial_match = np.zeros(len(bathymetry_gdf), dtype=bool)
+    spatial_match[positions] = True
+    bathymetry_gdf[SPATIAL_MATCH_FIELD] = spatial_match
+
+
 def filter_datasets_by_matching_lakes(
     bathymetry_gdf: gpd.GeoDataFrame,
     fish_survey_gdf: gpd.GeoDataFrame,
@@ -94,13 +364,13 @@ def filter_datasets_by_matching_lakes(
     logger.info(f"Filtering datasets to {len(matching_dowlknums)} matching lakes...")
     
     # Filter bathymetry data
-    bathymetry_field = BATHYMETRY_FIELDS['dowlknum']
-    bathymetry_mask = bathymetry_gdf[bathymetry_field].astype(str).isin(matching_dowlknums)
+    bathymetry_keys = dowlknum_keys(bathymetry_gdf, BATHYMETRY_FIELDS['dowlknum'])
+    bathymetry_mask = bathymetry_keys.isin(matching_dowlknums)
     filtered_bathymetry = bathymetry_gdf[bathymetry_mask].copy()
     
     # Filter fish survey data
-    fish_survey_field = FISH_SURVEY_FIELDS['dowlknum']
-    fish_survey_mask = fish_survey_gdf[fish_survey_field].astype(str).isin(matching_dowlknums)
+    fish_survey_keys = dowlknum_keys(fish_survey_gdf, FISH_SURVEY_FIELDS['dowlknum'])
+    fish_survey_mask = fish_survey_keys.isin(matching_dowlknums)
     filtered_fish_survey = fish_survey_gdf[fish_survey_mask].copy()
     
     logger.info(f"Filtered bathymetry: {len(filtered_bathymetry)} contours")
@@ -126,13 +396,14 @@ def get_lake_summary(
     logger.info("Creating lake summary...")
     
     # Filter to matching lakes
-    fish_survey_field = FISH_SURVEY_FIELDS['dowlknum']
-    mask = fish_survey_gdf[fish_survey_field].astype(str).isin(matching_dowlknums)
+    fish_survey_keys = dowlknum_keys(fish_survey_gdf, FISH_SURVEY_FIELDS['dowlknum'])
+    mask = fish_survey_keys.isin(matching_dowlknums)
     matching_lakes = fish_survey_gdf[mask].copy()
+    matching_lakes[DOWLKNUM_KEY_FIELD] = fish_survey_keys[mask]
     
     # Create summary DataFrame with available fields
     summary_columns = {
-        'dowlknum': FISH_SURVEY_FIELDS['dowlknum'],
+        'dowlknum': DOWLKNUM_KEY_FIELD,
         'acres': FISH_SURVEY_FIELDS['acres'],
         'city_name': FISH_SURVEY_FIELDS['city_name'],
         'survey_url': FISH_SURVEY_FIELDS['survey_url']
@@ -167,13 +438,18 @@ def validate_matching_data(
     """
     Perform validation checks on the matched data.
     
+    Contours are counted per lake in one grouped pass over the bathymetry data,
+    which is then joined against the match set, so the cost is linear in the
+    number of contours rather than lakes x contours.
+    
     Args:
         bathymetry_gdf: GeoDataFrame containing bathymetry contour data
         fish_survey_gdf: GeoDataFrame containing fish survey lake data
         matching_dowlknums: Set of DOWLKNUMs that exist in both datasets
         
     Returns:
-        Dictionary containing validation results
+        Dictionary containing validation results, including 'lake_table', a
+        DataFrame with one row per matching lake (see build_lake_validation_table)
     """
     logger.info("Validating matched data...")
     
@@ -185,16 +461,16 @@ def validate_matching_data(
     }
     
     # Check bathymetry contours per lake
-    bathymetry_field = BATHYMETRY_FIELDS['dowlknum']
-    for dowlknum in matching_dowlknums:
-        mask = bathymetry_gdf[bathymetry_field].astype(str) == dowlknum
-        contour_count = mask.sum()
-        validation_results['bathymetry_contours_per_lake'][dowlknum] = contour_count
-        
-        if contour_count == 0:
-            validation_results['data_quality_issues'].append(
-                f"Lake {dowlknum} has no bathymetry contours"
-            )
+    lake_table = build_lake_validation_table(bathymetry_gdf, matching_dowlknums)
+    validation_results['lake_table'] = lake_table
+    validation_results['bathymetry_contours_per_lake'] = dict(
+        zip(lake_table['dowlknum'], lake_table['contour_count'].astype(int))
+    )
+    
+    for dowlknum in lake_table.loc[lake_table['contour_count'] == 0, 'dowlknum']:
+        validation_results['data_quality_issues'].append(
+            f"Lake {dowlknum} has no bathymetry contours"
+        )
     
     # Check geometry types
     validation_results['geometry_types']['bathymetry'] = dict(
@@ -214,4 +490,45 @@ def validate_matching_data(
         for issue in validation_results['data_quality_issues'][:5]:  # Log first 5
             logger.warning(f"  {issue}")
     
-    return validation_results 
\ No newline at end of file
+    return validation_results
+
+
+def build_lake_validation_table(
+    bathymetry_gdf: gpd.GeoDataFrame,
+    matching_dowlknums: Set[str]
+) -> pd.DataFrame:
+    """
+    Summarize the bathymetry contours of each matching lake in one grouped pass.
+    
+    Args:
+        bathymetry_gdf: GeoDataFrame containing bathymetry contour data
+        matching_dowlknums: Set of DOWLKNUMs that exist in both datasets
+        
+    Returns:
+        DataFrame sorted by DOWLKNUM with columns 'dowlknum', 'contour_count',
+        'vertex_count' and one '<geometry type>_count' column per contour
+        geometry type (e.g. 'polygon_count'); lakes without contours have zeros
+    """
+    geometries = bathymetry_gdf.geometry.to_numpy()
+    contours = pd.DataFrame({
+        'dowlknum': dowlknum_keys(bathymetry_gdf, BATHYMETRY_FIELDS['dowlknum']).astype('string').to_numpy(),
+        'vertex_count': shapely.get_num_coordinates(geometries),
+        'geometry_type': pd.Series(shapely.get_type_id(geometries)).map(GEOMETRY_TYPE_NAMES).to_numpy()
+    })
+    
+    grouped = contours.groupby('dowlknum', sort=False)
+    lake_table = pd.DataFrame({
+        'contour_count': grouped.size(),
+        'vertex_count': grouped['vertex_count'].sum()
+    })
+    
+    # Geometry-type mix as one count column per type present in the data
+    type_counts = grouped['geometry_type'].value_counts().unstack(fill_value=0)
+    type_counts.columns = [f"{geometry_type}_count" for geometry_type in type_counts.columns]
+    lake_table = lake_table.join(type_counts)
+    
+    # Join against the match set so lakes without contours are reported with zeros
+    lake_table = lake_table.reindex(sorted(matching_dowlknums), fill_value=0).astype(np.int64)
+    lake_table.index.name = 'dowlknum'
+    
+    return lake_table.reset_index()
@@ -0,0 +1,161 @@
+"""
+Merge cache module for LakeMapper.
+
+This module caches merged lake geometries (as WKB) on disk, keyed by a hash of
+everything the merge depends on: the lake's intersecting contours, its outline,
+the buffer distance, the union strategy and grid size, and MERGE_CACHE_VERSION.
+Lakes whose contours did not change between runs are then read back instead of
+being unioned again. Depth statistics are not cached, since the key does not
+cover contour attributes; they are recomputed from the contour rows.
+"""
+
+import hashlib
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+import shapely
+
+from .config import BUFFER_DISTANCE_METERS, MERGE_CACHE_FILE, MERGE_CACHE_MAX_AGE_DAYS
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when the merger's output changes in a way that is not captured by the key
+MERGE_CACHE_VERSION = 1
+
+# Columns of the cache table besides the key
+CACHE_COLUMNS = ['geometry', 'contour_count', 'last_used']
+
+
+def compute_merge_keys(
+    contour_geometries: np.ndarray,
+    lake_contours: Dict[str, np.ndarray],
+    lake_outlines: Dict[str, Any],
+    union_strategy: str,
+    grid_size: Optional[float]
+) -> Dict[str, str]:
+    """
+    Compute the cache key of every lake's merge.
+    
+    Args:
+        contour_geometries: Array of all bathymetry contour geometries
+        lake_contours: Mapping of DOWLKNUM to the row positions of its intersecting
+            contours, from find_intersecting_contours
+        lake_outlines: Mapping of DOWLKNUM to the lake's outline geometry
+        union_strategy: Union strategy used for the merge
+        grid_size: Precision grid used for the merge
+        
+    Returns:
+        Mapping of DOWLKNUM to its merge key
+    """
+    settings = f"{MERGE_CACHE_VERSION}|{BUFFER_DISTANCE_METERS}|{union_strategy}|{grid_size}".encode('utf-8')
+    
+    merge_keys = {}
+    for dowlknum, rows in lake_contours.items():
+        digest = hashlib.sha256(settings)
+        digest.update(shapely.to_wkb(lake_outlines[dowlknum]))
+        for contour_wkb in shapely.to_wkb(contour_geometries[rows]):
+            digest.update(contour_wkb)
+        merge_keys[dowlknum] = digest.hexdigest()[:32]
+    
+    return merge_keys
+
+
+def load_merge_cache(cache_file: Optional[Path] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the merge cache.
+    
+    Args:
+        cache_file: Optional cache path (defaults to MERGE_CACHE_FILE)
+        
+    Returns:
+        Mapping of merge key to cache entry (empty if there is no readable cache)
+    """
+    cache_file = cache_file or MERGE_CACHE_FILE
+    
+    if not cache_file.exists():
+        logger.debug(f"No merge cache found at {cache_file}")
+        return {}
+    
+    try:
+        cache_table = pd.read_parquet(cache_file)
+    except Exception as e:
+        logger.warning(f"Error reading merge cache {cache_file}: {e}")
+        return {}
+    
+    logger.info(f"Loaded {len(cache_table)} merge cache entries from {cache_file}")
+    return cache_table.set_index('key')[CACHE_COLUMNS].to_dict('index')
+
+
+def make_cache_entry(merged_lake_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a merge cache entry from a merged lake record.
+    
+    Args:
+        merged_lake_data: Merged lake data dictionary
+        
+    Returns:
+        Cache entry with the merged geometry as WKB
+    """
+    return {
+        'geometry': shapely.to_wkb(merged_lake_data['geometry']),
+        'contour_count': merged_lake_data['contour_count'],
+        'last_used': time.time()
+    }
+
+
+def save_merge_cache(
+    merge_cache: Dict[str, Dict[str, Any]],
+    used_keys: Iterable[str],
+    cache_file: Optional[Path] = None
+) -> Optional[Path]:
+    """
+    Save the merge cache, pruning entries unused for MERGE_CACHE_MAX_AGE_DAYS.
+    
+    Args:
+        merge_cache: Mapping of merge key to cache entry
+        used_keys: Keys hit or added by this run (their last-used time is refreshed)
+        cache_file: Optional cache path (defaults to MERGE_CACHE_FILE)
+        
+    Returns:
+        Path to the cache file, or None if saving failed
+    """
+    cache_file = cache_file or MERGE_CACHE_FILE
+    now = time.time()
+    
+    for key in used_keys:
+        merge_cache[key]['last_used'] = now
+    
+    cache_table = pd.DataFrame.from_dict(merge_cache, orient='index', columns=CACHE_COLUMNS)
+    cache_table = cache_table[cache_table['last_used'] >= now - MERGE_CACHE_MAX_AGE_DAYS * 86400]
+    cache_table = cache_table.rename_axis('key').reset_index()
+    
+    # Write to a temporary file first so an interrupted run keeps the previous cache
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = cache_file.with_suffix('.parquet.tmp')
+    try:
+        cache_table.to_parquet(temp_file, index=False)
+        temp_file.replace(cache_file)
+    except Exception as e:
+        logger.warning(f"Error saving merge cache {cache_file}: {e}")
+        temp_file.unlink(missing_ok=True)
+        return None
+    
+    logger.info(f"Saved {len(cache_table)} merge cache entries to {cache_file}")
+    return cache_file
+
+
+def clear_merge_cache(cache_file: Optional[Path] = None) -> None:
+    """
+    Delete the merge cache.
+    
+    Args:
+        cache_file: Optional cache path (defaults to MERGE_CACHE_FILE)
+    """
+    cache_file = cache_file or MERGE_CACHE_FILE
+    cache_file.unlink(missing_ok=True)
+    logger.info(f"Cleared merge cache {cache_file}")
@@ -6,23 +6,43 @@ and buffering to create unified lake geometries.
 """
 
 import logging
-from typing import Dict, List, Tuple, Optional, Any
+import os
+from decimal import Decimal
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Set, Tuple, Optional, Any, Union
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 from shapely.geometry import Polygon, MultiPolygon
 from shapely.ops import unary_union
 
-from .config import BUFFER_DISTANCE_METERS, BATHYMETRY_FIELDS, FISH_SURVEY_FIELDS
+from .config import (
+    BUFFER_DISTANCE_METERS, BATHYMETRY_FIELDS, FISH_SURVEY_FIELDS, BASIN_KEY_FIELD,
+    MERGE_WORKERS, MERGE_TASKS_PER_WORKER, UNION_STRATEGIES, UNION_STRATEGY, UNION_GRID_SIZE,
+    TILED_UNION_MIN_VERTICES, TILED_UNION_CELLS_PER_SIDE, TILED_UNION_WORKERS, DEPTH_BAND_INTERVAL_FEET
+)
+from .merge_cache import compute_merge_keys, load_merge_cache, make_cache_entry, save_merge_cache
+from .utils import build_lake_index, float64_values
 
 
 logger = logging.getLogger(__name__)
 
+# Attribute columns of the merged lakes GeoDataFrame (the geometry follows dowlknum)
+MERGED_LAKE_COLUMNS = (
+    'dowlknum', 'lake_name', 'contour_count', 'min_depth', 'max_depth',
+    'acres', 'city_name', 'survey_url', 'basin_dowlknums'
+)
+
 
 def merge_bathymetry_for_lake(
     bathymetry_gdf: gpd.GeoDataFrame,
     fish_survey_geometry: Polygon,
-    dowlknum: str
+    dowlknum: str,
+    lake_rows: Optional[Any] = None,
+    union_strategy: Optional[str] = None,
+    grid_size: Optional[float] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Merge bathymetry contours for a single lake.
@@ -31,6 +51,11 @@ def merge_bathymetry_for_lake(
         bathymetry_gdf: GeoDataFrame containing bathymetry contour data
         fish_survey_geometry: Polygon geometry of the fish survey lake outline
         dowlknum: DOWLKNUM of the lake to process
+        lake_rows: Optional row positions (slice or array) of the lake's contours in
+            bathymetry_gdf, from build_lake_index or the lake-sorted bathymetry
+            store index; the contours are looked up by key when not given
+        union_strategy: One of UNION_STRATEGIES (defaults to UNION_STRATEGY)
+        grid_size: Optional precision grid for the union (defaults to UNION_GRID_SIZE)
         
     Returns:
         Dictionary containing merged lake data or None if no contours found
@@ -38,11 +63,11 @@ def merge_bathymetry_for_lake(
     logger.debug(f"Merging bathymetry for lake {dowlknum}")
     
     # Filter bathymetry data for this lake
-    bathymetry_field = BATHYMETRY_FIELDS['dowlknum']
-    lake_mask = bathymetry_gdf[bathymetry_field].astype(str) == dowlknum
-    lake_bathymetry = bathymetry_gdf[lake_mask].copy()
+    if lake_rows is None:
+        lake_rows = build_lake_index(bathymetry_gdf, BATHYMETRY_FIELDS['dowlknum']).get(dowlknum, [])
+    lake_positions = _row_positions(lake_rows, len(bathymetry_gdf))
     
-    if len(lake_bathymetry) == 0:
+    if len(lake_positions) == 0:
         logger.warning(f"No bathymetry contours found for lake {dowlknum}")
         return None
     
@@ -50,66 +75,427 @@ def merge_bathymetry_for_lake(
     buffered_geometry = fish_survey_geometry.buffer(BUFFER_DISTANCE_METERS)
     
     # Find contours that intersect with the buffered area
-    intersecting_mask = lake_bathymetry.geometry.intersects(buffered_geometry)
-    intersecting_contours = lake_bathymetry[intersecting_mask].copy()
+    intersecting_mask = shapely.intersects(bathymetry_gdf.geometry.to_numpy()[lake_positions], buffered_geometry)
+    contour_rows = lake_positions[intersecting_mask]
     
-    if len(intersecting_contours) == 0:
+    if len(contour_rows) == 0:
         logger.warning(f"No intersecting bathymetry contours found for lake {dowlknum}")
         return None
     
-    # Merge all intersecting contours
-    try:
-        merged_geometry = unary_union(intersecting_contours.geometry.tolist())
-        
-        # Ensure we have a valid geometry
-        if merged_geometry.is_empty:
-            logger.warning(f"Merged geometry is empty for lake {dowlknum}")
-            return None
-        
-        # Convert to MultiPolygon if it's a single Polygon
-        if isinstance(merged_geometry, Polygon):
-            merged_geometry = MultiPolygon([merged_geometry])
-        
-        # Create merged lake data
-        merged_lake_data = {
-            'dowlknum': dowlknum,
-            'geometry': merged_geometry,
-            'contour_count': len(intersecting_contours),
-            'depth_range': {
-                'min': float(intersecting_contours[BATHYMETRY_FIELDS['depth']].min()),
-                'max': float(intersecting_contours[BATHYMETRY_FIELDS['depth']].max())
-            },
-            'lake_name': intersecting_contours[BATHYMETRY_FIELDS['lake_name']].iloc[0] if len(intersecting_contours) > 0 and BATHYMETRY_FIELDS['lake_name'] in intersecting_contours.columns else None,
-            'original_contours': intersecting_contours
-        }
-        
-        logger.debug(f"Successfully merged {len(intersecting_contours)} contours for lake {dowlknum}")
-        return merged_lake_data
+    return _merge_intersecting_contours(dowlknum, bathymetry_gdf, contour_rows, union_strategy, grid_size)
+
+
+def _row_positions(lake_rows: Any, row_count: int) -> np.ndarray:
+    """
+    Convert lake index rows (slice or positions) to an array of row positions.
+    
+    Args:
+        lake_rows: Row positions or slice from a lake index
+        row_count: Number of rows in the indexed GeoDataFrame
+        
+    Returns:
+        Array of row positions
+    """
+    if isinstance(lake_rows, slice):
+        return np.arange(*lake_rows.indices(row_count))
+    return np.asarray(lake_rows, dtype=np.intp)
+
+
+def get_original_contours(lake_data: Dict[str, Any]) -> Optional[gpd.GeoDataFrame]:
+    """
+    Get the original contours a merged lake was built from.
+    
+    Merged lake records only hold the contours' row positions in the shared
+    bathymetry GeoDataFrame; the rows are materialized here when needed.
+    
+    Args:
+        lake_data: Merged lake data dictionary
+        
+    Returns:
+        GeoDataFrame of the lake's merged contours, or None if not available
+    """
+    contour_source = lake_data.get('contour_source')
+    if contour_source is None:
+        return None
+    return contour_source.iloc[lake_data['contour_rows']]
+
+
+def get_original_contour_geometries(lake_data: Dict[str, Any]) -> Optional[np.ndarray]:
+    """
+    Get the geometries of the original contours a merged lake was built from.
+    
+    Args:
+        lake_data: Merged lake data dictionary
+        
+    Returns:
+        Array of the lake's merged contour geometries, or None if not available
+    """
+    contour_source = lake_data.get('contour_source')
+    if contour_source is None:
+        return None
+    return contour_source.geometry.to_numpy()[lake_data['contour_rows']]
+
+
+def find_intersecting_contours(
+    contour_geometries: np.ndarray,
+    lake_outlines: Dict[str, Any],
+    bathymetry_index: Dict[str, Any]
+) -> Dict[str, np.ndarray]:
+    """
+    Find the contours of every lake that intersect its buffered outline in one pass.
+    
+    All outlines are buffered by BUFFER_DISTANCE_METERS in one vectorized call and
+    queried against an STRtree of the lakes' contours at once. The resulting
+    (lake, contour) pairs are kept only where the contour belongs to that lake, so
+    the result matches a per-lake intersects scan.
+    
+    Args:
+        contour_geometries: Array of all bathymetry contour geometries
+        lake_outlines: Mapping of DOWLKNUM to the lake's outline geometry
+        bathymetry_index: Mapping of DOWLKNUM to the row positions of its contours
+        
+    Returns:
+        Mapping of DOWLKNUM to the ascending row positions of its intersecting
+        contours (lakes without any are omitted)
+    """
+    dowlknums = list(lake_outlines)
+    buffered_outlines = shapely.buffer(
+        np.array(list(lake_outlines.values()), dtype=object), BUFFER_DISTANCE_METERS
+    )
+    
+    # Lake position of every contour (-1 for contours of other lakes)
+    contour_lakes = np.full(len(contour_geometries), -1, dtype=np.int64)
+    for lake_position, dowlknum in enumerate(dowlknums):
+        contour_lakes[bathymetry_index.get(dowlknum, slice(0, 0))] = lake_position
+    candidate_positions = np.flatnonzero(contour_lakes >= 0)
+    
+    # Candidate (lake, contour) pairs from one bulk STRtree query
+    tree = shapely.STRtree(contour_geometries[candidate_positions])
+    lake_index, contour_index = tree.query(buffered_outlines, predicate='intersects')
+    contour_positions = candidate_positions[contour_index]
+    
+    same_lake = contour_lakes[contour_positions] == lake_index
+    lake_index, contour_positions = lake_index[same_lake], contour_positions[same_lake]
+    order = np.lexsort((contour_positions, lake_index))
+    lake_index, contour_positions = lake_index[order], contour_positions[order]
+    
+    lake_starts = np.flatnonzero(np.r_[True, lake_index[1:] != lake_index[:-1]]) if len(lake_index) else []
+    lake_contours = {
+        dowlknums[lake_index[start]]: rows
+        for start, rows in zip(lake_starts, np.split(contour_positions, lake_starts[1:]))
+    }
+    
+    logger.info(
+        f"Found {len(contour_positions)} intersecting contours for {len(lake_contours)} of "
+        f"{len(dowlknums)} lakes"
+    )
+    return lake_contours
+
+
+def union_contours(
+    contours: np.ndarray,
+    union_strategy: Optional[str] = None,
+    grid_size: Optional[float] = None,
+    tiled: Optional[bool] = None,
+    tile_workers: Optional[int] = None
+) -> Any:
+    """
+    Union an array of contour geometries with the selected strategy.
+    
+    Args:
+        contours: Array of contour geometries
+        union_strategy: One of UNION_STRATEGIES (defaults to UNION_STRATEGY)
+        grid_size: Optional precision grid to snap the output to (defaults to UNION_GRID_SIZE)
+        tiled: Whether to use tiled_union; by default contours with more than
+            TILED_UNION_MIN_VERTICES vertices are tiled when more than one
+            tile worker is available
+        tile_workers: Threads for tiled_union (defaults to TILED_UNION_WORKERS,
+            then the CPU count)
+            
+    Returns:
+        The union geometry
+        
+    Raises:
+        ValueError: If the union strategy is unknown
+    """
+    union_strategy = union_strategy or UNION_STRATEGY
+    grid_size = grid_size if grid_size is not None else UNION_GRID_SIZE
+    
+    if union_strategy not in UNION_STRATEGIES:
+        raise ValueError(f"Unknown union strategy {union_strategy!r}, expected one of {UNION_STRATEGIES}")
+    
+    tile_workers = tile_workers or TILED_UNION_WORKERS or os.cpu_count() or 1
+    
+    # Tiling only pays off through parallel cells; on one thread it is slower
+    if tiled is None:
+        tiled = (
+            TILED_UNION_MIN_VERTICES is not None and tile_workers > 1 and len(contours) > 1
+            and shapely.get_num_coordinates(contours).sum() > TILED_UNION_MIN_VERTICES
+        )
+    if tiled:
+        return tiled_union(contours, union_strategy, grid_size, workers=tile_workers)
+    return _union_direct(contours, union_strategy, grid_size)
+
+
+def _union_direct(contours: np.ndarray, union_strategy: str, grid_size: Optional[float]) -> Any:
+    """
+    Union an array of contour geometries in a single call.
+    
+    Args:
+        contours: Array of contour geometries
+        union_strategy: One of UNION_STRATEGIES
+        grid_size: Optional precision grid to snap the output to
+        
+    Returns:
+        The union geometry
+    """
+    if union_strategy == 'coverage' and not _is_coverage(contours):
+        logger.debug("Contours are not a valid coverage, using union_all")
+        union_strategy = 'union_all'
+    
+    if union_strategy == 'union_all':
+        return shapely.union_all(contours, grid_size=grid_size)
+    
+    # unary_union and coverage_union_all take no grid_size, so their output is snapped instead
+    if union_strategy == 'coverage':
+        merged_geometry = shapely.coverage_union_all(contours)
+    else:
+        merged_geometry = unary_union(list(contours))
+    return merged_geometry if grid_size is None else shapely.set_precision(merged_geometry, grid_size)
+
+
+def tiled_union(
+    contours: np.ndarray,
+    union_strategy: Optional[str] = None,
+    grid_size: Optional[float] = None,
+    cells_per_side: Optional[int] = None,
+    workers: Optional[int] = None
+) -> Any:
+    """
+    Union a very large lake's contours cell by cell over a grid of its extent.
+    
+    Every contour is assigned whole to the grid cell holding the center of its
+    bounding box, so nothing is clipped and the result equals the direct union
+    up to floating point noding. The cells are unioned independently on a thread
+    pool (shapely releases the GIL), and the much smaller cell results are then
+    stitched with a final union.
+    
+    Args:
+        contours: Array of contour geometries
+        union_strategy: One of UNION_STRATEGIES (defaults to UNION_STRATEGY)
+        grid_size: Optional precision grid to snap the output to (defaults to UNION_GRID_SIZE)
+        cells_per_side: Grid cells along each side of the extent (defaults to
+            TILED_UNION_CELLS_PER_SIDE)
+        workers: Threads unioning cells (defaults to TILED_UNION_WORKERS, then the CPU count)
+        
+    Returns:
+        The union geometry
+    """
+    cells_per_side = cells_per_side or TILED_UNION_CELLS_PER_SIDE
+    workers = workers or TILED_UNION_WORKERS or os.cpu_count() or 1
+    
+    bounds = shapely.bounds(contours)
+    minx, miny = np.nanmin(bounds[:, 0]), np.nanmin(bounds[:, 1])
+    maxx, maxy = np.nanmax(bounds[:, 2]), np.nanmax(bounds[:, 3])
+    center_x = (bounds[:, 0] + bounds[:, 2]) / 2
+    center_y = (bounds[:, 1] + bounds[:, 3]) / 2
+    
+    column = np.clip(((center_x - minx) / max(maxx - minx, 1e-9) * cells_per_side).astype(np.intp), 0, cells_per_side - 1)
+    row = np.clip(((center_y - miny) / max(maxy - miny, 1e-9) * cells_per_side).astype(np.intp), 0, cells_per_side - 1)
+    cells = row * cells_per_side + column
+    
+    order = np.argsort(cells, kind='stable')
+    _, starts = np.unique(cells[order], return_index=True)
+    cell_contours = np.split(contours[order], starts[1:])
+    logger.debug(f"Tiled union of {len(contours)} contours over {len(cell_contours)} grid cells")
+    
+    def union_cell(group: np.ndarray) -> Any:
+        return _union_direct(group, union_strategy, grid_size)
+    
+    if workers == 1:
+        cell_unions = [union_cell(group) for group in cell_contours]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(cell_contours))) as executor:
+            cell_unions = list(executor.map(union_cell, cell_contours))
+    
+    return _union_direct(np.array(cell_unions, dtype=object), union_strategy, grid_size)
+
+
+def _is_coverage(contours: np.ndarray) -> bool:
+    """
+    Check whether contours form a valid polygonal coverage.
+    
+    Nested depth polygons overlap, so their areas add up to more than their common
+    bounding box; that check is O(n) and rejects them before the much slower
+    shapely.coverage_is_valid.
+    
+    Args:
+        contours: Array of contour geometries
+        
+    Returns:
+        True if the contours are non-overlapping, edge-matched polygons
+    """
+    minx, miny, maxx, maxy = shapely.total_bounds(contours)
+    if shapely.area(contours).sum() > (maxx - minx) * (maxy - miny):
+        return False
+    return bool(shapely.coverage_is_valid(contours))
+
+
+def _merge_intersecting_contours(
+    dowlknum: str,
+    bathymetry_gdf: gpd.GeoDataFrame,
+    contour_rows: np.ndarray,
+    union_strategy: Optional[str] = None,
+    grid_size: Optional[float] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Union a lake's intersecting contours into its merged lake data.
+    
+    Args:
+        dowlknum: DOWLKNUM of the lake
+        bathymetry_gdf: GeoDataFrame containing bathymetry contour data
+        contour_rows: Row positions of the lake's contours that intersect its buffered outline
+        union_strategy: One of UNION_STRATEGIES (defaults to UNION_STRATEGY)
+        grid_size: Optional precision grid for the union (defaults to UNION_GRID_SIZE)
         
+    Returns:
+        Dictionary containing merged lake data or None if merging failed
+    """
+    try:
+        merged_geometry = union_contours(bathymetry_gdf.geometry.to_numpy()[contour_rows], union_strategy, grid_size)
+        return _merged_lake_record(dowlknum, merged_geometry, bathymetry_gdf, contour_rows)
+    
     except Exception as e:
         logger.error(f"Error merging bathymetry for lake {dowlknum}: {e}")
         return None
 
 
+def _merged_lake_record(
+    dowlknum: str,
+    merged_geometry: Any,
+    bathymetry_gdf: gpd.GeoDataFrame,
+    contour_rows: np.ndarray
+) -> Optional[Dict[str, Any]]:
+    """
+    Build the merged lake data dictionary from a lake's merged geometry.
+    
+    The record references the merged contours by row position in bathymetry_gdf
+    ('contour_source' and 'contour_rows') rather than holding a copy of them;
+    use get_original_contours to materialize them.
+    
+    Args:
+        dowlknum: DOWLKNUM of the lake
+        merged_geometry: Union of the lake's intersecting contours
+        bathymetry_gdf: GeoDataFrame containing bathymetry contour data
+        contour_rows: Row positions of the contours that were merged
+        
+    Returns:
+        Dictionary containing merged lake data or None if the merged geometry is empty
+    """
+    # Ensure we have a valid geometry
+    if merged_geometry.is_empty:
+        logger.warning(f"Merged geometry is empty for lake {dowlknum}")
+        return None
+    
+    # Convert to MultiPolygon if it's a single Polygon
+    if isinstance(merged_geometry, Polygon):
+        merged_geometry = MultiPolygon([merged_geometry])
+    
+    # Depth statistics come from the current rows, also for cached geometries, since
+    # the merge key only covers the geometries
+    depths = float64_values(bathymetry_gdf[BATHYMETRY_FIELDS['depth']].iloc[contour_rows])
+    depth_range = {'min': float(np.nanmin(depths)), 'max': float(np.nanmax(depths))}
+    
+    lake_name = None
+    if len(contour_rows) > 0 and BATHYMETRY_FIELDS['lake_name'] in bathymetry_gdf.columns:
+        lake_name = bathymetry_gdf[BATHYMETRY_FIELDS['lake_name']].iloc[contour_rows[0]]
+    
+    # Create merged lake data
+    merged_lake_data = {
+        'dowlknum': dowlknum,
+        'geometry': merged_geometry,
+        'contour_count': len(contour_rows),
+        'depth_range': depth_range,
+        'lake_name': lake_name,
+        'contour_source': bathymetry_gdf,
+        'contour_rows': contour_rows
+    }
+    
+    logger.debug(f"Successfully merged {len(contour_rows)} contours for lake {dowlknum}")
+    return merged_lake_data
+
+
+def _merge_lake_wkb(
+    contours_wkb: np.ndarray,
+    union_strategy: Optional[str] = None,
+    grid_size: Optional[float] = None,
+    tile_workers: Optional[int] = None
+) -> bytes:
+    """
+    Union one lake's intersecting contours in a worker process.
+    
+    Geometries cross the process boundary as WKB, which is far cheaper to
+    serialize than a pickled GeoDataFrame.
+    
+    Args:
+        contours_wkb: WKB of the lake's intersecting contours
+        union_strategy: One of UNION_STRATEGIES (defaults to UNION_STRATEGY)
+        grid_size: Optional precision grid for the union (defaults to UNION_GRID_SIZE)
+        tile_workers: Threads for a tiled union of a very large lake
+        
+    Returns:
+        WKB of the merged geometry
+    """
+    return shapely.to_wkb(union_contours(
+        shapely.from_wkb(contours_wkb), union_strategy, grid_size, tile_workers=tile_workers
+    ))
+
+
 def merge_all_lakes(
     bathymetry_gdf: gpd.GeoDataFrame,
     fish_survey_gdf: gpd.GeoDataFrame,
-    matching_dowlknums: List[str]
+    matching_dowlknums: List[str],
+    bathymetry_index: Optional[Dict[str, Any]] = None,
+    fish_survey_index: Optional[Dict[str, Any]] = None,
+    parallel: bool = False,
+    workers: Optional[int] = None,
+    union_strategy: Optional[str] = None,
+    grid_size: Optional[float] = None,
+    use_cache: bool = True
 ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
     """
     Merge bathymetry contours for all matching lakes.
     
+    The contours to merge are found for all lakes at once by
+    find_intersecting_contours. Lakes whose contours, outline and merge settings
+    are unchanged are read from the merge cache, and only cache misses are
+    unioned. With parallel=True the unions run in a process pool (see
+    _merge_lakes_parallel); the merged lakes are returned in the order of
+    matching_dowlknums either way.
+    
     Args:
         bathymetry_gdf: GeoDataFrame containing bathymetry contour data
         fish_survey_gdf: GeoDataFrame containing fish survey lake data
         matching_dowlknums: List of DOWLKNUMs to process
+        bathymetry_index: Optional mapping of DOWLKNUM to the row positions of its
+            contours in bathymetry_gdf (from build_lake_index or load_bathymetry_store);
+            built here when not given
+        fish_survey_index: Optional mapping of DOWLKNUM to the row positions of its
+            outlines in fish_survey_gdf; built here when not given
+        parallel: Whether to merge lakes in worker processes
+        workers: Number of worker processes (defaults to MERGE_WORKERS, then os.cpu_count())
+        union_strategy: One of UNION_STRATEGIES (defaults to UNION_STRATEGY)
+        grid_size: Optional precision grid for the union (defaults to UNION_GRID_SIZE)
+        use_cache: Whether to read merged lakes from (and save them to) the merge cache
         
     Returns:
         Tuple of (merged_lakes, processing_stats)
     """
     logger.info(f"Starting bathymetry merging for {len(matching_dowlknums)} lakes...")
     
-    merged_lakes = []
+    union_strategy = union_strategy or UNION_STRATEGY
+    grid_size = grid_size if grid_size is not None else UNION_GRID_SIZE
+    
     processing_stats = {
         'total_lakes': len(matching_dowlknums),
         'successful_merges': 0,
@@ -119,113 +505,707 @@ def merge_all_lakes(
         'error_details': []
     }
     
-    # Process each lake
-    for i, dowlknum in enumerate(matching_dowlknums):
-        if (i + 1) % 100 == 0:
-            logger.info(f"Processed {i + 1}/{len(matching_dowlknums)} lakes...")
+    # Each lake's rows are looked up in an index built once rather than by a
+    # full-column scan per lake
+    if bathymetry_index is None:
+        bathymetry_index = build_lake_index(bathymetry_gdf, BATHYMETRY_FIELDS['dowlknum'])
+    if fish_survey_index is None:
+        fish_survey_index = build_lake_index(fish_survey_gdf, FISH_SURVEY_FIELDS['dowlknum'])
+    
+    # Fish survey rows of each lake
+    lake_fish_surveys = {}
+    for dowlknum in matching_dowlknums:
+        lake_fish_survey = fish_survey_gdf.iloc[fish_survey_index.get(dowlknum, [])]
         
-        try:
-            # Get fish survey geometry for this lake
-            fish_survey_field = FISH_SURVEY_FIELDS['dowlknum']
-            lake_mask = fish_survey_gdf[fish_survey_field].astype(str) == dowlknum
-            lake_fish_survey = fish_survey_gdf[lake_mask]
+        if len(lake_fish_survey) == 0:
+            logger.warning(f"No fish survey data found for lake {dowlknum}")
+            processing_stats['failed_merges'] += 1
+            processing_stats['error_details'].append(f"Lake {dowlknum}: No fish survey data")
+            continue
+        
+        lake_fish_surveys[dowlknum] = lake_fish_survey
+    
+    # Intersecting contours of every lake from one bulk spatial query
+    lake_outlines = {dowlknum: _lake_outline(lake_fish_survey) for dowlknum, lake_fish_survey in lake_fish_surveys.items()}
+    contour_geometries = bathymetry_gdf.geometry.to_numpy()
+    lake_contours = find_intersecting_contours(contour_geometries, lake_outlines, bathymetry_index)
+    
+    for dowlknum in lake_fish_surveys:
+        if dowlknum not in lake_contours:
+            _log_missing_contours(dowlknum, bathymetry_gdf, bathymetry_index)
+            processing_stats['failed_merges'] += 1
+    
+    # Lakes with unchanged merge inputs are read back from the merge cache
+    merged_by_dowlknum = {}
+    lakes_to_merge = lake_contours
+    if use_cache:
+        merge_keys = compute_merge_keys(contour_geometries, lake_contours, lake_outlines, union_strategy, grid_size)
+        merge_cache = load_merge_cache()
+        
+        for dowlknum, rows in lake_contours.items():
+            cache_entry = merge_cache.get(merge_keys[dowlknum])
+            if cache_entry is None:
+                continue
+            
+            merged_lake_data = _merged_lake_record(
+                dowlknum,
+                shapely.from_wkb(cache_entry['geometry']),
+                bathymetry_gdf,
+                rows
+            )
+            _add_fish_survey_metadata(merged_lake_data, lake_fish_surveys[dowlknum])
+            merged_by_dowlknum[dowlknum] = merged_lake_data
+            processing_stats['successful_merges'] += 1
+        
+        lakes_to_merge = {dowlknum: rows for dowlknum, rows in lake_contours.items() if dowlknum not in merged_by_dowlknum}
+        processing_stats['cache_hits'] = len(merged_by_dowlknum)
+        processing_stats['cache_misses'] = len(lakes_to_merge)
+        processing_stats['cache_hit_rate'] = len(merged_by_dowlknum) / len(lake_contours) if lake_contours else 0.0
+        logger.info(
+            f"Merge cache: {processing_stats['cache_hits']} hits, {processing_stats['cache_misses']} misses "
+            f"({processing_stats['cache_hit_rate'] * 100:.1f}% hit rate)"
+        )
+    
+    if parallel and lakes_to_merge:
+        merged_by_dowlknum.update(_merge_lakes_parallel(
+            bathymetry_gdf, lake_fish_surveys, lakes_to_merge, processing_stats, workers,
+            union_strategy, grid_size
+        ))
+    else:
+        # Process each lake
+        for i, dowlknum in enumerate(lakes_to_merge):
+            if (i + 1) % 100 == 0:
+                logger.info(f"Processed {i + 1}/{len(lakes_to_merge)} lakes...")
             
-            if len(lake_fish_survey) == 0:
+            try:
+                merged_lake_data = _merge_intersecting_contours(
+                    dowlknum, bathymetry_gdf, lakes_to_merge[dowlknum], union_strategy, grid_size
+                )
+                
+                if merged_lake_data is None:
+                    processing_stats['failed_merges'] += 1
+                    continue
+                
+                _add_fish_survey_metadata(merged_lake_data, lake_fish_surveys[dowlknum])
+                merged_by_dowlknum[dowlknum] = merged_lake_data
+                processing_stats['successful_merges'] += 1
+            
+            except Exception as e:
+                logger.error(f"Error processing lake {dowlknum}: {e}")
+                processing_stats['failed_merges'] += 1
+                processing_stats['error_details'].append(f"Lake {dowlknum}: {str(e)}")
+    
+    if use_cache:
+        for dowlknum in lakes_to_merge:
+            if dowlknum in merged_by_dowlknum:
+                merge_cache[merge_keys[dowlknum]] = make_cache_entry(merged_by_dowlknum[dowlknum])
+        save_merge_cache(merge_cache, [merge_keys[dowlknum] for dowlknum in merged_by_dowlknum])
+    
+    _log_merge_stats(processing_stats)
+    return [merged_by_dowlknum[dowlknum] for dowlknum in lake_contours if dowlknum in merged_by_dowlknum], processing_stats
+
+
+def _log_missing_contours(
+    dowlknum: str,
+    bathymetry_gdf: gpd.GeoDataFrame,
+    bathymetry_index: Dict[str, Any]
+) -> None:
+    """
+    Log why a lake has no contours to merge.
+    
+    Args:
+        dowlknum: DOWLKNUM of the lake
+        bathymetry_gdf: GeoDataFrame containing bathymetry contour data
+        bathymetry_index: Mapping of DOWLKNUM to the row positions of its contours
+    """
+    lake_rows = _row_positions(bathymetry_index.get(dowlknum, []), len(bathymetry_gdf))
+    
+    if len(lake_rows) == 0:
+        logger.warning(f"No bathymetry contours found for lake {dowlknum}")
+    else:
+        logger.warning(f"No intersecting bathymetry contours found for lake {dowlknum}")
+
+
+def _merge_lakes_parallel(
+    bathymetry_gdf: gpd.GeoDataFrame,
+    lake_fish_surveys: Dict[str, gpd.GeoDataFrame],
+    lake_contours: Dict[str, np.ndarray],
+    processing_stats: Dict[str, Any],
+    workers: Optional[int] = None,
+    union_strategy: Optional[str] = None,
+    grid_size: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Merge lakes in a process pool, updating processing_stats in place.
+    
+    Lakes are submitted longest-first by contour vertex count so the largest lakes
+    (Mille Lacs, Red Lake) start early instead of becoming the tail. At most
+    MERGE_TASKS_PER_WORKER lakes per worker are in flight, so only their contours
+    are held as WKB, and results are collected as they finish.
+    
+    Args:
+        bathymetry_gdf: GeoDataFrame containing bathymetry contour data
+        lake_fish_surveys: Mapping of DOWLKNUM to the lake's fish survey rows
+        lake_contours: Mapping of DOWLKNUM to the row positions of its intersecting
+            contours, from find_intersecting_contours
+        processing_stats: Statistics dictionary of merge_all_lakes
+        workers: Number of worker processes (defaults to MERGE_WORKERS, then os.cpu_count())
+        union_strategy: One of UNION_STRATEGIES (defaults to UNION_STRATEGY)
+        grid_size: Optional precision grid for the union (defaults to UNION_GRID_SIZE)
+        
+    Returns:
+        Mapping of DOWLKNUM to merged lake data dictionary
+    """
+    workers = workers or MERGE_WORKERS or os.cpu_count() or 1
+    # Split the cores between the processes so tiled unions inside them do not
+    # run more union threads than there are cores
+    tile_workers = max(1, (os.cpu_count() or 1) // workers)
+    contour_geometries = bathymetry_gdf.geometry.to_numpy()
+    vertex_counts = shapely.get_num_coordinates(contour_geometries)
+    
+    tasks = sorted(lake_contours, key=lambda dowlknum: vertex_counts[lake_contours[dowlknum]].sum(), reverse=True)
+    logger.info(f"Merging {len(tasks)} lakes with {workers} worker processes (largest lake first)")
+    
+    merged_by_dowlknum = {}
+    pending = {}
+    task_iter = iter(tasks)
+    completed = 0
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        def submit_next() -> bool:
+            dowlknum = next(task_iter, None)
+            if dowlknum is None:
+                return False
+            contours_wkb = shapely.to_wkb(contour_geometries[lake_contours[dowlknum]])
+            pending[executor.submit(_merge_lake_wkb, contours_wkb, union_strategy, grid_size, tile_workers)] = dowlknum
+            return True
+        
+        for _ in range(workers * MERGE_TASKS_PER_WORKER):
+            if not submit_next():
+                break
+        
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                dowlknum = pending.pop(future)
+                submit_next()
+                
+                try:
+                    merged_lake_data = _merged_lake_record(
+                        dowlknum,
+                        shapely.from_wkb(future.result()),
+                        bathymetry_gdf,
+                        lake_contours[dowlknum]
+                    )
+                    
+                    if merged_lake_data is None:
+                        processing_stats['failed_merges'] += 1
+                    else:
+                        _add_fish_survey_metadata(merged_lake_data, lake_fish_surveys[dowlknum])
+                        merged_by_dowlknum[dowlknum] = merged_lake_data
+                        processing_stats['successful_merges'] += 1
+                
+                except Exception as e:
+                    logger.error(f"Error processing lake {dowlknum}: {e}")
+                    processing_stats['failed_merges'] += 1
+                    processing_stats['error_details'].append(f"Lake {dowlknum}: {str(e)}")
+                
+                completed += 1
+                if completed % 100 == 0:
+                    logger.info(f"Processed {completed}/{len(tasks)} lakes...")
+    
+    return merged_by_dowlknum
+
+
+def _log_merge_stats(processing_stats: Dict[str, Any]) -> None:
+    """
+    Log the final statistics of merge_all_lakes.
+    
+    Args:
+        processing_stats: Statistics dictionary of merge_all_lakes
+    """
+    logger.info(f"Merging completed:")
+    logger.info(f"  Successful: {processing_stats['successful_merges']}")
+    logger.info(f"  Failed: {processing_stats['failed_merges']}")
+    logger.info(f"  Success rate: {(processing_stats['successful_merges'] / processing_stats['total_lakes']) * 100:.1f}%")
+
+
+def merge_lake_groups(
+    lake_groups: Iterable[Tuple[str, gpd.GeoDataFrame]],
+    fish_survey_gdf: gpd.GeoDataFrame,
+    matching_dowlknums: Optional[Set[str]] = None,
+    union_strategy: Optional[str] = None,
+    grid_size: Optional[float] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Merge bathymetry contours for a stream of per-lake contour groups.
+    
+    This is the streaming counterpart of merge_all_lakes: lakes are merged as they
+    arrive from iter_lake_groups, so the full bathymetry dataset never has to be
+    held in memory.
+    
+    Args:
+        lake_groups: Iterable of (dowlknum, lake_contours_gdf) tuples
+        fish_survey_gdf: GeoDataFrame containing fish survey lake data
+        matching_dowlknums: Optional set of DOWLKNUMs to process (other lakes are skipped)
+        union_strategy: One of UNION_STRATEGIES (defaults to UNION_STRATEGY)
+        grid_size: Optional precision grid for the union (defaults to UNION_GRID_SIZE)
+        
+    Returns:
+        Tuple of (merged_lakes, processing_stats)
+    """
+    logger.info("Starting streaming bathymetry merging...")
+    
+    merged_lakes = []
+    processing_stats = {
+        'total_lakes': 0,
+        'successful_merges': 0,
+        'failed_merges': 0,
+        'lakes_with_no_contours': 0,
+        'lakes_with_no_intersection': 0,
+        'error_details': []
+    }
+    
+    fish_survey_index = build_lake_index(fish_survey_gdf, FISH_SURVEY_FIELDS['dowlknum'])
+    
+    for dowlknum, lake_bathymetry in lake_groups:
+        if matching_dowlknums is not None and dowlknum not in matching_dowlknums:
+            continue
+        
+        processing_stats['total_lakes'] += 1
+        if processing_stats['total_lakes'] % 100 == 0:
+            logger.info(f"Processed {processing_stats['total_lakes']} lakes...")
+        
+        try:
+            if dowlknum not in fish_survey_index:
                 logger.warning(f"No fish survey data found for lake {dowlknum}")
                 processing_stats['failed_merges'] += 1
                 processing_stats['error_details'].append(f"Lake {dowlknum}: No fish survey data")
                 continue
             
-            fish_survey_geometry = lake_fish_survey.geometry.iloc[0]
-            
-            # Merge bathymetry for this lake
+            lake_fish_survey = fish_survey_gdf.iloc[fish_survey_index[dowlknum]]
             merged_lake_data = merge_bathymetry_for_lake(
-                bathymetry_gdf, fish_survey_geometry, dowlknum
+                lake_bathymetry, _lake_outline(lake_fish_survey), dowlknum, slice(None),
+                union_strategy, grid_size
             )
             
             if merged_lake_data is None:
                 processing_stats['failed_merges'] += 1
                 continue
             
-            # Add fish survey metadata to the merged lake data
-            merged_lake_data.update({
-                'acres': lake_fish_survey[FISH_SURVEY_FIELDS['acres']].iloc[0],
-                'city_name': lake_fish_survey[FISH_SURVEY_FIELDS['city_name']].iloc[0],
-                'survey_url': lake_fish_survey[FISH_SURVEY_FIELDS['survey_url']].iloc[0]
-            })
-            
-            # Add lake name from fish survey if not available from bathymetry
-            if not merged_lake_data.get('lake_name') and 'PW_BASIN_N' in lake_fish_survey.columns:
-                merged_lake_data['lake_name'] = lake_fish_survey['PW_BASIN_N'].iloc[0]
-            
+            _add_fish_survey_metadata(merged_lake_data, lake_fish_survey)
             merged_lakes.append(merged_lake_data)
             processing_stats['successful_merges'] += 1
-            
+        
         except Exception as e:
             logger.error(f"Error processing lake {dowlknum}: {e}")
             processing_stats['failed_merges'] += 1
             processing_stats['error_details'].append(f"Lake {dowlknum}: {str(e)}")
     
     # Log final statistics
-    logger.info(f"Merging completed:")
+    logger.info(f"Streaming merge completed:")
     logger.info(f"  Successful: {processing_stats['successful_merges']}")
     logger.info(f"  Failed: {processing_stats['failed_merges']}")
-    logger.info(f"  Success rate: {(processing_stats['successful_merges'] / len(matching_dowlknums)) * 100:.1f}%")
     
     return merged_lakes, processing_stats
 
 
-def create_merged_geodataframe(
+def build_depth_bands(
+    contours: np.ndarray,
+    depths: np.ndarray,
+    interval: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Build filled, non-overlapping depth-band polygons from a lake's contours.
+    
+    Each contour polygon covers the water at least as deep as its depth. The
+    contours are rounded down to the band interval and unioned per level, the
+    levels are accumulated from the deepest up so each covers all deeper water,
+    and every band is its level minus the next deeper one. The unions and
+    differences are vectorized shapely calls over the whole lake; Python only
+    loops over the band levels, never over individual contours.
+    
+    Args:
+        contours: Array of the lake's contour polygons
+        depths: Depth of each contour in feet (the sign is ignored)
+        interval: Band width in feet (defaults to DEPTH_BAND_INTERVAL_FEET)
+        
+    Returns:
+        List of bands, shallowest first, each with min_depth, max_depth (None for
+        the deepest band, which covers everything below its min_depth) and geometry
+        
+    Raises:
+        ValueError: If the interval is not positive
+    """
+    interval = _band_interval(interval)
+    contours = np.asarray(contours, dtype=object)
+    depths = np.abs(np.asarray(depths, dtype=float))
+    
+    usable = ~shapely.is_missing(contours) & ~shapely.is_empty(contours) & np.isfinite(depths)
+    contours, depths = contours[usable], depths[usable]
+    if len(contours) == 0:
+        return []
+    
+    # Band on an integer index so fractional intervals do not push a contour lying
+    # on a band edge (5.1 / 0.1 = 50.99999999999999) into the band below
+    band_index = np.floor(np.round(depths / interval, 9))
+    order = np.argsort(band_index, kind='stable')
+    band_indices, starts = np.unique(band_index[order], return_index=True)
+    band_levels = np.round(band_indices * interval, _interval_decimals(interval))
+    covered = np.empty(len(band_levels), dtype=object)
+    covered[:] = [shapely.union_all(group) for group in np.split(contours[order], starts[1:])]
+    
+    # Accumulate from the deepest level up so each level covers all deeper water
+    for i in range(len(covered) - 2, -1, -1):
+        covered[i] = shapely.union(covered[i], covered[i + 1])
+    
+    band_geometries = np.append(shapely.difference(covered[:-1], covered[1:]), covered[-1:])
+    max_depths = [float(level) for level in band_levels[1:]] + [None]
+    
+    return [
+        {'min_depth': float(min_depth), 'max_depth': max_depth, 'geometry': geometry}
+        for min_depth, max_depth, geometry in zip(band_levels, max_depths, band_geometries)
+        if not geometry.is_empty
+    ]
+
+
+def _band_interval(interval: Optional[float]) -> float:
+    """
+    Resolve and validate a depth band width.
+    
+    Args:
+        interval: Band width in feet, or None for DEPTH_BAND_INTERVAL_FEET
+        
+    Returns:
+        The band width
+        
+    Raises:
+        ValueError: If the interval is not positive
+    """
+    interval = DEPTH_BAND_INTERVAL_FEET if interval is None else interval
+    if not interval > 0:
+        raise ValueError(f"Depth band interval must be positive, got {interval}")
+    return float(interval)
+
+
+def _interval_decimals(interval: float) -> int:
+    """Get the number of decimal places of a band width (1 for 0.1, 0 for 5)."""
+    return max(0, -Decimal(repr(interval)).normalize().as_tuple().exponent)
+
+
+def build_lake_depth_bands(
     merged_lakes: List[Dict[str, Any]],
-    fish_survey_gdf: gpd.GeoDataFrame
+    interval: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Add depth-band polygons built from the original contours to every merged lake.
+    
+    Each record gets a 'depth_bands' list from build_depth_bands; lakes whose
+    contours are not available get an empty list.
+    
+    Args:
+        merged_lakes: List of merged lake data dictionaries (updated in place)
+        interval: Band width in feet (defaults to DEPTH_BAND_INTERVAL_FEET)
+        
+    Returns:
+        Dictionary containing depth band statistics
+        
+    Raises:
+        ValueError: If the interval is not positive
+    """
+    interval = _band_interval(interval)
+    depth_field = BATHYMETRY_FIELDS['depth']
+    
+    depth_band_stats = {
+        'interval': interval,
+        'lakes_with_bands': 0,
+        'band_count': 0,
+        'vertex_count': 0
+    }
+    
+    for lake_data in merged_lakes:
+        contours = get_original_contour_geometries(lake_data)
+        if contours is None or len(contours) == 0:
+            lake_data['depth_bands'] = []
+            continue
+        
+        depths = float64_values(lake_data['contour_source'][depth_field].iloc[lake_data['contour_rows']])
+        lake_data['depth_bands'] = build_depth_bands(contours, depths, interval)
+        
+        if lake_data['depth_bands']:
+            depth_band_stats['lakes_with_bands'] += 1
+            depth_band_stats['band_count'] += len(lake_data['depth_bands'])
+            depth_band_stats['vertex_count'] += int(shapely.get_num_coordinates(
+                [band['geometry'] for band in lake_data['depth_bands']]
+            ).sum())
+    
+    logger.info(
+        f"Built {depth_band_stats['band_count']} depth bands ({interval:g} ft) for "
+        f"{depth_band_stats['lakes_with_bands']}/{len(merged_lakes)} lakes"
+    )
+    return depth_band_stats
+
+
+def _lake_outline(lake_fish_survey: gpd.GeoDataFrame) -> Polygon:
+    """
+    Get the outline geometry of a lake from its fish survey rows.
+    
+    Args:
+        lake_fish_survey: Fish survey rows of the lake
+        
+    Returns:
+        Union of all basin outlines for lakes grouped by parent lake, otherwise
+        the outline of the first row
+    """
+    if BASIN_KEY_FIELD in lake_fish_survey.columns and len(lake_fish_survey) > 1:
+        return lake_fish_survey.geometry.union_all()
+    return lake_fish_survey.geometry.iloc[0]
+
+
+def _add_fish_survey_metadata(
+    merged_lake_data: Dict[str, Any],
+    lake_fish_survey: gpd.GeoDataFrame
+) -> None:
+    """
+    Add fish survey metadata to a merged lake record in place.
+    
+    For lakes grouped by parent lake the basins' acres are summed and their
+    DOWLKNUMs recorded as 'basin_dowlknums'; otherwise the first row is used.
+    
+    Args:
+        merged_lake_data: Merged lake data dictionary
+        lake_fish_survey: Fish survey rows of the lake
+    """
+    merged_lake_data.update({
+        'acres': lake_fish_survey[FISH_SURVEY_FIELDS['acres']].iloc[0],
+        'city_name': lake_fish_survey[FISH_SURVEY_FIELDS['city_name']].iloc[0],
+        'survey_url': lake_fish_survey[FISH_SURVEY_FIELDS['survey_url']].iloc[0]
+    })
+    
+    if BASIN_KEY_FIELD in lake_fish_survey.columns:
+        basins = lake_fish_survey.drop_duplicates(BASIN_KEY_FIELD)
+        merged_lake_data['acres'] = float(basins[FISH_SURVEY_FIELDS['acres']].sum())
+        merged_lake_data['basin_dowlknums'] = sorted(str(basin) for basin in basins[BASIN_KEY_FIELD].dropna())
+    
+    # Add lake name from fish survey if not available from bathymetry
+    if not merged_lake_data.get('lake_name') and 'PW_BASIN_N' in lake_fish_survey.columns:
+        merged_lake_data['lake_name'] = lake_fish_survey['PW_BASIN_N'].iloc[0]
+
+
+def create_merged_geodataframe(
+    merged_lakes: Union[List[Dict[str, Any]], pd.DataFrame],
+    fish_survey_gdf: gpd.GeoDataFrame,
+    fish_survey_index: Optional[Dict[str, Any]] = None,
+    geometries: Optional[Any] = None
 ) -> gpd.GeoDataFrame:
     """
     Create a GeoDataFrame from the merged lake data.
     
+    The frame is built column by column from a geometry array and an attribute
+    frame, and joined once against the first outline row of each lake, instead of
+    looking up the fish survey rows lake by lake. Lakes without an outline are
+    left out.
+    
     Args:
-        merged_lakes: List of merged lake data dictionaries
+        merged_lakes: List of merged lake data dictionaries, or a columnar DataFrame
+            with the output attribute columns (dowlknum, lake_name, contour_count,
+            min_depth, max_depth, acres, city_name, survey_url and optionally
+            basin_dowlknums)
         fish_survey_gdf: Original fish survey GeoDataFrame for additional metadata
-        
+        fish_survey_index: Optional mapping of DOWLKNUM to the row positions of its
+            outlines in fish_survey_gdf; built here when not given
+        geometries: Optional lake geometries in the order of merged_lakes, as a
+            shapely geometry array, a (geometry_type, coords, offsets) tuple from
+            shapely.to_ragged_array, or a GeoArrow array; taken from merged_lakes
+            when not given
+            
     Returns:
         GeoDataFrame containing merged lake geometries and metadata
     """
     logger.info(f"Creating GeoDataFrame from {len(merged_lakes)} merged lakes...")
     
-    # Prepare data for GeoDataFrame
-    data = []
-    for lake_data in merged_lakes:
-        # Get additional metadata from fish survey data
-        fish_survey_field = FISH_SURVEY_FIELDS['dowlknum']
-        lake_mask = fish_survey_gdf[fish_survey_field].astype(str) == lake_data['dowlknum']
-        fish_survey_row = fish_survey_gdf[lake_mask]
-        
-        if len(fish_survey_row) > 0:
-            # Get lake name from fish survey data if available
-            lake_name = lake_data.get('lake_name')
-            if not lake_name and 'PW_BASIN_N' in fish_survey_row.columns:
-                lake_name = fish_survey_row['PW_BASIN_N'].iloc[0]
-            
-            row_data = {
-                'dowlknum': lake_data['dowlknum'],
-                'geometry': lake_data['geometry'],
-                'lake_name': lake_name,
-                'contour_count': lake_data['contour_count'],
-                'min_depth': lake_data['depth_range']['min'],
-                'max_depth': lake_data['depth_range']['max'],
-                'acres': lake_data['acres'],
-                'city_name': lake_data['city_name'],
-                'survey_url': lake_data['survey_url']
-            }
-            data.append(row_data)
-    
-    # Create GeoDataFrame
-    if data:
-        merged_gdf = gpd.GeoDataFrame(data, crs=fish_survey_gdf.crs)
-        logger.info(f"Created GeoDataFrame with {len(merged_gdf)} lakes")
-        return merged_gdf
-    else:
+    if fish_survey_index is None:
+        fish_survey_index = build_lake_index(fish_survey_gdf, FISH_SURVEY_FIELDS['dowlknum'])
+    
+    attributes = _merged_lake_attributes(merged_lakes)
+    geometry_array = _lake_geometry_array(merged_lakes if geometries is None else geometries)
+    attributes['_position'] = np.arange(len(attributes))
+    
+    # One join against the first outline row of every lake
+    outline_rows = np.array([rows[0] for rows in fish_survey_index.values()], dtype=np.intp)
+    outlines = pd.DataFrame({'dowlknum': list(fish_survey_index.keys())})
+    if 'PW_BASIN_N' in fish_survey_gdf.columns:
+        outlines['_basin_name'] = fish_survey_gdf['PW_BASIN_N'].to_numpy()[outline_rows]
+    attributes = attributes.merge(outlines, on='dowlknum', how='inner')
+    
+    # Get lake name from fish survey data if not available from bathymetry
+    if '_basin_name' in attributes.columns:
+        missing_name = attributes['lake_name'].isna() | (attributes['lake_name'] == '')
+        attributes['lake_name'] = attributes['lake_name'].where(~missing_name, attributes['_basin_name'])
+    
+    if len(attributes) == 0:
         logger.warning("No data to create GeoDataFrame")
         return gpd.GeoDataFrame()
+    
+    merged_gdf = gpd.GeoDataFrame(
+        attributes[[column for column in MERGED_LAKE_COLUMNS if column in attributes.columns]],
+        geometry=geometry_array[attributes['_position'].to_numpy()],
+        crs=fish_survey_gdf.crs
+    )
+    merged_gdf = merged_gdf[['dowlknum', 'geometry', *merged_gdf.columns.drop(['dowlknum', 'geometry'])]]
+    logger.info(f"Created GeoDataFrame with {len(merged_gdf)} lakes")
+    return merged_gdf
+
+
+def _merged_lake_attributes(merged_lakes: Union[List[Dict[str, Any]], pd.DataFrame]) -> pd.DataFrame:
+    """
+    Build the columnar attribute frame of the merged lakes.
+    
+    Args:
+        merged_lakes: List of merged lake data dictionaries or a columnar DataFrame
+        
+    Returns:
+        DataFrame with one column per MERGED_LAKE_COLUMNS entry present in the input
+    """
+    if isinstance(merged_lakes, pd.DataFrame):
+        columns = [column for column in MERGED_LAKE_COLUMNS if column in merged_lakes.columns]
+        return merged_lakes[columns].reset_index(drop=True)
+    
+    attributes = pd.DataFrame({
+        'dowlknum': [lake_data['dowlknum'] for lake_data in merged_lakes],
+        'lake_name': [lake_data.get('lake_name') for lake_data in merged_lakes],
+        'contour_count': [lake_data['contour_count'] for lake_data in merged_lakes],
+        'min_depth': [lake_data['depth_range']['min'] for lake_data in merged_lakes],
+        'max_depth': [lake_data['depth_range']['max'] for lake_data in merged_lakes],
+        'acres': [lake_data.get('acres') for lake_data in merged_lakes],
+        'city_name': [lake_data.get('city_name') for lake_data in merged_lakes],
+        'survey_url': [lake_data.get('survey_url') for lake_data in merged_lakes]
+    })
+    if any('basin_dowlknums' in lake_data for lake_data in merged_lakes):
+        attributes['basin_dowlknums'] = [
+            ",".join(lake_data['basin_dowlknums']) if 'basin_dowlknums' in lake_data else None
+            for lake_data in merged_lakes
+        ]
+    return attributes
+
+
+def _lake_geometry_array(geometries: Any) -> np.ndarray:
+    """
+    Convert lake geometries from any supported input to a shapely geometry array.
+    
+    Args:
+        geometries: List of merged lake data dictionaries, DataFrame with a
+            'geometry' column, (geometry_type, coords, offsets) ragged tuple,
+            GeoArrow array or sequence of shapely geometries
+            
+    Returns:
+        Array of shapely geometries
+    """
+    if isinstance(geometries, pd.DataFrame):
+        return np.asarray(geometries['geometry'].to_numpy(), dtype=object)
+    if isinstance(geometries, tuple):
+        return shapely.from_ragged_array(*geometries)
+    if hasattr(geometries, '__arrow_c_array__') or hasattr(geometries, '__arrow_c_stream__'):
+        return gpd.GeoSeries.from_arrow(geometries).to_numpy()
+    
+    geometry_array = np.empty(len(geometries), dtype=object)
+    geometry_array[:] = [
+        geometry['geometry'] if isinstance(geometry, dict) else geometry for geometry in geometries
+    ]
+    return geometry_array
+
+
+def repair_merged_geometries(
+    merged_lakes: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Repair invalid merged geometries and normalize every geometry to a MultiPolygon.
+    
+    Invalid geometries are fixed with shapely.make_valid, and any geometry that is
+    not a MultiPolygon afterwards (a Polygon, or a GeometryCollection left by the
+    repair) is rebuilt from its polygonal parts. Both steps are vectorized over
+    all lakes; lines and points produced by the repair are dropped.
+    
+    Args:
+        merged_lakes: List of merged lake data dictionaries (updated in place)
+        
+    Returns:
+        Dictionary containing repair statistics
+    """
+    logger.info("Repairing merged geometries...")
+    
+    geometries = _merged_geometry_array(merged_lakes)
+    invalid = ~shapely.is_valid(geometries) & ~shapely.is_missing(geometries)
+    
+    repaired = geometries.copy()
+    repaired[invalid] = shapely.make_valid(geometries[invalid])
+    not_multipolygon = shapely.get_type_id(repaired) != shapely.GeometryType.MULTIPOLYGON
+    repaired[not_multipolygon] = _to_multipolygons(repaired[not_multipolygon])
+    
+    changed = np.flatnonzero(invalid | not_multipolygon)
+    for i in changed:
+        merged_lakes[i]['geometry'] = repaired[i]
+    
+    emptied = shapely.is_empty(repaired[changed]) & ~shapely.is_empty(geometries[changed])
+    repair_stats = {
+        'total_lakes': len(merged_lakes),
+        'repaired_lakes': int(len(changed)),
+        'made_valid': int(invalid.sum()),
+        'type_normalized': int(not_multipolygon.sum()),
+        'still_invalid': int((~shapely.is_valid(repaired[changed])).sum()),
+        'emptied': int(emptied.sum()),
+        'repaired_dowlknums': [merged_lakes[i]['dowlknum'] for i in changed]
+    }
+    
+    logger.info(
+        f"Geometry repair complete: {repair_stats['repaired_lakes']} lakes repaired "
+        f"({repair_stats['made_valid']} made valid, {repair_stats['type_normalized']} normalized to MultiPolygon)"
+    )
+    if repair_stats['still_invalid'] or repair_stats['emptied']:
+        logger.warning(
+            f"{repair_stats['still_invalid']} repaired geometries are still invalid, "
+            f"{repair_stats['emptied']} have no polygonal parts left"
+        )
+    
+    return repair_stats
+
+
+def _to_multipolygons(geometries: np.ndarray) -> np.ndarray:
+    """
+    Rebuild geometries as MultiPolygons from their polygonal parts.
+    
+    Args:
+        geometries: Array of geometries (polygons, multipolygons or collections)
+        
+    Returns:
+        Array of MultiPolygons, empty where a geometry has no polygonal parts
+    """
+    # Two levels of parts reach the polygons of a MultiPolygon inside a GeometryCollection
+    parts, owners = shapely.get_parts(geometries, return_index=True)
+    parts, part_owners = shapely.get_parts(parts, return_index=True)
+    owners = owners[part_owners]
+    polygonal = shapely.get_type_id(parts) == shapely.GeometryType.POLYGON
+    
+    multipolygons = np.empty(len(geometries), dtype=object)
+    multipolygons[:] = MultiPolygon()
+    if polygonal.any():
+        shapely.multipolygons(parts[polygonal], indices=owners[polygonal], out=multipolygons)
+    return multipolygons
+
+
+def _merged_geometry_array(merged_lakes: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Collect the merged geometries of all lakes into one array.
+    
+    Args:
+        merged_lakes: List of merged lake data dictionaries
+        
+    Returns:
+        Array of merged geometries in the order of merged_lakes
+    """
+    geometries = np.empty(len(merged_lakes), dtype=object)
+    geometries[:] = [lake_data['geometry'] for lake_data in merged_lakes]
+    return geometries
 
 
 def validate_merged_geometries(
@@ -234,6 +1214,9 @@ def validate_merged_geometries(
     """
     Validate the merged lake geometries.
     
+    Validity, emptiness, geometry type and area are computed for all lakes at
+    once with shapely's array functions.
+    
     Args:
         merged_lakes: List of merged lake data dictionaries
         
@@ -242,57 +1225,42 @@ def validate_merged_geometries(
     """
     logger.info("Validating merged geometries...")
     
+    geometries = _merged_geometry_array(merged_lakes)
+    valid = shapely.is_valid(geometries)
+    empty = shapely.is_empty(geometries)
+    areas = shapely.area(geometries)
+    
+    # Name each geometry type after its first lake (geom_type names, e.g. 'MultiPolygon')
+    type_ids, first_lakes, type_counts = np.unique(
+        shapely.get_type_id(geometries), return_index=True, return_counts=True
+    )
+    geometry_types = {
+        (geometries[first].geom_type if geometries[first] is not None else 'None'): int(count)
+        for first, count in zip(first_lakes, type_counts)
+    }
+    
+    issues = []
+    for i in np.flatnonzero(~valid | empty):
+        if not valid[i]:
+            issues.append(f"Lake {merged_lakes[i]['dowlknum']}: Invalid geometry")
+        if empty[i]:
+            issues.append(f"Lake {merged_lakes[i]['dowlknum']}: Empty geometry")
+    
+    has_area = ~np.isnan(areas)
     validation_results = {
         'total_lakes': len(merged_lakes),
-        'valid_geometries': 0,
-        'invalid_geometries': 0,
-        'empty_geometries': 0,
-        'geometry_types': {},
+        'valid_geometries': int(valid.sum()),
+        'invalid_geometries': int((~valid).sum()),
+        'empty_geometries': int(empty.sum()),
+        'geometry_types': geometry_types,
         'area_statistics': {
-            'min_area': float('inf'),
-            'max_area': 0,
-            'total_area': 0
+            'min_area': float(areas[has_area].min()) if has_area.any() else 0,
+            'max_area': float(areas[has_area].max()) if has_area.any() else 0,
+            'total_area': float(areas[has_area].sum())
         },
-        'issues': []
+        'issues': issues
     }
     
-    for lake_data in merged_lakes:
-        geometry = lake_data['geometry']
-        
-        # Check if geometry is valid
-        if geometry.is_valid:
-            validation_results['valid_geometries'] += 1
-        else:
-            validation_results['invalid_geometries'] += 1
-            validation_results['issues'].append(
-                f"Lake {lake_data['dowlknum']}: Invalid geometry"
-            )
-        
-        # Check if geometry is empty
-        if geometry.is_empty:
-            validation_results['empty_geometries'] += 1
-            validation_results['issues'].append(
-                f"Lake {lake_data['dowlknum']}: Empty geometry"
-            )
-        
-        # Record geometry type
-        geom_type = geometry.geom_type
-        validation_results['geometry_types'][geom_type] = validation_results['geometry_types'].get(geom_type, 0) + 1
-        
-        # Calculate area statistics
-        area = geometry.area
-        validation_results['area_statistics']['min_area'] = min(
-            validation_results['area_statistics']['min_area'], area
-        )
-        validation_results['area_statistics']['max_area'] = max(
-            validation_results['area_statistics']['max_area'], area
-        )
-        validation_results['area_statistics']['total_area'] += area
-    
-    # Handle case where no valid geometries were found
-    if validation_results['area_statistics']['min_area'] == float('inf'):
-        validation_results['area_statistics']['min_area'] = 0
-    
     # Log validation results
     logger.info(f"Geometry validation complete:")
     logger.info(f"  Valid: {validation_results['valid_geometries']}")
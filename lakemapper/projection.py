@@ -0,0 +1,118 @@
+"""
+Projection module for LakeMapper.
+
+This module reprojects geometries in bulk. Transformers are created once per
+(source, target) CRS pair and reused, and all coordinates of a geometry array
+are transformed in a single vectorized call instead of per geometry or per lake.
+"""
+
+import logging
+from typing import Any, Dict, Sequence, Tuple
+
+import geopandas as gpd
+import numpy as np
+import shapely
+from pyproj import CRS, Transformer
+
+
+logger = logging.getLogger(__name__)
+
+# Transformers keyed by (source CRS, target CRS)
+_transformer_cache: Dict[Tuple[str, str], Transformer] = {}
+
+
+def _crs_key(crs: Any) -> str:
+    """Get a stable cache key for anything pyproj accepts as a CRS."""
+    return CRS.from_user_input(crs).to_wkt()
+
+
+def is_same_crs(source_crs: Any, target_crs: Any) -> bool:
+    """
+    Check whether two CRS definitions are equivalent.
+    
+    Args:
+        source_crs: Source CRS (EPSG code, string, or pyproj CRS)
+        target_crs: Target CRS (EPSG code, string, or pyproj CRS)
+        
+    Returns:
+        True if no reprojection is needed between the two
+    """
+    return CRS.from_user_input(source_crs) == CRS.from_user_input(target_crs)
+
+
+def get_transformer(source_crs: Any, target_crs: Any) -> Transformer:
+    """
+    Get a cached always-xy transformer between two CRS.
+    
+    Args:
+        source_crs: Source CRS (EPSG code, string, or pyproj CRS)
+        target_crs: Target CRS (EPSG code, string, or pyproj CRS)
+        
+    Returns:
+        pyproj Transformer reused across calls for the same CRS pair
+    """
+    cache_key = (_crs_key(source_crs), _crs_key(target_crs))
+    transformer = _transformer_cache.get(cache_key)
+    if transformer is None:
+        transformer = Transformer.from_crs(source_crs, target_crs, always_xy=True)
+        _transformer_cache[cache_key] = transformer
+        logger.debug(f"Created transformer from {source_crs} to {target_crs}")
+    return transformer
+
+
+def transform_geometries(
+    geometries: Sequence[Any],
+    source_crs: Any,
+    target_crs: Any
+) -> np.ndarray:
+    """
+    Reproject an array of geometries with one vectorized coordinate transform.
+    
+    Args:
+        geometries: Shapely geometries (list, array or GeoSeries); None is passed through
+        source_crs: CRS of the input geometries
+        target_crs: CRS to reproject to
+        
+    Returns:
+        Array of reprojected geometries in the input order
+    """
+    geometries = np.asarray(geometries, dtype=object)
+    if len(geometries) == 0 or is_same_crs(source_crs, target_crs):
+        return geometries
+    
+    transformer = get_transformer(source_crs, target_crs)
+    
+    def _transform_coords(coords: np.ndarray) -> np.ndarray:
+        # Called once for all 2D and once for all 3D coordinates of the array
+        return np.column_stack(transformer.transform(*coords.T))
+    
+    return shapely.transform(geometries, _transform_coords, include_z=None)
+
+
+def to_crs(gdf: gpd.GeoDataFrame, target_crs: Any) -> gpd.GeoDataFrame:
+    """
+    Reproject a GeoDataFrame using the cached transformers.
+    
+    Drop-in replacement for GeoDataFrame.to_crs for repeated reprojections
+    between the same CRS pair.
+    
+    Args:
+        gdf: GeoDataFrame with a CRS set
+        target_crs: CRS to reproject to
+        
+    Returns:
+        Reprojected copy of the GeoDataFrame, keeping its geometry column name
+        
+    Raises:
+        ValueError: If the GeoDataFrame has no CRS
+    """
+    if gdf.crs is None:
+        raise ValueError("Cannot reproject a GeoDataFrame without a CRS")
+    
+    target_crs = CRS.from_user_input(target_crs)
+    geometries = transform_geometries(gdf.geometry.to_numpy(), gdf.crs, target_crs)
+    
+    # Assign into the active geometry column; set_geometry with an array would rename it 'geometry'
+    reprojected = gdf.copy()
+    reprojected[gdf.geometry.name] = gpd.array.from_shapely(geometries)
+    return reprojected.set_crs(target_crs, allow_override=True)
@@ -0,0 +1,212 @@
+"""
+Snapshot cache module for LakeMapper.
+
+This module persists the validated, reprojected GeoDataFrames produced by the loader
+to GeoParquet so that later pipeline runs can skip re-parsing the DNR shapefiles.
+Snapshots are keyed by the source files' size, modification time and content hash
+plus the loader settings, so any change to the inputs or the loader invalidates them.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import geopandas as gpd
+
+from .config import SNAPSHOT_DIR
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when the snapshot layout or the loader's output changes in a way that
+# is not captured by the loader settings
+SNAPSHOT_VERSION = 2
+
+# Sidecar files that make up a shapefile dataset
+SHAPEFILE_SIDECARS = ['.shp', '.shx', '.dbf', '.prj', '.cpg']
+
+
+def _source_files(source_file: Path) -> List[Path]:
+    """
+    Get all files that make up a source dataset.
+    
+    Args:
+        source_file: Path to the main source file
+        
+    Returns:
+        List of existing files belonging to the dataset
+    """
+    if source_file.suffix.lower() != '.shp':
+        return [source_file]
+    
+    candidates = [source_file.with_suffix(suffix) for suffix in SHAPEFILE_SIDECARS]
+    return [path for path in candidates if path.exists()]
+
+
+def _hash_file(path: Path, chunk_size: int = 1 << 20) -> str:
+    """
+    Compute the SHA-256 content hash of a file.
+    
+    Args:
+        path: Path to the file
+        chunk_size: Number of bytes to read at a time
+        
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_fingerprint(source_file: Path, hash_contents: bool = False) -> List[Dict[str, Any]]:
+    """
+    Describe the files of a source dataset by name, size and modification time.
+    
+    Args:
+        source_file: Path to the source dataset
+        hash_contents: Whether to also record each file's SHA-256 content hash
+        
+    Returns:
+        List with one entry per file of the dataset
+    """
+    sources = []
+    for path in _source_files(source_file):
+        stat = path.stat()
+        source = {
+            'name': path.name,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns
+        }
+        if hash_contents:
+            source['sha256'] = _hash_file(path)
+        sources.append(source)
+    return sources
+
+
+def compute_snapshot_key(source_file: Path, settings: Dict[str, Any]) -> str:
+    """
+    Compute the snapshot key for a source dataset and loader settings.
+    
+    Args:
+        source_file: Path to the source dataset
+        settings: Loader settings that affect the loaded GeoDataFrame
+        
+    Returns:
+        Key identifying the snapshot, prefixed with a digest of the settings
+    """
+    fingerprint = {
+        'version': SNAPSHOT_VERSION,
+        'sources': source_fingerprint(source_file, hash_contents=True),
+        'settings': settings
+    }
+    # The settings digest prefix lets snapshots of different loader settings
+    # (e.g. projected vs. all columns) coexist while stale sources are pruned
+    return f"{_digest(settings)[:8]}_{_digest(fingerprint)[:16]}"
+
+
+def _digest(value: Any) -> str:
+    """Compute a stable SHA-256 digest of a JSON-serializable value."""
+    encoded = json.dumps(value, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _snapshot_path(name: str, key: str, snapshot_dir: Optional[Path] = None) -> Path:
+    """Get the snapshot file path for a dataset name and key."""
+    snapshot_dir = snapshot_dir or SNAPSHOT_DIR
+    return snapshot_dir / f"{name}_{key}.parquet"
+
+
+def load_snapshot(
+    name: str,
+    key: str,
+    snapshot_dir: Optional[Path] = None
+) -> Optional[gpd.GeoDataFrame]:
+    """
+    Load a snapshot if one exists for the given key.
+    
+    Args:
+        name: Dataset name (e.g. "bathymetry")
+        key: Snapshot key from compute_snapshot_key
+        snapshot_dir: Optional snapshot directory (defaults to SNAPSHOT_DIR)
+        
+    Returns:
+        Snapshot GeoDataFrame, or None if no matching snapshot exists
+    """
+    snapshot_file = _snapshot_path(name, key, snapshot_dir)
+    
+    if not snapshot_file.exists():
+        logger.debug(f"No {name} snapshot found for key {key}")
+        return None
+    
+    try:
+        gdf = gpd.read_parquet(snapshot_file)
+        logger.info(f"Loaded {len(gdf)} {name} rows from snapshot {snapshot_file}")
+        return gdf
+    except Exception as e:
+        logger.warning(f"Error reading {name} snapshot {snapshot_file}: {e}")
+        return None
+
+
+def save_snapshot(
+    name: str,
+    key: str,
+    gdf: gpd.GeoDataFrame,
+    snapshot_dir: Optional[Path] = None
+) -> Optional[Path]:
+    """
+    Save a snapshot and remove stale snapshots of the same dataset and settings.
+    
+    Args:
+        name: Dataset name (e.g. "bathymetry")
+        key: Snapshot key from compute_snapshot_key
+        gdf: Validated GeoDataFrame to snapshot
+        snapshot_dir: Optional snapshot directory (defaults to SNAPSHOT_DIR)
+        
+    Returns:
+        Path to the snapshot file, or None if saving failed
+    """
+    snapshot_file = _snapshot_path(name, key, snapshot_dir)
+    snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Write to a temporary file first so readers never see a partial snapshot
+    temp_file = snapshot_file.with_suffix('.parquet.tmp')
+    try:
+        gdf.to_parquet(temp_file)
+        temp_file.replace(snapshot_file)
+    except Exception as e:
+        logger.warning(f"Error saving {name} snapshot {snapshot_file}: {e}")
+        temp_file.unlink(missing_ok=True)
+        return None
+    
+    # Snapshots of older source files with the same settings can never match again
+    settings_prefix = key.split('_')[0]
+    for stale_file in snapshot_file.parent.glob(f"{name}_{settings_prefix}_*.parquet"):
+        if stale_file != snapshot_file:
+            stale_file.unlink(missing_ok=True)
+            logger.debug(f"Deleted stale snapshot: {stale_file}")
+    
+    logger.info(f"Saved {name} snapshot to {snapshot_file}")
+    return snapshot_file
+
+
+def clear_snapshots(snapshot_dir: Optional[Path] = None) -> None:
+    """
+    Delete all snapshot files.
+    
+    Args:
+        snapshot_dir: Optional snapshot directory (defaults to SNAPSHOT_DIR)
+    """
+    snapshot_dir = snapshot_dir or SNAPSHOT_DIR
+    if not snapshot_dir.exists():
+        return
+    
+    snapshot_files = list(snapshot_dir.glob("*.parquet"))
+    for snapshot_file in snapshot_files:
+        snapshot_file.unlink(missing_ok=True)
+    
+    logger.info(f"Cleared {len(snapshot_files)} snapshot files")
@@ -0,0 +1,487 @@
+"""
+Lake-sorted bathymetry store module for LakeMapper.
+
+This module rewrites the bathymetry contours into a GeoParquet file sorted by
+DOWLKNUM with a side index of row ranges per lake, so that a single lake can be
+read without loading the whole statewide contour file.
+
+The index records the size and modification time of the source files and a
+digest of the loader settings the store was built with. A store whose source
+has changed since it was built is refused by the readers and rebuilt by
+ensure_bathymetry_store.
+"""
+
+import hashlib
+import json
+import logging
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import geopandas as gpd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import shapely
+
+from .config import (
+    BATHYMETRY_FILE, BATHYMETRY_FIELDS, BATHYMETRY_OPTIONAL_FIELDS,
+    BATHYMETRY_STORE_FILE, BATHYMETRY_STORE_INDEX_FILE, STORE_ROW_GROUP_SIZE,
+    CRS_EPSG, DOWLKNUM_KEY_FIELD
+)
+from .loader import iter_bathymetry_batches, resolve_input_file
+from .snapshot import source_fingerprint
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when the store layout changes so existing stores are rebuilt
+STORE_VERSION = 2
+
+# Spill partition for contours with invalid DOWLKNUMs (sorts after every county code)
+INVALID_PARTITION = 'zz'
+
+# Parsed index data keyed by (index file, modification time)
+_index_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+
+def build_bathymetry_store(
+    source_file: Optional[Path] = None,
+    store_file: Optional[Path] = None,
+    index_file: Optional[Path] = None,
+    row_group_size: Optional[int] = None,
+    batch_size: Optional[int] = None
+) -> Dict[str, slice]:
+    """
+    Write the bathymetry contours sorted by DOWLKNUM together with a per-lake row index.
+    
+    The source is streamed with iter_bathymetry_batches and spilled to temporary
+    Parquet files partitioned by county code, which are then sorted and appended
+    to the store one county at a time. Peak memory is one batch while spilling
+    and the largest county while writing, not the whole statewide dataset.
+    
+    Args:
+        source_file: Optional bathymetry source (defaults to the fastest available
+            format of BATHYMETRY_FILE)
+        store_file: Optional store path (defaults to BATHYMETRY_STORE_FILE)
+        index_file: Optional index path (defaults to BATHYMETRY_STORE_INDEX_FILE)
+        row_group_size: Optional rows per Parquet row group (defaults to STORE_ROW_GROUP_SIZE)
+        batch_size: Optional contours per streamed batch (defaults to STREAM_BATCH_SIZE)
+        
+    Returns:
+        Dictionary mapping DOWLKNUM to its slice of rows in the store
+        
+    Raises:
+        FileNotFoundError: If the source file doesn't exist
+        ValueError: If required fields are missing
+    """
+    source_file = source_file or resolve_input_file(BATHYMETRY_FILE)
+    store_file = store_file or BATHYMETRY_STORE_FILE
+    index_file = index_file or BATHYMETRY_STORE_INDEX_FILE
+    row_group_size = row_group_size or STORE_ROW_GROUP_SIZE
+    
+    logger.info(f"Building lake-sorted bathymetry store at {store_file} from {source_file}")
+    
+    # Fingerprint the source before reading it, so a change during the build
+    # makes the new store stale rather than silently current
+    fingerprint = _store_fingerprint(source_file)
+    
+    store_file.parent.mkdir(parents=True, exist_ok=True)
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    
+    lake_index = {}
+    crs = None
+    row_count = 0
+    invalid_count = 0
+    
+    with tempfile.TemporaryDirectory(dir=store_file.parent) as spill_dir:
+        partitions = defaultdict(list)
+        for batch_number, batch in enumerate(iter_bathymetry_batches(batch_size=batch_size, source_file=source_file)):
+            crs = crs or batch.crs
+            for partition, part_gdf in _partition_batch(batch):
+                part_file = Path(spill_dir) / f"{partition}_{batch_number:06d}.parquet"
+                pq.write_table(_to_arrow_table(part_gdf), part_file)
+                partitions[partition].append(part_file)
+        
+        part_files = [part_file for files in partitions.values() for part_file in files]
+        schema = _store_schema(
+            pa.unify_schemas([pq.read_schema(part_file) for part_file in part_files], promote_options='permissive')
+            if part_files else None,
+            crs
+        )
+        
+        with pq.ParquetWriter(store_file, schema) as writer:
+            # County codes sort like the keys they prefix, and spill files of a
+            # partition are read in batch order, so a stable sort within each
+            # partition gives the same order as a stable sort of the whole dataset
+            for partition in sorted(partitions):
+                table = pa.concat_tables(
+                    [pq.read_table(part_file) for part_file in partitions[partition]],
+                    promote_options='permissive'
+                )
+                if partition == INVALID_PARTITION:
+                    invalid_count += table.num_rows
+                else:
+                    table = table.take(pc.sort_indices(table, sort_keys=[(DOWLKNUM_KEY_FIELD, 'ascending')]))
+                    lake_index.update(_lake_slices(table.column(DOWLKNUM_KEY_FIELD), row_count))
+                
+                writer.write_table(table.select(schema.names).cast(schema), row_group_size=row_group_size)
+                row_count += table.num_rows
+    
+    index_data = {
+        'store_file': store_file.name,
+        'crs': f"EPSG:{CRS_EPSG}" if crs is None else crs.to_string(),
+        'row_count': row_count,
+        'row_group_size': row_group_size,
+        'source': fingerprint,
+        'lakes': {dowlknum: [rows.start, rows.stop] for dowlknum, rows in lake_index.items()}
+    }
+    with open(index_file, 'w') as f:
+        json.dump(index_data, f)
+    
+    logger.info(
+        f"Wrote {row_count} contours for {len(lake_index)} lakes "
+        f"({invalid_count} with invalid DOWLKNUMs) to {store_file}"
+    )
+    return lake_index
+
+
+def _partition_batch(batch: gpd.GeoDataFrame) -> List[Tuple[str, gpd.GeoDataFrame]]:
+    """
+    Split a bathymetry batch by the county code of its DOWLKNUM keys.
+    
+    Args:
+        batch: Bathymetry batch with the canonical key column
+        
+    Returns:
+        List of (partition, rows) pairs; rows with invalid DOWLKNUMs are in INVALID_PARTITION
+    """
+    partitions = batch[DOWLKNUM_KEY_FIELD].str[:2].fillna(INVALID_PARTITION)
+    return [(str(partition), part_gdf) for partition, part_gdf in batch.groupby(partitions, sort=False)]
+
+
+def _to_arrow_table(gdf: gpd.GeoDataFrame) -> pa.Table:
+    """
+    Convert bathymetry rows to an Arrow table with a WKB 'geometry' column.
+    
+    Args:
+        gdf: Bathymetry GeoDataFrame
+        
+    Returns:
+        Arrow table without the pandas index
+    """
+    attributes = pa.Table.from_pandas(gdf.drop(columns=gdf.geometry.name), preserve_index=False)
+    return attributes.append_column('geometry', pa.array(shapely.to_wkb(gdf.geometry.values), type=pa.binary()))
+
+
+def _store_schema(schema: Optional[pa.Schema], crs) -> pa.Schema:
+    """
+    Add GeoParquet metadata for the WKB 'geometry' column to a store schema.
+    
+    Args:
+        schema: Unified schema of the spilled partitions, or None if the source was empty
+        crs: CRS of the geometries, or None for EPSG:26915
+        
+    Returns:
+        Schema whose metadata makes the store a valid GeoParquet file
+    """
+    if schema is None:
+        schema = pa.schema([(DOWLKNUM_KEY_FIELD, pa.string()), ('geometry', pa.binary())])
+    
+    crs_json = gpd.GeoSeries([], crs=crs or f"EPSG:{CRS_EPSG}").crs.to_json_dict()
+    geo_metadata = {
+        'version': '1.0.0',
+        'primary_column': 'geometry',
+        'columns': {'geometry': {'encoding': 'WKB', 'geometry_types': [], 'crs': crs_json}}
+    }
+    return schema.remove_metadata().with_metadata({'geo': json.dumps(geo_metadata)})
+
+
+def _lake_slices(keys: pa.ChunkedArray, offset: int) -> Dict[str, slice]:
+    """
+    Get the row range of each lake in a key-sorted block of the store.
+    
+    Args:
+        keys: Sorted DOWLKNUM keys of the block
+        offset: Store row position of the block's first row
+        
+    Returns:
+        Dictionary mapping DOWLKNUM to its slice of rows in the store
+    """
+    lake_keys, starts, counts = np.unique(
+        np.asarray(keys.to_pylist(), dtype=object).astype(str), return_index=True, return_counts=True
+    )
+    return {
+        str(dowlknum): slice(offset + int(start), offset + int(start + count))
+        for dowlknum, start, count in zip(lake_keys, starts, counts)
+    }
+
+
+def _store_fingerprint(source_file: Path) -> Dict[str, Any]:
+    """
+    Describe the source and settings a store is built from.
+    
+    Args:
+        source_file: Path to the bathymetry source
+        
+    Returns:
+        Fingerprint with the source path, its files' sizes and modification
+        times, and a digest of the store settings
+    """
+    settings = {
+        'version': STORE_VERSION,
+        'fields': BATHYMETRY_FIELDS,
+        'optional_fields': BATHYMETRY_OPTIONAL_FIELDS,
+        'crs_epsg': CRS_EPSG
+    }
+    return {
+        'path': str(source_file.resolve()),
+        'files': source_fingerprint(source_file),
+        'settings_digest': hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()
+    }
+
+
+def store_staleness(
+    source_file: Optional[Path] = None,
+    store_file: Optional[Path] = None,
+    index_file: Optional[Path] = None
+) -> Optional[str]:
+    """
+    Check whether the bathymetry store is missing or out of date with its source.
+    
+    Args:
+        source_file: Optional bathymetry source to compare against (defaults to the
+            source recorded in the index)
+        store_file: Optional store path (defaults to BATHYMETRY_STORE_FILE)
+        index_file: Optional index path (defaults to BATHYMETRY_STORE_INDEX_FILE)
+        
+    Returns:
+        Reason the store must be rebuilt, or None if it is current
+    """
+    store_file = store_file or BATHYMETRY_STORE_FILE
+    index_file = index_file or BATHYMETRY_STORE_INDEX_FILE
+    
+    if not store_file.exists() or not index_file.exists():
+        return "store not built"
+    
+    with open(index_file, 'r') as f:
+        recorded = json.load(f).get('source')
+    return _source_staleness(recorded, source_file)
+
+
+def _source_staleness(recorded: Optional[Dict[str, Any]], source_file: Optional[Path] = None) -> Optional[str]:
+    """
+    Compare a store's recorded source fingerprint with the source as it is now.
+    
+    Args:
+        recorded: Source fingerprint from the store index
+        source_file: Optional bathymetry source to compare against (defaults to the
+            source recorded in the index)
+            
+    Returns:
+        Reason the store must be rebuilt, or None if it is current
+    """
+    if not recorded:
+        return "index has no source fingerprint"
+    
+    if source_file is None:
+        source_file = Path(recorded['path'])
+        if not source_file.exists():
+            # Nothing to compare against; the store is all that is left of the source
+            logger.warning(f"Source {source_file} of the bathymetry store no longer exists")
+            return None
+    elif not source_file.exists():
+        raise FileNotFoundError(f"Bathymetry file not found: {source_file}")
+    
+    current = _store_fingerprint(source_file)
+    if current['path'] != recorded['path']:
+        return f"built from {recorded['path']}"
+    if current['settings_digest'] != recorded.get('settings_digest'):
+        return "store settings changed"
+    if current['files'] != recorded.get('files'):
+        return f"{source_file.name} changed"
+    return None
+
+
+def ensure_bathymetry_store(
+    source_file: Optional[Path] = None,
+    store_file: Optional[Path] = None,
+    index_file: Optional[Path] = None
+) -> Dict[str, slice]:
+    """
+    Rebuild the bathymetry store if it is missing or stale and return its index.
+    
+    Args:
+        source_file: Optional bathymetry source (defaults to the fastest available
+            format of BATHYMETRY_FILE)
+        store_file: Optional store path (defaults to BATHYMETRY_STORE_FILE)
+        index_file: Optional index path (defaults to BATHYMETRY_STORE_INDEX_FILE)
+        
+    Returns:
+        Dictionary mapping DOWLKNUM to its slice of rows in the store
+    """
+    source_file = source_file or resolve_input_file(BATHYMETRY_FILE)
+    
+    reason = store_staleness(source_file, store_file, index_file)
+    if reason is not None:
+        logger.info(f"Rebuilding bathymetry store ({reason})")
+        return build_bathymetry_store(source_file, store_file, index_file)
+    
+    return load_lake_index(index_file)
+
+
+def _load_index_data(index_file: Path) -> Dict[str, Any]:
+    """
+    Load and parse a store index file, reusing the parsed index while the file is unchanged.
+    
+    Args:
+        index_file: Path to the index file
+        
+    Returns:
+        Index data with 'lakes' mapping DOWLKNUM to a row slice
+        
+    Raises:
+        FileNotFoundError: If the index file doesn't exist
+        ValueError: If the store is out of date with its source
+    """
+    if not index_file.exists():
+        raise FileNotFoundError(f"Bathymetry store index not found: {index_file}")
+    
+    cache_key = (str(index_file), index_file.stat().st_mtime_ns)
+    if cache_key not in _index_cache:
+        with open(index_file, 'r') as f:
+            index_data = json.load(f)
+        index_data['lakes'] = {
+            dowlknum: slice(start, stop) for dowlknum, (start, stop) in index_data['lakes'].items()
+        }
+        _index_cache.clear()
+        _index_cache[cache_key] = index_data
+    
+    reason = _source_staleness(_index_cache[cache_key].get('source'))
+    if reason is not None:
+        raise ValueError(f"Bathymetry store is out of date ({reason}); rerun scripts/build_store.py")
+    
+    return _index_cache[cache_key]
+
+
+def load_lake_index(index_file: Optional[Path] = None) -> Dict[str, slice]:
+    """
+    Load the per-lake row index of the bathymetry store.
+    
+    Args:
+        index_file: Optional index path (defaults to BATHYMETRY_STORE_INDEX_FILE)
+        
+    Returns:
+        Dictionary mapping DOWLKNUM to its slice of rows in the store
+        
+    Raises:
+        FileNotFoundError: If the index file doesn't exist
+        ValueError: If the store is out of date with its source
+    """
+    return _load_index_data(index_file or BATHYMETRY_STORE_INDEX_FILE)['lakes']
+
+
+def load_lake(
+    dowlknum: str,
+    store_file: Optional[Path] = None,
+    index_file: Optional[Path] = None
+) -> Optional[gpd.GeoDataFrame]:
+    """
+    Load the bathymetry contours of a single lake from the store.
+    
+    Only the Parquet row groups that overlap the lake's row range are read.
+    
+    Args:
+        dowlknum: DOWLKNUM of the lake to load
+        store_file: Optional store path (defaults to BATHYMETRY_STORE_FILE)
+        index_file: Optional index path (defaults to BATHYMETRY_STORE_INDEX_FILE)
+        
+    Returns:
+        GeoDataFrame of the lake's contours indexed by their store row position,
+        or None if the lake is not in the store
+        
+    Raises:
+        FileNotFoundError: If the store or its index doesn't exist
+        ValueError: If the store is out of date with its source
+    """
+    store_file = store_file or BATHYMETRY_STORE_FILE
+    index_file = index_file or BATHYMETRY_STORE_INDEX_FILE
+    
+    if not store_file.exists():
+        raise FileNotFoundError(f"Bathymetry store not found: {store_file}")
+    
+    index_data = _load_index_data(index_file)
+    rows = index_data['lakes'].get(dowlknum)
+    if rows is None:
+        logger.warning(f"Lake {dowlknum} not found in bathymetry store")
+        return None
+    
+    with pq.ParquetFile(store_file) as parquet_file:
+        metadata = parquet_file.metadata
+        group_rows = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+        group_starts = np.concatenate([[0], np.cumsum(group_rows)])
+        
+        # Row groups overlapping [rows.start, rows.stop)
+        first_group = int(np.searchsorted(group_starts, rows.start, side='right')) - 1
+        last_group = int(np.searchsorted(group_starts, rows.stop, side='left')) - 1
+        table = parquet_file.read_row_groups(list(range(first_group, last_group + 1)))
+    
+    table = table.slice(rows.start - int(group_starts[first_group]), rows.stop - rows.start)
+    
+    lake_gdf = _table_to_geodataframe(table, index_data.get('crs') or f"EPSG:{CRS_EPSG}")
+    lake_gdf.index = range(rows.start, rows.stop)
+    
+    logger.debug(f"Loaded {len(lake_gdf)} contours for lake {dowlknum} from {store_file}")
+    return lake_gdf
+
+
+def _table_to_geodataframe(table, crs: str) -> gpd.GeoDataFrame:
+    """
+    Convert an Arrow table read from the store into a GeoDataFrame.
+    
+    Args:
+        table: Arrow table with a WKB 'geometry' column
+        crs: CRS of the geometries
+        
+    Returns:
+        GeoDataFrame with decoded geometries
+    """
+    geometry = shapely.from_wkb(table.column('geometry').to_numpy(zero_copy_only=False))
+    attributes = table.drop_columns(['geometry']).to_pandas()
+    return gpd.GeoDataFrame(attributes, geometry=geometry, crs=crs)
+
+
+def load_bathymetry_store(
+    store_file: Optional[Path] = None,
+    index_file: Optional[Path] = None
+) -> Tuple[gpd.GeoDataFrame, Dict[str, slice]]:
+    """
+    Load the whole lake-sorted bathymetry store and its per-lake row index.
+    
+    Because contours are grouped by lake, the index can be passed to merge_all_lakes
+    so each lake's contours are a contiguous slice instead of a column scan.
+    
+    Args:
+        store_file: Optional store path (defaults to BATHYMETRY_STORE_FILE)
+        index_file: Optional index path (defaults to BATHYMETRY_STORE_INDEX_FILE)
+        
+    Returns:
+        Tuple of (bathymetry_gdf, lake_index)
+        
+    Raises:
+        FileNotFoundError: If the store or its index doesn't exist
+        ValueError: If the store is out of date with its source
+    """
+    store_file = store_file or BATHYMETRY_STORE_FILE
+    
+    if not store_file.exists():
+        raise FileNotFoundError(f"Bathymetry store not found: {store_file}")
+    
+    # Check the index first so a stale store is refused before it is read
+    lake_index = load_lake_index(index_file)
+    bathymetry_gdf = gpd.read_parquet(store_file)
+    
+    logger.info(f"Loaded {len(bathymetry_gdf)} contours for {len(lake_index)} lakes from {store_file}")
+    return bathymetry_gdf, lake_index
@@ -8,9 +8,15 @@ the LakeMapper data processing pipeline.
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
-from .config import LOG_LEVEL, LOG_FORMAT
+import numpy as np
+import pandas as pd
+
+from .config import (
+    LOG_LEVEL, LOG_FORMAT,
+    DOWLKNUM_KEY_FIELD, DOWLKNUM_INT_FIELD, DOWLKNUM_VALID_FIELD
+)
 
 
 def setup_logging(
@@ -57,9 +63,9 @@ def ensure_directories() -> None:
     """
     Ensure all required output directories exist.
     """
-    from .config import OUTPUT_DIR, GEOJSON_DIR, RASTER_DIR, METADATA_DIR, CONTOURS_DIR
+    from .config import OUTPUT_DIR, GEOJSON_DIR, RASTER_DIR, METADATA_DIR, CONTOURS_DIR, LOD_DIR, DEPTH_BANDS_DIR
     
-    for directory in [OUTPUT_DIR, GEOJSON_DIR, RASTER_DIR, METADATA_DIR, CONTOURS_DIR]:
+    for directory in [OUTPUT_DIR, GEOJSON_DIR, RASTER_DIR, METADATA_DIR, CONTOURS_DIR, LOD_DIR, DEPTH_BANDS_DIR]:
         directory.mkdir(parents=True, exist_ok=True)
 
 
@@ -80,6 +86,136 @@ def validate_dowlknum(dowlknum: str) -> bool:
     return dowlknum.isdigit() and len(dowlknum) == 8
 
 
+def normalize_dowlknums(values: pd.Series) -> pd.DataFrame:
+    """
+    Normalize and validate a column of raw DOWLKNUM values in one vectorized pass.
+    
+    Values are stripped, numeric artifacts such as a trailing ".0" are removed and
+    7-digit values (DOWLKNUMs read as numbers lose their leading zero) are
+    zero-padded to 8 characters.
+    
+    Args:
+        values: Raw DOWLKNUM values
+        
+    Returns:
+        DataFrame with the canonical key, its int64 twin and the validity mask,
+        using the DOWLKNUM_*_FIELD column names and the index of values
+    """
+    text = values.astype('string').str.strip()
+    text = text.str.replace(r'\.0+$', '', regex=True)
+    
+    # DOWLKNUM should be 8 digits once zero-padded
+    valid = text.str.fullmatch(r'\d{7,8}').fillna(False).astype(bool)
+    keys = text.str.zfill(8).where(valid)
+    key_ints = pd.to_numeric(keys, errors='coerce').fillna(-1).astype(np.int64)
+    
+    return pd.DataFrame({
+        DOWLKNUM_KEY_FIELD: keys,
+        DOWLKNUM_INT_FIELD: key_ints,
+        DOWLKNUM_VALID_FIELD: valid
+    }, index=values.index)
+
+
+def add_dowlknum_key(gdf: pd.DataFrame, field: str) -> pd.DataFrame:
+    """
+    Add the canonical DOWLKNUM key columns to a (Geo)DataFrame.
+    
+    Args:
+        gdf: DataFrame containing a raw DOWLKNUM column
+        field: Name of the raw DOWLKNUM column
+        
+    Returns:
+        DataFrame with the DOWLKNUM_KEY_FIELD, DOWLKNUM_INT_FIELD and
+        DOWLKNUM_VALID_FIELD columns added
+    """
+    normalized = normalize_dowlknums(gdf[field])
+    for column in normalized.columns:
+        gdf[column] = normalized[column]
+    return gdf
+
+
+def dowlknum_keys(gdf: pd.DataFrame, field: str) -> pd.Series:
+    """
+    Get the canonical DOWLKNUM keys of a (Geo)DataFrame.
+    
+    Uses the key column added by the loader when present and only normalizes the
+    raw field for frames that did not come through the loader.
+    
+    Args:
+        gdf: DataFrame containing bathymetry or fish survey data
+        field: Name of the raw DOWLKNUM column
+        
+    Returns:
+        Series of zero-padded 8-character keys (missing where invalid)
+    """
+    if DOWLKNUM_KEY_FIELD in gdf.columns:
+        return gdf[DOWLKNUM_KEY_FIELD]
+    return normalize_dowlknums(gdf[field])[DOWLKNUM_KEY_FIELD]
+
+
+def build_lake_index(gdf: pd.DataFrame, field: str) -> Dict[str, np.ndarray]:
+    """
+    Build a DOWLKNUM to row-position index of a (Geo)DataFrame in one pass.
+    
+    Lookups in the index replace a full-column key comparison per lake, so
+    selecting a lake's rows is gdf.iloc[index[dowlknum]].
+    
+    Args:
+        gdf: DataFrame containing bathymetry or fish survey data
+        field: Name of the raw DOWLKNUM column
+        
+    Returns:
+        Dictionary mapping each valid DOWLKNUM to the positions of its rows
+    """
+    keys = dowlknum_keys(gdf, field).reset_index(drop=True)
+    # observed=True keeps unused categories of compact (categorical) keys out of the index
+    return keys.groupby(keys, observed=True, sort=False).indices
+
+
+def _is_float32(dtype) -> bool:
+    """Check whether a NumPy or nullable pandas dtype stores float32 values."""
+    return getattr(dtype, 'numpy_dtype', dtype) == np.float32
+
+
+def float64_values(values: pd.Series) -> np.ndarray:
+    """
+    Get a numeric column as float64, widening float32 through its shortest decimal form.
+    
+    A compact float32 depth of 12.3 widens directly to 12.300000190734863. Parsing
+    the shortest decimal that round-trips the float32 gives back 12.3, so runs with
+    and without compact dtypes report the same values.
+    
+    Args:
+        values: Numeric column (NumPy or nullable dtype)
+        
+    Returns:
+        float64 array with missing values as NaN
+    """
+    if _is_float32(values.dtype):
+        return values.to_numpy(dtype=np.float32, na_value=np.nan).astype(str).astype(np.float64)
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def widen_float32_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the float32 columns of a (Geo)DataFrame to float64 with float64_values.
+    
+    Args:
+        df: DataFrame, possibly with compact float32 columns
+        
+    Returns:
+        The DataFrame itself if it has no float32 columns, otherwise a copy
+    """
+    float32_columns = [column for column, dtype in df.dtypes.items() if _is_float32(dtype)]
+    if not float32_columns:
+        return df
+    
+    df = df.copy()
+    for column in float32_columns:
+        df[column] = float64_values(df[column])
+    return df
+
+
 def format_lake_filename(dowlknum: str, extension: str = "geojson") -> str:
     """
     Generate a standardized filename for a lake based on its DOWLKNUM.
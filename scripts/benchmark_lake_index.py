@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the shared DOWLKNUM to row-position lake index.
+
+This script builds synthetic statewide-sized bathymetry and fish survey datasets
+and compares selecting every lake's rows with a full-column key comparison per
+lake (O(lakes x rows)) against one build_lake_index pass plus a lookup per lake.
+The per-lake lookups mirror merge_all_lakes and create_merged_geodataframe.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import geopandas as gpd
+import numpy as np
+
+# Add the lakemapper package to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lakemapper.config import BATHYMETRY_FIELDS, FISH_SURVEY_FIELDS, CRS_EPSG
+from lakemapper.utils import setup_logging, add_dowlknum_key, dowlknum_keys, build_lake_index
+
+
+def make_datasets(lake_count: int, contours_per_lake: int, seed: int = 0):
+    """
+    Build synthetic bathymetry and fish survey GeoDataFrames.
+    
+    Args:
+        lake_count: Number of lakes
+        contours_per_lake: Average number of contours per lake
+        seed: Random seed
+        
+    Returns:
+        Tuple of (bathymetry_gdf, fish_survey_gdf, dowlknums)
+    """
+    rng = np.random.default_rng(seed)
+    dowlknums = np.array([f"{county:02d}{lake:06d}" for county, lake in zip(
+        rng.integers(1, 88, lake_count), rng.choice(999999, lake_count, replace=False)
+    )])
+    
+    contour_lakes = rng.integers(0, lake_count, lake_count * contours_per_lake)
+    x, y = rng.uniform(2e5, 7e5, len(contour_lakes)), rng.uniform(4.8e6, 5.5e6, len(contour_lakes))
+    bathymetry_gdf = gpd.GeoDataFrame({
+        BATHYMETRY_FIELDS['dowlknum']: dowlknums[contour_lakes],
+        BATHYMETRY_FIELDS['depth']: -rng.integers(0, 100, len(contour_lakes)).astype(float)
+    }, geometry=gpd.points_from_xy(x, y), crs=f"EPSG:{CRS_EPSG}")
+    
+    fish_survey_gdf = gpd.GeoDataFrame({
+        FISH_SURVEY_FIELDS['dowlknum']: dowlknums,
+        FISH_SURVEY_FIELDS['acres']: rng.uniform(10, 1e5, lake_count)
+    }, geometry=gpd.points_from_xy(rng.uniform(2e5, 7e5, lake_count), rng.uniform(4.8e6, 5.5e6, lake_count)),
+        crs=f"EPSG:{CRS_EPSG}")
+    
+    return (
+        add_dowlknum_key(bathymetry_gdf, BATHYMETRY_FIELDS['dowlknum']),
+        add_dowlknum_key(fish_survey_gdf, FISH_SURVEY_FIELDS['dowlknum']),
+        list(dowlknums)
+    )
+
+
+def select_by_scan(bathymetry_gdf, fish_survey_gdf, dowlknums) -> int:
+    """Select each lake's rows with a full-column comparison per lake (previous approach)."""
+    bathymetry_keys = dowlknum_keys(bathymetry_gdf, BATHYMETRY_FIELDS['dowlknum'])
+    fish_survey_keys = dowlknum_keys(fish_survey_gdf, FISH_SURVEY_FIELDS['dowlknum'])
+    selected = 0
+    for dowlknum in dowlknums:
+        selected += len(fish_survey_gdf[fish_survey_keys == dowlknum])
+        selected += len(bathymetry_gdf[bathymetry_keys == dowlknum])
+        selected += len(fish_survey_gdf[fish_survey_keys == dowlknum])
+    return selected
+
+
+def select_by_index(bathymetry_gdf, fish_survey_gdf, dowlknums) -> int:
+    """Select each lake's rows through lake indexes built once."""
+    bathymetry_index = build_lake_index(bathymetry_gdf, BATHYMETRY_FIELDS['dowlknum'])
+    fish_survey_index = build_lake_index(fish_survey_gdf, FISH_SURVEY_FIELDS['dowlknum'])
+    selected = 0
+    for dowlknum in dowlknums:
+        selected += len(fish_survey_gdf.iloc[fish_survey_index.get(dowlknum, [])])
+        selected += len(bathymetry_gdf.iloc[bathymetry_index.get(dowlknum, [])])
+        selected += len(fish_survey_gdf.iloc[fish_survey_index.get(dowlknum, [])])
+    return selected
+
+
+def main(argv=None):
+    """Time per-lake scans against the lake index for growing dataset sizes."""
+    parser = argparse.ArgumentParser(description="Benchmark per-lake key scans vs. the lake index")
+    parser.add_argument(
+        '--lakes',
+        type=int,
+        nargs='+',
+        default=[500, 1000, 2000, 4000],
+        help="Lake counts to benchmark (statewide is a few thousand lakes)"
+    )
+    parser.add_argument('--contours-per-lake', type=int, default=100, help="Average contours per lake")
+    parser.add_argument('--compact', action='store_true', help="Use categorical keys as with --compact loads")
+    args = parser.parse_args(argv)
+    
+    logger = setup_logging()
+    
+    for lake_count in args.lakes:
+        bathymetry_gdf, fish_survey_gdf, dowlknums = make_datasets(lake_count, args.contours_per_lake)
+        if args.compact:
+            bathymetry_gdf['dowlknum_key'] = bathymetry_gdf['dowlknum_key'].astype('category')
+        
+        timings = {}
+        results = {}
+        for name, select in [('scan', select_by_scan), ('index', select_by_index)]:
+            start_time = time.perf_counter()
+            results[name] = select(bathymetry_gdf, fish_survey_gdf, dowlknums)
+            timings[name] = time.perf_counter() - start_time
+        
+        if results['scan'] != results['index']:
+            logger.error(f"Row selections differ: {results}")
+            return 1
+        
+        logger.info(
+            f"{lake_count:6d} lakes, {len(bathymetry_gdf):8d} contours: "
+            f"scan {timings['scan']:8.3f} s ({timings['scan'] / lake_count * 1000:.3f} ms/lake), "
+            f"index {timings['index']:8.3f} s ({timings['index'] / lake_count * 1000:.3f} ms/lake), "
+            f"{timings['scan'] / timings['index']:.1f}x"
+        )
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
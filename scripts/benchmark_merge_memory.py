@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the memory held by merged lake records.
+
+This script builds a synthetic bathymetry dataset, merges every lake with
+merge_all_lakes and exports each lake's original contours, and reports the
+Python-heap peak (tracemalloc) of the merge and export stages and the memory
+still held by the merged_lakes list after the merge.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import geopandas as gpd
+import numpy as np
+import shapely
+
+# Add the lakemapper package to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lakemapper.config import BATHYMETRY_FIELDS, FISH_SURVEY_FIELDS, CRS_EPSG
+from lakemapper.utils import setup_logging, add_dowlknum_key
+from lakemapper.merger import merge_all_lakes
+from lakemapper.exporter import export_lake_contours_geojson
+
+
+def make_datasets(lake_count: int, contours_per_lake: int, seed: int = 0):
+    """
+    Build synthetic bathymetry and fish survey GeoDataFrames.
+    
+    Each lake is a circular outline on a grid with nested circular depth contours.
+    
+    Args:
+        lake_count: Number of lakes
+        contours_per_lake: Number of contours per lake
+        seed: Random seed
+        
+    Returns:
+        Tuple of (bathymetry_gdf, fish_survey_gdf, dowlknums)
+    """
+    rng = np.random.default_rng(seed)
+    dowlknums = [f"{lake + 1:06d}00" for lake in range(lake_count)]
+    grid = int(np.ceil(np.sqrt(lake_count)))
+    centers = shapely.points(
+        3e5 + (np.arange(lake_count) % grid) * 5000, 5e6 + (np.arange(lake_count) // grid) * 5000
+    )
+    
+    contour_lakes = np.repeat(np.arange(lake_count), contours_per_lake)
+    radii = np.tile(np.linspace(2000, 50, contours_per_lake), lake_count)
+    bathymetry_gdf = gpd.GeoDataFrame({
+        BATHYMETRY_FIELDS['dowlknum']: np.array(dowlknums)[contour_lakes],
+        BATHYMETRY_FIELDS['depth']: -np.tile(np.arange(contours_per_lake, dtype=float), lake_count),
+        BATHYMETRY_FIELDS['abs_depth']: np.tile(np.arange(contours_per_lake, dtype=float), lake_count),
+        BATHYMETRY_FIELDS['shape_leng']: 2 * np.pi * radii,
+        BATHYMETRY_FIELDS['lake_name']: [f"Lake {lake}" for lake in contour_lakes]
+    }, geometry=shapely.buffer(centers[contour_lakes], radii, quad_segs=16), crs=f"EPSG:{CRS_EPSG}")
+    
+    fish_survey_gdf = gpd.GeoDataFrame({
+        FISH_SURVEY_FIELDS['dowlknum']: dowlknums,
+        FISH_SURVEY_FIELDS['acres']: rng.uniform(10, 1e4, lake_count),
+        FISH_SURVEY_FIELDS['city_name']: "City",
+        FISH_SURVEY_FIELDS['survey_url']: "https://example.org"
+    }, geometry=shapely.buffer(centers, 2000, quad_segs=16), crs=f"EPSG:{CRS_EPSG}")
+    
+    return (
+        add_dowlknum_key(bathymetry_gdf, BATHYMETRY_FIELDS['dowlknum']),
+        add_dowlknum_key(fish_survey_gdf, FISH_SURVEY_FIELDS['dowlknum']),
+        dowlknums
+    )
+
+
+def main(argv=None):
+    """Measure the merge and export memory of merged lake records."""
+    parser = argparse.ArgumentParser(description="Benchmark the memory held by merged lake records")
+    parser.add_argument('--lakes', type=int, default=500, help="Number of synthetic lakes")
+    parser.add_argument('--contours-per-lake', type=int, default=40, help="Contours per lake")
+    parser.add_argument('--export-lakes', type=int, default=50, help="Lakes whose contours are exported")
+    args = parser.parse_args(argv)
+    
+    logger = setup_logging()
+    bathymetry_gdf, fish_survey_gdf, dowlknums = make_datasets(args.lakes, args.contours_per_lake)
+    
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    
+    start_time = time.perf_counter()
+    merged_lakes, _ = merge_all_lakes(bathymetry_gdf, fish_survey_gdf, dowlknums, use_cache=False)
+    merge_time = time.perf_counter() - start_time
+    held, merge_peak = tracemalloc.get_traced_memory()
+    
+    tracemalloc.reset_peak()
+    start_time = time.perf_counter()
+    with tempfile.TemporaryDirectory() as output_dir:
+        for lake_data in merged_lakes[:args.export_lakes]:
+            export_lake_contours_geojson(lake_data, Path(output_dir))
+    export_time = time.perf_counter() - start_time
+    export_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    
+    logger.info(f"{len(merged_lakes)} lakes, {len(bathymetry_gdf)} contours")
+    logger.info(f"  Merge:  peak {(merge_peak - baseline) / 2**20:8.1f} MiB, {merge_time:.2f} s")
+    logger.info(f"  Held by merged_lakes after merge: {(held - baseline) / 2**20:8.1f} MiB")
+    logger.info(f"  Export of {min(args.export_lakes, len(merged_lakes))} lakes: peak {(export_peak - baseline) / 2**20:8.1f} MiB, {export_time:.2f} s")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the reprojection engine.
+
+This script compares reprojecting the bathymetry contours to WGS84 the way the
+exporter used to (a fresh GeoDataFrame.to_crs per lake) with the cached,
+vectorized reprojection in lakemapper.projection (per lake and in bulk).
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add the lakemapper package to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lakemapper.config import CRS_EPSG, WEB_CRS_EPSG, DOWLKNUM_KEY_FIELD
+from lakemapper.utils import setup_logging
+from lakemapper.loader import load_bathymetry_data
+from lakemapper.projection import to_crs, transform_geometries
+
+
+def _time(func, repeat: int) -> float:
+    """Return the best wall time of func over repeat runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start_time)
+    return min(timings)
+
+
+def main(argv=None):
+    """Time per-lake and bulk reprojection of the bathymetry contours."""
+    parser = argparse.ArgumentParser(description="Benchmark per-lake vs. bulk reprojection")
+    parser.add_argument('--lakes', type=int, default=None, help="Only use the first N lakes")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per strategy (best is reported)")
+    args = parser.parse_args(argv)
+    
+    logger = setup_logging()
+    
+    bathymetry_gdf = load_bathymetry_data()
+    lake_gdfs = [
+        lake_gdf for _, lake_gdf in bathymetry_gdf.groupby(DOWLKNUM_KEY_FIELD, sort=False, observed=True)
+    ][:args.lakes]
+    geometries = np.concatenate([lake_gdf.geometry.to_numpy() for lake_gdf in lake_gdfs])
+    
+    strategies = {
+        'GeoDataFrame.to_crs per lake': lambda: [
+            lake_gdf.to_crs(epsg=WEB_CRS_EPSG) for lake_gdf in lake_gdfs
+        ],
+        'projection.to_crs per lake': lambda: [
+            to_crs(lake_gdf, WEB_CRS_EPSG) for lake_gdf in lake_gdfs
+        ],
+        'projection.transform_geometries bulk': lambda: transform_geometries(
+            geometries, CRS_EPSG, WEB_CRS_EPSG
+        ),
+    }
+    
+    logger.info(f"Reprojecting {len(geometries)} contours in {len(lake_gdfs)} lakes to EPSG:{WEB_CRS_EPSG}")
+    baseline = None
+    for name, func in strategies.items():
+        elapsed = _time(func, args.repeat)
+        baseline = baseline or elapsed
+        per_lake_ms = elapsed / max(len(lake_gdfs), 1) * 1000
+        logger.info(
+            f"  {name:<40} {elapsed:8.3f} s  ({per_lake_ms:.2f} ms/lake, {baseline / elapsed:.1f}x)"
+        )
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
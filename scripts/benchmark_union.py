@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the contour union strategies.
+
+This script times every strategy in UNION_STRATEGIES (optionally snapped to a
+precision grid) on each lake's contours and reports the runtime and output area
+per lake, so a default UNION_STRATEGY can be chosen. With --tiled every variant is
+also timed through the tiled union used for very large lakes. Lakes come from the
+bathymetry data, or with --synthetic from generated lakes with thousands of
+contours laid out either as a valid coverage (depth bands split into sectors)
+or as nested depth polygons.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import shapely
+
+# Add the lakemapper package to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lakemapper.config import BATHYMETRY_FIELDS, UNION_STRATEGIES
+from lakemapper.utils import setup_logging, build_lake_index
+from lakemapper.loader import load_bathymetry_data
+from lakemapper.merger import union_contours, tiled_union
+
+
+def make_synthetic_lake(bands: int, sectors: int, layout: str, seed: int = 0) -> np.ndarray:
+    """
+    Build the contours of one synthetic lake.
+    
+    Args:
+        bands: Number of depth bands
+        sectors: Number of sectors each band is split into ('coverage' layout only)
+        layout: 'coverage' for edge-matched band sectors, 'nested' for one polygon per depth
+        seed: Random seed for the shoreline noise
+        
+    Returns:
+        Array of contour polygons
+    """
+    rng = np.random.default_rng(seed)
+    points_per_sector = 8
+    angles = np.linspace(0, 2 * np.pi, sectors * points_per_sector + 1)
+    
+    # The same shoreline noise at every depth keeps shared edges identical
+    noise = 1 + 0.1 * np.sin(angles * rng.integers(3, 9)) + 0.02 * np.sin(angles * 37)
+    radii = np.linspace(5000, 100, bands + 1)
+    rings = [np.column_stack([radius * noise * np.cos(angles), radius * noise * np.sin(angles)]) for radius in radii]
+    
+    if layout == 'nested':
+        return shapely.polygons(rings[:-1])
+    
+    contours = []
+    for outer, inner in zip(rings[:-1], rings[1:]):
+        for sector in range(sectors):
+            arc = slice(sector * points_per_sector, (sector + 1) * points_per_sector + 1)
+            contours.append(shapely.Polygon(np.vstack([outer[arc], inner[arc][::-1], outer[arc][:1]])))
+    return np.array(contours, dtype=object)
+
+
+def load_lakes(min_contours: int, lake_count: int):
+    """
+    Load the contours of the lakes with the most contours from the bathymetry data.
+    
+    Args:
+        min_contours: Only use lakes with at least this many contours
+        lake_count: Maximum number of lakes
+        
+    Returns:
+        List of (dowlknum, contours) tuples, largest lake first
+    """
+    bathymetry_gdf = load_bathymetry_data()
+    contour_geometries = bathymetry_gdf.geometry.to_numpy()
+    lake_index = build_lake_index(bathymetry_gdf, BATHYMETRY_FIELDS['dowlknum'])
+    
+    lakes = [
+        (dowlknum, contour_geometries[rows]) for dowlknum, rows in lake_index.items()
+        if len(rows) >= min_contours
+    ]
+    lakes.sort(key=lambda lake: len(lake[1]), reverse=True)
+    return lakes[:lake_count]
+
+
+def main(argv=None):
+    """Time each union strategy per lake and compare the output areas."""
+    parser = argparse.ArgumentParser(description="Benchmark the contour union strategies")
+    parser.add_argument('--synthetic', action='store_true', help="Use generated lakes instead of the bathymetry data")
+    parser.add_argument('--layout', choices=('coverage', 'nested'), default='coverage', help="Synthetic contour layout")
+    parser.add_argument('--bands', type=int, default=40, help="Depth bands per synthetic lake")
+    parser.add_argument('--sectors', type=int, default=50, help="Sectors per depth band of a synthetic lake")
+    parser.add_argument('--lakes', type=int, default=5, help="Number of lakes (largest first for real data)")
+    parser.add_argument('--min-contours', type=int, default=1, help="Only use real lakes with at least this many contours")
+    parser.add_argument('--grid-size', type=float, default=None, help="Also time every strategy snapped to this grid (meters)")
+    parser.add_argument('--tiled', action='store_true', help="Also time every variant with the tiled union")
+    parser.add_argument('--cells-per-side', type=int, default=None, help="Grid cells per side for --tiled")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per strategy and lake (best is reported)")
+    args = parser.parse_args(argv)
+    
+    logger = setup_logging()
+    
+    if args.synthetic:
+        lakes = [
+            (f"synthetic_{seed}", make_synthetic_lake(args.bands, args.sectors, args.layout, seed))
+            for seed in range(args.lakes)
+        ]
+    else:
+        lakes = load_lakes(args.min_contours, args.lakes)
+    
+    variants = [(strategy, None, False) for strategy in UNION_STRATEGIES]
+    if args.grid_size is not None:
+        variants += [(strategy, args.grid_size, False) for strategy in UNION_STRATEGIES]
+    if args.tiled:
+        variants += [(strategy, grid_size, True) for strategy, grid_size, _ in variants]
+    
+    totals = {variant: 0.0 for variant in variants}
+    for dowlknum, contours in lakes:
+        coverage = shapely.coverage_is_valid(contours)
+        vertex_count = int(shapely.get_num_coordinates(contours).sum())
+        logger.info(f"Lake {dowlknum}: {len(contours)} contours, {vertex_count} vertices, valid coverage: {coverage}")
+        
+        reference_area = None
+        for strategy, grid_size, tiled in variants:
+            timings = []
+            for _ in range(args.repeat):
+                start_time = time.perf_counter()
+                if tiled:
+                    merged_geometry = tiled_union(contours, strategy, grid_size, args.cells_per_side)
+                else:
+                    merged_geometry = union_contours(contours, strategy, grid_size, tiled=False)
+                timings.append(time.perf_counter() - start_time)
+            
+            best = min(timings)
+            totals[(strategy, grid_size, tiled)] += best
+            area = merged_geometry.area
+            reference_area = reference_area if reference_area is not None else area
+            logger.info(
+                f"  {strategy:12s} grid={grid_size!s:6s} tiled={tiled!s:5s} {best * 1000:9.2f} ms  "
+                f"area {area:16.2f} m2 ({(area - reference_area) / reference_area * 100:+.5f}%)"
+            )
+    
+    logger.info("Total over all lakes:")
+    reference_time = totals[variants[0]]
+    for (strategy, grid_size, tiled), total in totals.items():
+        logger.info(
+            f"  {strategy:12s} grid={grid_size!s:6s} tiled={tiled!s:5s} {total:8.3f} s ({reference_time / total:.1f}x vs {variants[0][0]})"
+        )
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
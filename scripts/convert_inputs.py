@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Convert the DNR input shapefiles to faster columnar formats.
+
+The converted files are written next to the shapefiles with the same name, where
+the loader picks them up automatically (see INPUT_FORMAT_SUFFIXES). Features are
+sorted by DOWLKNUM so lakes stay contiguous for streaming and DOWLKNUM/county
+filters can skip whole Parquet row groups; GeoParquet files get a bbox covering
+column and FlatGeobuf/GeoPackage files a spatial index for bounding box filters.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import geopandas as gpd
+
+# Add the lakemapper package to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lakemapper.config import (
+    BATHYMETRY_FILE, FISH_SURVEY_FILE, BATHYMETRY_FIELDS, FISH_SURVEY_FIELDS,
+    STORE_ROW_GROUP_SIZE
+)
+from lakemapper.utils import setup_logging
+
+
+# Output formats and their file suffixes
+FORMAT_SUFFIXES = {
+    'parquet': '.parquet',
+    'fgb': '.fgb',
+    'gpkg': '.gpkg'
+}
+
+
+def convert_file(source_file: Path, dowlknum_field: str, output_format: str) -> Path:
+    """
+    Convert one shapefile to the given format.
+    
+    Args:
+        source_file: Path to the shapefile
+        dowlknum_field: Name of the DOWLKNUM field to sort by
+        output_format: One of FORMAT_SUFFIXES
+        
+    Returns:
+        Path to the converted file
+    """
+    output_file = source_file.with_suffix(FORMAT_SUFFIXES[output_format])
+    temp_file = output_file.with_name(f"{output_file.stem}.tmp{output_file.suffix}")
+    
+    gdf = gpd.read_file(source_file, engine="pyogrio", use_arrow=True)
+    if dowlknum_field in gdf.columns:
+        gdf = gdf.sort_values(dowlknum_field, kind='stable').reset_index(drop=True)
+    
+    # Write to a temporary file first so the loader never sees a partial conversion
+    temp_file.unlink(missing_ok=True)
+    if output_format == 'parquet':
+        gdf.to_parquet(temp_file, write_covering_bbox=True, row_group_size=STORE_ROW_GROUP_SIZE)
+    elif output_format == 'fgb':
+        gdf.to_file(temp_file, driver="FlatGeobuf", engine="pyogrio", SPATIAL_INDEX="YES")
+    else:
+        gdf.to_file(temp_file, driver="GPKG", engine="pyogrio", layer=source_file.stem, SPATIAL_INDEX="YES")
+    temp_file.replace(output_file)
+    
+    return output_file
+
+
+def main(argv=None):
+    """Convert the bathymetry and fish survey shapefiles."""
+    parser = argparse.ArgumentParser(description="Convert the input shapefiles to faster formats")
+    parser.add_argument(
+        '--format',
+        choices=sorted(FORMAT_SUFFIXES),
+        default='parquet',
+        help="Output format (default: parquet)"
+    )
+    args = parser.parse_args(argv)
+    
+    logger = setup_logging()
+    
+    for source_file, dowlknum_field in [
+        (BATHYMETRY_FILE, BATHYMETRY_FIELDS['dowlknum']),
+        (FISH_SURVEY_FILE, FISH_SURVEY_FIELDS['dowlknum'])
+    ]:
+        if not source_file.exists():
+            logger.error(f"Input file not found: {source_file}")
+            return 1
+        
+        start_time = time.perf_counter()
+        output_file = convert_file(source_file, dowlknum_field, args.format)
+        elapsed = time.perf_counter() - start_time
+        logger.info(f"Converted {source_file.name} to {output_file.name} in {elapsed:.2f} s")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,38 +9,221 @@ This script coordinates the entire data processing pipeline:
 4. Export results to various formats
 """
 
+import argparse
 import sys
 import time
 from pathlib import Path
 
+import geopandas as gpd
+
 # Add the lakemapper package to the Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from lakemapper.utils import setup_logging, ensure_directories
-from lakemapper.loader import load_all_data, inspect_data_sample
+from lakemapper.config import (
+    BATHYMETRY_STORE_FILE, BATHYMETRY_FIELDS, FISH_SURVEY_FIELDS, LAKE_GROUPINGS, LAKE_GROUPING,
+    UNION_STRATEGIES, UNION_STRATEGY, REPAIR_GEOMETRIES
+)
+from lakemapper.utils import setup_logging, ensure_directories, dowlknum_keys, build_lake_index
+from lakemapper.loader import (
+    load_all_data,
+    load_fish_survey_data,
+    inspect_data_sample,
+    iter_bathymetry_batches,
+    iter_lake_groups
+)
+from lakemapper.store import ensure_bathymetry_store
 from lakemapper.matcher import (
     find_matching_lakes, 
+    find_matching_lake_ids,
+    apply_spatial_fallback,
+    apply_lake_grouping,
+    group_lake_ids,
     filter_datasets_by_matching_lakes,
     get_lake_summary,
     validate_matching_data
 )
+from lakemapper.lod import build_lake_lods
+from lakemapper.match_table import (
+    build_match_table,
+    invalidate_lakes,
+    save_match_table,
+    load_match_table,
+    diff_match_tables
+)
 from lakemapper.merger import (
     merge_all_lakes,
+    merge_lake_groups,
+    build_lake_depth_bands,
     create_merged_geodataframe,
+    repair_merged_geometries,
     validate_merged_geometries
 )
 from lakemapper.exporter import (
     export_all_lakes,
     export_merged_geodataframe,
     export_summary_report,
+    export_lake_validation_table,
+    export_basin_mapping,
+    export_match_diff,
+    remove_lake_outputs,
     create_lake_index,
     create_lake_index_json
 )
 
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments for the LakeMapper pipeline."""
+    parser = argparse.ArgumentParser(description="Run the LakeMapper data processing pipeline")
+    parser.add_argument(
+        '--no-snapshot',
+        action='store_true',
+        help="Always re-read the input shapefiles instead of using the GeoParquet snapshot cache"
+    )
+    parser.add_argument(
+        '--all-columns',
+        action='store_true',
+        help="Read every attribute column instead of only the configured fields (for data inspection)"
+    )
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help="Load attributes with memory-compact dtypes (categoricals, int32 keys, float32 depths)"
+    )
+    parser.add_argument(
+        '--sequential-load',
+        action='store_true',
+        help="Load the bathymetry and fish survey data one after the other instead of concurrently"
+    )
+    parser.add_argument(
+        '--dowlknums',
+        nargs='+',
+        metavar='DOWLKNUM',
+        help="Only load these lakes (filter is pushed down into the file read)"
+    )
+    parser.add_argument(
+        '--counties',
+        nargs='+',
+        metavar='CODE',
+        help="Only load lakes in these counties (first two DOWLKNUM digits)"
+    )
+    parser.add_argument(
+        '--bbox',
+        nargs=4,
+        type=float,
+        metavar=('MINX', 'MINY', 'MAXX', 'MAXY'),
+        help="Only load features intersecting this EPSG:26915 bounding box"
+    )
+    parser.add_argument(
+        '--spatial-fallback',
+        action='store_true',
+        help="Assign contours with a missing or unmatched DOWLKNUM to the fish survey outline "
+             "they overlap most"
+    )
+    parser.add_argument(
+        '--lake-grouping',
+        choices=LAKE_GROUPINGS,
+        default=LAKE_GROUPING,
+        help="Match and merge every basin separately ('dowlknum') or all basins of a "
+             "parent lake together ('parent', first six DOWLKNUM digits)"
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help="Stream the bathymetry lake by lake from the lake-sorted store (scripts/build_store.py) "
+             "so peak memory is bounded by the batch size"
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=None,
+        help="Contours per record batch when streaming (defaults to STREAM_BATCH_SIZE)"
+    )
+    parser.add_argument(
+        '--parallel-merge',
+        action='store_true',
+        help="Merge lakes in a process pool, largest lakes first"
+    )
+    parser.add_argument(
+        '--merge-workers',
+        type=int,
+        default=None,
+        help="Worker processes for --parallel-merge (defaults to MERGE_WORKERS, then the CPU count)"
+    )
+    parser.add_argument(
+        '--union-strategy',
+        choices=UNION_STRATEGIES,
+        default=UNION_STRATEGY,
+        help="How each lake's contours are unioned (see scripts/benchmark_union.py)"
+    )
+    parser.add_argument(
+        '--grid-size',
+        type=float,
+        default=None,
+        help="Precision grid in meters to snap merged geometries to (defaults to UNION_GRID_SIZE)"
+    )
+    parser.add_argument(
+        '--lod-tolerances',
+        nargs='*',
+        type=float,
+        default=None,
+        metavar='METERS',
+        help="Simplification tolerances of the LOD files (defaults to LOD_TOLERANCES_METERS; "
+             "pass no values to skip LODs)"
+    )
+    parser.add_argument(
+        '--depth-band-interval',
+        type=float,
+        default=None,
+        metavar='FEET',
+        help="Width of the filled depth bands built from each lake's contours "
+             "(defaults to DEPTH_BAND_INTERVAL_FEET)"
+    )
+    parser.add_argument(
+        '--no-depth-bands',
+        action='store_true',
+        help="Skip building and exporting the per-lake depth-band layers"
+    )
+    parser.add_argument(
+        '--repair-geometries',
+        action=argparse.BooleanOptionalAction,
+        default=REPAIR_GEOMETRIES,
+        help="Fix invalid merged geometries with make_valid and normalize them to MultiPolygons "
+             "before export; --no-repair-geometries skips it (defaults to REPAIR_GEOMETRIES)"
+    )
+    parser.add_argument(
+        '--no-merge-cache',
+        action='store_true',
+        help="Union every lake instead of reusing merged geometries cached by previous runs"
+    )
+    parser.add_argument(
+        '--changed-only',
+        action='store_true',
+        help="Only merge and export lakes that are new or changed since the previous run's "
+             "match table, and delete the files of lakes that were removed"
+    )
+    return parser.parse_args(argv)
+
+
+def export_lake_aggregates(merged_lakes, merged_gdf, removed_dowlknums=None) -> dict:
+    """
+    Export the outputs that list every lake: merged lakes, basin mapping and lake indexes.
+    
+    A --changed-only run passes the removed lakes, so the previous run's files are
+    patched with the merged lakes instead of being replaced by the changed subset.
+    """
+    return {
+        'merged_gdf': export_merged_geodataframe(merged_gdf, removed_dowlknums=removed_dowlknums),
+        'basin_mapping': export_basin_mapping(merged_lakes, removed_dowlknums=removed_dowlknums),
+        'lake_index': create_lake_index(merged_lakes, removed_dowlknums=removed_dowlknums),
+        'lake_index_json': create_lake_index_json(merged_lakes, removed_dowlknums=removed_dowlknums)
+    }
+
+
+def main(argv=None):
     """Main execution function for the LakeMapper pipeline."""
     
+    args = parse_args(argv)
+    
     # Set up logging
     logger = setup_logging()
     logger.info("Starting LakeMapper data processing pipeline")
@@ -56,29 +239,101 @@ def main():
         logger.info("STEP 1: Loading shapefile data")
         logger.info("=" * 60)
         
-        bathymetry_gdf, fish_survey_gdf = load_all_data()
+        load_options = {
+            'use_snapshot': not args.no_snapshot,
+            'all_columns': args.all_columns,
+            'compact': args.compact,
+            'dowlknums': args.dowlknums,
+            'counties': args.counties,
+            'bbox': tuple(args.bbox) if args.bbox else None
+        }
+        
+        # A subset run's match table does not cover every lake, so it must not replace the baseline
+        subset_load = bool(args.dowlknums or args.counties or args.bbox)
         
-        # Inspect data samples
-        inspect_data_sample(bathymetry_gdf, "Bathymetry", 3)
+        changed_only = args.changed_only and not args.stream
+        if args.changed_only and args.stream:
+            logger.warning("--changed-only needs the full bathymetry to hash contours and is ignored with --stream")
+        
+        if args.stream:
+            if args.spatial_fallback:
+                logger.warning("--spatial-fallback needs the full bathymetry and is ignored with --stream")
+            
+            # Bathymetry is streamed lake by lake from the store in step 3; a
+            # missing store or one built from an older source is rebuilt first
+            fish_survey_gdf = load_fish_survey_data(**load_options)
+            bathymetry_dowlknums = group_lake_ids(ensure_bathymetry_store(), args.lake_grouping)
+            logger.info(f"Bathymetry store index lists {len(bathymetry_dowlknums)} lakes")
+        else:
+            bathymetry_gdf, fish_survey_gdf = load_all_data(
+                concurrent=not args.sequential_load,
+                **load_options
+            )
+            
+            # Inspect data samples
+            inspect_data_sample(bathymetry_gdf, "Bathymetry", 3)
         inspect_data_sample(fish_survey_gdf, "Fish Survey", 3)
         
+        fish_survey_gdf = apply_lake_grouping(fish_survey_gdf, FISH_SURVEY_FIELDS['dowlknum'], args.lake_grouping)
+        
         # Step 2: Find matching lakes
         logger.info("=" * 60)
         logger.info("STEP 2: Finding matching lakes")
         logger.info("=" * 60)
         
-        matching_dowlknums, matching_stats = find_matching_lakes(
-            bathymetry_gdf, fish_survey_gdf
-        )
+        if args.stream:
+            matching_dowlknums, matching_stats = find_matching_lake_ids(
+                bathymetry_dowlknums, fish_survey_gdf
+            )
+        else:
+            # Group before the fallback so contours are compared against outlines at the same grouping
+            bathymetry_gdf = apply_lake_grouping(bathymetry_gdf, BATHYMETRY_FIELDS['dowlknum'], args.lake_grouping)
+            if args.spatial_fallback:
+                bathymetry_gdf, fallback_stats = apply_spatial_fallback(bathymetry_gdf, fish_survey_gdf)
+            matching_dowlknums, matching_stats = find_matching_lakes(
+                bathymetry_gdf, fish_survey_gdf
+            )
+            if args.spatial_fallback:
+                matching_stats['spatial_fallback'] = fallback_stats
         
         if len(matching_dowlknums) == 0:
             logger.error("No matching lakes found! Exiting.")
             return 1
         
         # Filter datasets to only include matching lakes
-        filtered_bathymetry, filtered_fish_survey = filter_datasets_by_matching_lakes(
-            bathymetry_gdf, fish_survey_gdf, matching_dowlknums
-        )
+        if args.stream:
+            fish_survey_keys = dowlknum_keys(fish_survey_gdf, FISH_SURVEY_FIELDS['dowlknum'])
+            filtered_fish_survey = fish_survey_gdf[fish_survey_keys.isin(matching_dowlknums)].copy()
+        else:
+            filtered_bathymetry, filtered_fish_survey = filter_datasets_by_matching_lakes(
+                bathymetry_gdf, fish_survey_gdf, matching_dowlknums
+            )
+            bathymetry_index = build_lake_index(filtered_bathymetry, BATHYMETRY_FIELDS['dowlknum'])
+            
+            # Hash each matched lake's contours and outline and compare with the previous run
+            match_table = build_match_table(
+                filtered_bathymetry, filtered_fish_survey, matching_dowlknums,
+                settings={
+                    'lake_grouping': args.lake_grouping,
+                    'union_strategy': args.union_strategy,
+                    'grid_size': args.grid_size,
+                    'lod_tolerances': args.lod_tolerances,
+                    'depth_band_interval': args.depth_band_interval,
+                    'depth_bands': not args.no_depth_bands,
+                    'repair_geometries': args.repair_geometries
+                }
+            )
+            previous_match_table = load_match_table()
+            if subset_load and previous_match_table is not None:
+                # Lakes outside the subset were filtered, not removed
+                previous_match_table = previous_match_table[
+                    previous_match_table['dowlknum'].isin(match_table['dowlknum'])
+                ]
+            match_diff = diff_match_tables(previous_match_table, match_table)
+            matching_stats['match_diff'] = {name: len(dowlknums) for name, dowlknums in match_diff.items()}
+        
+        # Row positions of each lake's outline, shared by the merge and GeoDataFrame assembly
+        fish_survey_index = build_lake_index(filtered_fish_survey, FISH_SURVEY_FIELDS['dowlknum'])
         
         # Create lake summary
         lake_summary = get_lake_summary(fish_survey_gdf, matching_dowlknums)
@@ -86,29 +341,76 @@ def main():
         for _, row in lake_summary.head().iterrows():
             logger.info(f"  {row['lake_name'] or 'Unknown'} ({row['dowlknum']}): {row['acres']:.1f} acres")
         
-        # Validate matching data
-        validation_results = validate_matching_data(
-            filtered_bathymetry, filtered_fish_survey, matching_dowlknums
-        )
+        # Validate matching data (needs the full bathymetry, so skipped when streaming)
+        if not args.stream:
+            validation_results = validate_matching_data(
+                filtered_bathymetry, filtered_fish_survey, matching_dowlknums
+            )
         
         # Step 3: Merge bathymetry contours
         logger.info("=" * 60)
         logger.info("STEP 3: Merging bathymetry contours")
         logger.info("=" * 60)
         
-        merged_lakes, processing_stats = merge_all_lakes(
-            filtered_bathymetry, filtered_fish_survey, list(matching_dowlknums)
-        )
+        lakes_to_merge = matching_dowlknums
+        if changed_only:
+            lakes_to_merge = set(match_diff['new']) | set(match_diff['changed'])
+            logger.info(f"Merging {len(lakes_to_merge)} new or changed lakes, skipping {len(match_diff['unchanged'])} unchanged")
+            
+            if len(lakes_to_merge) == 0:
+                remove_lake_outputs(match_diff['removed'])
+                if match_diff['removed']:
+                    export_lake_aggregates(
+                        [], gpd.GeoDataFrame(geometry=[], crs=filtered_fish_survey.crs), match_diff['removed']
+                    )
+                    export_lake_validation_table(validation_results['lake_table'])
+                if not subset_load:
+                    save_match_table(match_table)
+                export_match_diff(match_diff)
+                logger.info("No new or changed lakes, outputs are up to date")
+                return 0
+        
+        if args.stream:
+            # Basins of a parent lake are adjacent in the DOWLKNUM-sorted store, so
+            # re-keyed batches still yield each (parent) lake as one group
+            bathymetry_batches = (
+                apply_lake_grouping(batch, BATHYMETRY_FIELDS['dowlknum'], args.lake_grouping)
+                for batch in iter_bathymetry_batches(batch_size=args.batch_size, source_file=BATHYMETRY_STORE_FILE)
+            )
+            lake_groups = iter_lake_groups(bathymetry_batches)
+            merged_lakes, processing_stats = merge_lake_groups(
+                lake_groups, filtered_fish_survey, matching_dowlknums,
+                union_strategy=args.union_strategy, grid_size=args.grid_size
+            )
+        else:
+            merged_lakes, processing_stats = merge_all_lakes(
+                filtered_bathymetry, filtered_fish_survey, list(lakes_to_merge),
+                bathymetry_index, fish_survey_index,
+                parallel=args.parallel_merge, workers=args.merge_workers,
+                union_strategy=args.union_strategy, grid_size=args.grid_size,
+                use_cache=not args.no_merge_cache
+            )
         
         if len(merged_lakes) == 0:
             logger.error("No lakes were successfully merged! Exiting.")
             return 1
         
+        # Repair merged geometries before anything is derived from them
+        if args.repair_geometries:
+            processing_stats['geometry_repair'] = repair_merged_geometries(merged_lakes)
+        
         # Validate merged geometries
         geometry_validation = validate_merged_geometries(merged_lakes)
         
+        # Build simplified level-of-detail geometries
+        processing_stats['lod'] = build_lake_lods(merged_lakes, args.lod_tolerances)
+        
+        # Build filled depth bands from each lake's contours
+        if not args.no_depth_bands:
+            processing_stats['depth_bands'] = build_lake_depth_bands(merged_lakes, args.depth_band_interval)
+        
         # Create merged GeoDataFrame
-        merged_gdf = create_merged_geodataframe(merged_lakes, filtered_fish_survey)
+        merged_gdf = create_merged_geodataframe(merged_lakes, filtered_fish_survey, fish_survey_index)
         
         # Step 4: Export results
         logger.info("=" * 60)
@@ -122,20 +424,46 @@ def main():
             export_metadata=True,
             export_raster=False,
             export_contours=True,
-            include_fish_surveys=True
+            include_fish_surveys=True,
+            export_depth_bands=not args.no_depth_bands
         )
         
-        # Export merged GeoDataFrame
-        merged_gdf_path = export_merged_geodataframe(merged_gdf)
+        # Delete the per-lake files of lakes that no longer match
+        if changed_only:
+            remove_lake_outputs(match_diff['removed'])
+        
+        # Aggregate outputs list every lake; a --changed-only run patches the
+        # previous run's files with the merged lakes and drops the removed ones
+        aggregate_paths = export_lake_aggregates(
+            merged_lakes, merged_gdf, match_diff['removed'] if changed_only else None
+        )
         
-        # Export summary report
+        # Export summary report; a --changed-only run's statistics only cover the
+        # lakes it merged, so they must not replace the full run's report
         summary_report_path = export_summary_report(
-            merged_lakes, matching_stats, processing_stats, export_stats
+            merged_lakes, matching_stats, processing_stats, export_stats,
+            output_path=Path("output") / "changed_only_report.json" if changed_only else None
         )
         
-        # Create lake index
-        lake_index_path = create_lake_index(merged_lakes)
-        lake_index_json_path = create_lake_index_json(merged_lakes)
+        # Export per-lake validation table (it covers every matched lake, also in
+        # --changed-only runs) next to the summary report
+        validation_table_path = None
+        if not args.stream:
+            validation_table_path = export_lake_validation_table(
+                validation_results['lake_table'], summary_report_path.parent / "lake_validation.parquet"
+            )
+        
+        # Export the diff and keep this run's match table as the baseline for the next run
+        match_diff_path = None
+        if not args.stream:
+            match_diff_path = export_match_diff(match_diff)
+            if subset_load:
+                logger.info("Subset load: previous match table kept as the baseline")
+            else:
+                # Lakes that failed to merge or export must not look up to date next run
+                merged_dowlknums = {lake_data['dowlknum'] for lake_data in merged_lakes}
+                failed_dowlknums = (set(lakes_to_merge) - merged_dowlknums) | set(export_stats['failed_dowlknums'])
+                save_match_table(invalidate_lakes(match_table, failed_dowlknums))
         
         # Final summary
         end_time = time.time()
@@ -146,17 +474,22 @@ def main():
         logger.info("=" * 60)
         logger.info(f"Processing time: {processing_time:.2f} seconds")
         logger.info(f"Total lakes processed: {len(merged_lakes)}")
-        logger.info(f"Success rate: {(len(merged_lakes) / len(matching_dowlknums)) * 100:.1f}%")
+        logger.info(f"Success rate: {(len(merged_lakes) / len(lakes_to_merge)) * 100:.1f}%")
         logger.info(f"Files exported: {export_stats['geojson_exported']} GeoJSON, {export_stats['metadata_exported']} metadata")
         logger.info(f"Output files:")
-        logger.info(f"  Merged GeoDataFrame: {merged_gdf_path}")
+        logger.info(f"  Merged GeoDataFrame: {aggregate_paths['merged_gdf']}")
         logger.info(f"  Summary report: {summary_report_path}")
-        logger.info(f"  Lake index: {lake_index_path}")
-        logger.info(f"  Lake index (JSON): {lake_index_json_path}")
+        if validation_table_path is not None:
+            logger.info(f"  Validation table: {validation_table_path}")
+        logger.info(f"  Lake index: {aggregate_paths['lake_index']}")
+        logger.info(f"  Lake index (JSON): {aggregate_paths['lake_index_json']}")
+        logger.info(f"  Basin mapping: {aggregate_paths['basin_mapping']}")
+        if match_diff_path is not None:
+            logger.info(f"  Match diff: {match_diff_path}")
         logger.info(f"  Individual files: output/geojson/ and output/metadata/")
         
         return 0
-        
+    
     except Exception as e:
         logger.error(f"Pipeline failed with error: {e}")
         import traceback
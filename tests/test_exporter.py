@@ -0,0 +1,82 @@
+"""
+Tests for the aggregate outputs patched by --changed-only runs.
+"""
+
+import json
+
+import geopandas as gpd
+import pandas as pd
+import shapely
+
+from lakemapper.config import CRS_EPSG
+from lakemapper.exporter import (
+    create_lake_index, create_lake_index_json, export_basin_mapping, export_merged_geodataframe
+)
+
+
+def lake_record(dowlknum, acres, contour_count):
+    """Minimal merged lake record."""
+    return {
+        'dowlknum': dowlknum,
+        'lake_name': f"Lake {dowlknum}",
+        'acres': acres,
+        'contour_count': contour_count,
+        'depth_range': {'min': -10.0, 'max': 0.0}
+    }
+
+
+FULL_RUN = [lake_record('27013300', 300.0, 5), lake_record('27013400', 200.0, 4), lake_record('27013500', 100.0, 3)]
+CHANGED_RUN = [lake_record('27013400', 200.0, 9)]
+REMOVED = ['27013500']
+
+
+def test_lake_indexes_are_patched(tmp_path):
+    """Changed lakes are replaced, removed lakes dropped and unchanged lakes kept."""
+    csv_path = tmp_path / "lake_index.csv"
+    json_path = tmp_path / "lake_index.json"
+    create_lake_index(FULL_RUN, csv_path)
+    create_lake_index_json(FULL_RUN, json_path)
+    
+    create_lake_index(CHANGED_RUN, csv_path, removed_dowlknums=REMOVED)
+    create_lake_index_json(CHANGED_RUN, json_path, removed_dowlknums=REMOVED)
+    
+    index_df = pd.read_csv(csv_path, dtype={'dowlknum': str})
+    assert list(index_df['dowlknum']) == ['27013300', '27013400']
+    assert list(index_df['contour_count']) == [5, 9]
+    
+    with open(json_path) as f:
+        records = json.load(f)
+    assert [(record['dowlknum'], record['contour_count']) for record in records] == [('27013300', 5), ('27013400', 9)]
+
+
+def test_removed_lakes_are_dropped_without_merged_lakes(tmp_path):
+    """A run that only removes lakes still drops them from the index and basin mapping."""
+    csv_path = tmp_path / "lake_index.csv"
+    mapping_path = tmp_path / "basin_mapping.csv"
+    create_lake_index(FULL_RUN, csv_path)
+    export_basin_mapping(FULL_RUN, mapping_path)
+    
+    create_lake_index([], csv_path, removed_dowlknums=REMOVED)
+    export_basin_mapping([], mapping_path, removed_dowlknums=REMOVED)
+    
+    assert list(pd.read_csv(csv_path, dtype={'dowlknum': str})['dowlknum']) == ['27013300', '27013400']
+    assert list(pd.read_csv(mapping_path, dtype=str)['lake_dowlknum']) == ['27013300', '27013400']
+
+
+def test_merged_geodataframe_is_patched(tmp_path):
+    """The merged lakes file keeps unchanged lakes and takes the changed lake's new row."""
+    output_path = tmp_path / "merged_lakes.geojson"
+    
+    def merged_gdf(records):
+        return gpd.GeoDataFrame({
+            'dowlknum': [record['dowlknum'] for record in records],
+            'contour_count': [record['contour_count'] for record in records]
+        }, geometry=[shapely.box(470000 + i * 1000, 4980000, 470500 + i * 1000, 4980500) for i in range(len(records))],
+            crs=f"EPSG:{CRS_EPSG}")
+    
+    export_merged_geodataframe(merged_gdf(FULL_RUN), output_path)
+    export_merged_geodataframe(merged_gdf(CHANGED_RUN), output_path, removed_dowlknums=REMOVED)
+    
+    patched = gpd.read_file(output_path).set_index('dowlknum')
+    assert sorted(patched.index) == ['27013300', '27013400']
+    assert patched.loc['27013400', 'contour_count'] == 9
@@ -0,0 +1,75 @@
+"""
+Tests for subset loading of the source files.
+"""
+
+import geopandas as gpd
+import pytest
+import shapely
+
+from lakemapper import loader
+from lakemapper.config import BATHYMETRY_FIELDS, DOWLKNUM_KEY_FIELD, CRS_EPSG
+
+
+TEXT_DOWLKNUMS = ['1234567', ' 01234567', '01234567.0', '27013301', '1000100', '48000200']
+NUMERIC_DOWLKNUMS = [1234567, 1234567, 27013301, 1000100, 48000200]
+
+
+def write_bathymetry(path, dowlknums):
+    """Write a bathymetry source file with the given raw DOWLKNUM values."""
+    count = len(dowlknums)
+    gdf = gpd.GeoDataFrame({
+        BATHYMETRY_FIELDS['dowlknum']: dowlknums,
+        BATHYMETRY_FIELDS['depth']: [-5.0] * count,
+        BATHYMETRY_FIELDS['abs_depth']: [5.0] * count,
+        BATHYMETRY_FIELDS['shape_leng']: [400.0] * count,
+        BATHYMETRY_FIELDS['lake_name']: [f"Lake {i}" for i in range(count)]
+    }, geometry=[shapely.box(i * 200, 0, i * 200 + 100, 100) for i in range(count)], crs=f"EPSG:{CRS_EPSG}")
+    
+    if path.suffix == '.parquet':
+        gdf.to_parquet(path)
+    else:
+        gdf.to_file(path)
+
+
+@pytest.mark.parametrize('suffix', ['.shp', '.gpkg', '.parquet'])
+@pytest.mark.parametrize('raw_dowlknums, subset, expected', [
+    (TEXT_DOWLKNUMS, {'dowlknums': ['01234567']}, ['01234567'] * 3),
+    (TEXT_DOWLKNUMS, {'counties': ['1']}, ['01000100'] + ['01234567'] * 3),
+    (TEXT_DOWLKNUMS, {'dowlknums': ['48000200'], 'counties': ['27']}, ['27013301', '48000200']),
+    (NUMERIC_DOWLKNUMS, {'dowlknums': ['1234567']}, ['01234567'] * 2),
+    (NUMERIC_DOWLKNUMS, {'counties': ['01']}, ['01000100'] + ['01234567'] * 2),
+    (NUMERIC_DOWLKNUMS, {'dowlknums': ['48000200'], 'counties': ['27']}, ['27013301', '48000200']),
+])
+def test_subset_load_matches_raw_variants(tmp_path, monkeypatch, suffix, raw_dowlknums, subset, expected):
+    """Subset loads keep every lake a full load would key the same way."""
+    source_file = tmp_path / f"bathymetry{suffix}"
+    write_bathymetry(source_file, raw_dowlknums)
+    monkeypatch.setattr(loader, 'BATHYMETRY_FILE', source_file)
+    
+    gdf = loader.load_bathymetry_data(use_snapshot=False, **subset)
+    
+    assert sorted(gdf[DOWLKNUM_KEY_FIELD].astype(str)) == expected
+
+
+def test_lake_groups_span_batch_boundaries(tmp_path):
+    """A lake split across batches is yielded once with all of its contours."""
+    source_file = tmp_path / "bathymetry.gpkg"
+    write_bathymetry(source_file, ['27013301', '27013301', '27013301', '01000100', 'bad', '48000200'])
+    
+    groups = list(loader.iter_lake_groups(loader.iter_bathymetry_batches(batch_size=2, source_file=source_file)))
+    
+    assert [dowlknum for dowlknum, _ in groups] == ['27013301', '01000100', '48000200']
+    assert list(groups[0][1].index) == [0, 1, 2]
+    assert list(groups[0][1][BATHYMETRY_FIELDS['lake_name']]) == ['Lake 0', 'Lake 1', 'Lake 2']
+    assert [len(lake_gdf) for _, lake_gdf in groups] == [3, 1, 1]
+
+
+def test_non_contiguous_lake_raises(tmp_path):
+    """A lake that reappears after another lake cannot be grouped from a stream."""
+    source_file = tmp_path / "bathymetry.gpkg"
+    write_bathymetry(source_file, ['27013301', '27013301', '01000100', '27013301'])
+    
+    groups = loader.iter_lake_groups(loader.iter_bathymetry_batches(batch_size=2, source_file=source_file))
+    
+    with pytest.raises(ValueError, match="not contiguous"):
+        list(groups)
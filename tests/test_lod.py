@@ -0,0 +1,76 @@
+"""
+Tests for the level-of-detail geometries and their export.
+"""
+
+import json
+
+import numpy as np
+import pytest
+import shapely
+
+from lakemapper.exporter import export_lake_lods, lod_filename
+from lakemapper.lod import build_lake_lods
+
+
+TOLERANCES = [10.0, 1.0, 50.0, 5.0]
+
+
+@pytest.fixture
+def merged_lakes():
+    """Two detailed lakes, one with an island."""
+    rng = np.random.default_rng(0)
+    angles = np.linspace(0, 2 * np.pi, 400, endpoint=False)
+    radii = 500 + rng.uniform(-20, 20, len(angles))
+    shore = shapely.Polygon(np.c_[470000 + radii * np.cos(angles), 4980000 + radii * np.sin(angles)])
+    island = shapely.Point(470000, 4980000).buffer(100, quad_segs=64)
+    
+    return [
+        {'dowlknum': '27013300', 'geometry': shapely.MultiPolygon([shore.difference(island)])},
+        {'dowlknum': '27013400', 'geometry': shapely.MultiPolygon([
+            shapely.Point(472000, 4980000).buffer(300, quad_segs=64),
+            shapely.Point(473000, 4980000).buffer(200, quad_segs=64)
+        ])}
+    ]
+
+
+def test_vertex_counts_shrink_with_tolerance(merged_lakes):
+    """Levels are ordered finest first and never gain vertices as the tolerance grows, and stay valid."""
+    lod_stats = build_lake_lods(merged_lakes, TOLERANCES)
+    
+    assert lod_stats['tolerances'] == sorted(TOLERANCES)
+    level_vertices = [level['vertex_count'] for level in lod_stats['levels']]
+    assert level_vertices == sorted(level_vertices, reverse=True)
+    assert level_vertices[0] < lod_stats['full_vertex_count']
+    
+    for lake_data in merged_lakes:
+        lods = lake_data['lods']
+        assert [lod['level'] for lod in lods] == [1, 2, 3, 4]
+        assert [lod['tolerance'] for lod in lods] == sorted(TOLERANCES)
+        
+        vertex_counts = [lod['vertex_count'] for lod in lods]
+        assert vertex_counts == sorted(vertex_counts, reverse=True)
+        assert vertex_counts[0] <= shapely.get_num_coordinates(lake_data['geometry'])
+        assert all(lod['vertex_count'] == shapely.get_num_coordinates(lod['geometry']) for lod in lods)
+        assert all(lod['geometry'].is_valid and not lod['geometry'].is_empty for lod in lods)
+    
+    # Topology is preserved, so the island stays a hole at every level
+    for lod in merged_lakes[0]['lods']:
+        assert shapely.get_num_interior_rings(shapely.get_parts(lod['geometry'])).sum() == 1
+
+
+def test_exported_lods_record_their_files(tmp_path, merged_lakes):
+    """The file name and size recorded for every level match the file written."""
+    build_lake_lods(merged_lakes, TOLERANCES)
+    lake_data = merged_lakes[0]
+    
+    output_paths = export_lake_lods(lake_data, output_dir=tmp_path)
+    
+    assert [path.name for path in output_paths] == [lod_filename('27013300', level) for level in [1, 2, 3, 4]]
+    for lod, output_path in zip(lake_data['lods'], output_paths):
+        assert lod['file'] == output_path.name
+        assert lod['bytes'] == output_path.stat().st_size
+        
+        with open(output_path) as f:
+            properties = json.load(f)['features'][0]['properties']
+        assert properties['level'] == lod['level']
+        assert properties['vertex_count'] == lod['vertex_count']
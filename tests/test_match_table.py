@@ -0,0 +1,79 @@
+"""
+Tests for the match table diff used by --changed-only runs.
+"""
+
+import geopandas as gpd
+import pytest
+import shapely
+
+from lakemapper.config import BATHYMETRY_FIELDS, FISH_SURVEY_FIELDS, CRS_EPSG
+from lakemapper.match_table import build_match_table, diff_match_tables, invalidate_lakes
+
+
+DOWLKNUMS = ['27013300', '27013400']
+
+
+@pytest.fixture
+def datasets():
+    """One contour and one outline per lake."""
+    bathymetry_gdf = gpd.GeoDataFrame({
+        BATHYMETRY_FIELDS['dowlknum']: DOWLKNUMS,
+        BATHYMETRY_FIELDS['depth']: [-5.0, -10.0]
+    }, geometry=[shapely.box(0, 0, 100, 100), shapely.box(500, 0, 600, 100)], crs=f"EPSG:{CRS_EPSG}")
+    fish_survey_gdf = gpd.GeoDataFrame({
+        FISH_SURVEY_FIELDS['dowlknum']: DOWLKNUMS
+    }, geometry=[shapely.box(-10, -10, 110, 110), shapely.box(490, -10, 610, 110)], crs=f"EPSG:{CRS_EPSG}")
+    return bathymetry_gdf, fish_survey_gdf
+
+
+def test_same_inputs_are_unchanged(datasets):
+    """Rebuilding the table from the same data and settings changes nothing."""
+    previous = build_match_table(*datasets, DOWLKNUMS, settings={'union_strategy': 'coverage'})
+    current = build_match_table(*datasets, DOWLKNUMS, settings={'union_strategy': 'coverage'})
+    
+    assert diff_match_tables(previous, current)['unchanged'] == DOWLKNUMS
+
+
+@pytest.mark.parametrize('settings', [
+    {'lake_grouping': 'parent'},
+    {'union_strategy': 'coverage'},
+    {'grid_size': 0.01},
+])
+def test_settings_change_marks_every_lake_changed(datasets, settings):
+    """Lakes are re-exported when a setting that shapes their outputs changes."""
+    previous = build_match_table(*datasets, DOWLKNUMS)
+    current = build_match_table(*datasets, DOWLKNUMS, settings=settings)
+    
+    assert diff_match_tables(previous, current)['changed'] == DOWLKNUMS
+
+
+def test_failed_lakes_are_retried(datasets):
+    """A lake whose hashes were cleared after a failed export diffs as changed."""
+    previous = invalidate_lakes(build_match_table(*datasets, DOWLKNUMS), ['27013400'])
+    current = build_match_table(*datasets, DOWLKNUMS)
+    
+    diff = diff_match_tables(previous, current)
+    assert diff['changed'] == ['27013400']
+    assert diff['unchanged'] == ['27013300']
+
+
+def test_table_without_settings_hash_is_changed(datasets):
+    """Tables saved before the settings hash existed do not mark lakes unchanged."""
+    previous = build_match_table(*datasets, DOWLKNUMS).drop(columns='settings_hash')
+    current = build_match_table(*datasets, DOWLKNUMS)
+    
+    assert diff_match_tables(previous, current)['changed'] == DOWLKNUMS
+
+
+def test_compact_dtypes_hash_like_full_precision(datasets):
+    """Loading with float32 and categorical columns does not change the lake hashes."""
+    bathymetry_gdf, fish_survey_gdf = datasets
+    compact_bathymetry = bathymetry_gdf.astype({
+        BATHYMETRY_FIELDS['dowlknum']: 'category',
+        BATHYMETRY_FIELDS['depth']: 'float32'
+    })
+    
+    previous = build_match_table(bathymetry_gdf, fish_survey_gdf, DOWLKNUMS)
+    current = build_match_table(compact_bathymetry, fish_survey_gdf, DOWLKNUMS)
+    
+    assert diff_match_tables(previous, current)['unchanged'] == DOWLKNUMS
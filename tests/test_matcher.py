@@ -0,0 +1,141 @@
+"""
+Tests for lake matching, grouping and the spatial fallback.
+"""
+
+import geopandas as gpd
+import numpy as np
+import pytest
+import shapely
+
+from lakemapper.config import (
+    BATHYMETRY_FIELDS, FISH_SURVEY_FIELDS, DOWLKNUM_KEY_FIELD, SPATIAL_MATCH_FIELD,
+    BASIN_KEY_FIELD, CRS_EPSG, BATHYMETRY_COMPACT_DTYPES, SPATIAL_FALLBACK_MIN_OVERLAP
+)
+from lakemapper.loader import compact_dtypes
+from lakemapper.matcher import (
+    apply_lake_grouping, apply_spatial_fallback, build_lake_validation_table, find_matching_lakes
+)
+from lakemapper.utils import add_dowlknum_key
+
+
+@pytest.fixture
+def basin_datasets():
+    """Two basins of one parent lake, with one contour of the second basin missing its key."""
+    fish_survey_gdf = gpd.GeoDataFrame({
+        FISH_SURVEY_FIELDS['dowlknum']: ['27013301', '27013302'],
+    }, geometry=[shapely.box(0, 0, 100, 100), shapely.box(200, 0, 300, 100)], crs=f"EPSG:{CRS_EPSG}")
+    
+    bathymetry_gdf = gpd.GeoDataFrame({
+        BATHYMETRY_FIELDS['dowlknum']: ['27013301', '27013301', '27013302', '27013302', None],
+        BATHYMETRY_FIELDS['depth']: [0.0, -5.0, 0.0, -5.0, -10.0]
+    }, geometry=[
+        shapely.box(0, 0, 100, 100), shapely.box(10, 10, 90, 90),
+        shapely.box(200, 0, 300, 100), shapely.box(210, 10, 290, 90),
+        shapely.box(220, 20, 280, 80)
+    ], crs=f"EPSG:{CRS_EPSG}")
+    
+    return bathymetry_gdf, fish_survey_gdf
+
+
+@pytest.mark.parametrize('group_bathymetry_first', [True, False])
+def test_spatial_fallback_with_parent_grouping(basin_datasets, group_bathymetry_first):
+    """Only the unkeyed contour is recovered when lakes are grouped by parent lake."""
+    bathymetry_gdf, fish_survey_gdf = basin_datasets
+    fish_survey_gdf = apply_lake_grouping(fish_survey_gdf, FISH_SURVEY_FIELDS['dowlknum'], 'parent')
+    if group_bathymetry_first:
+        bathymetry_gdf = apply_lake_grouping(bathymetry_gdf, BATHYMETRY_FIELDS['dowlknum'], 'parent')
+    
+    bathymetry_gdf, fallback_stats = apply_spatial_fallback(bathymetry_gdf, fish_survey_gdf)
+    
+    assert fallback_stats['unmatched_contours'] == 1
+    assert fallback_stats['recovered_contours'] == 1
+    assert fallback_stats['recovered_lakes'] == []
+    assert bathymetry_gdf[SPATIAL_MATCH_FIELD].tolist() == [False, False, False, False, True]
+    assert (bathymetry_gdf[DOWLKNUM_KEY_FIELD] == '27013300').all()
+    assert bathymetry_gdf[BASIN_KEY_FIELD].iloc[4] == '27013302'
+    
+    matching_dowlknums, _ = find_matching_lakes(bathymetry_gdf, fish_survey_gdf)
+    assert set(matching_dowlknums) == {'27013300'}
+
+
+def test_spatial_fallback_without_grouping(basin_datasets):
+    """The unkeyed contour goes to the basin outline it lies in."""
+    bathymetry_gdf, fish_survey_gdf = basin_datasets
+    
+    bathymetry_gdf, fallback_stats = apply_spatial_fallback(bathymetry_gdf, fish_survey_gdf)
+    
+    assert fallback_stats['unmatched_contours'] == 1
+    assert bathymetry_gdf[DOWLKNUM_KEY_FIELD].tolist() == ['27013301', '27013301', '27013302', '27013302', '27013302']
+    assert np.flatnonzero(bathymetry_gdf[SPATIAL_MATCH_FIELD]).tolist() == [4]
+
+
+@pytest.fixture
+def neighbour_outlines():
+    """Two adjacent lake outlines."""
+    return gpd.GeoDataFrame({
+        FISH_SURVEY_FIELDS['dowlknum']: ['27013301', '27013302'],
+    }, geometry=[shapely.box(0, 0, 100, 100), shapely.box(100, 0, 200, 100)], crs=f"EPSG:{CRS_EPSG}")
+
+
+def test_spatial_fallback_picks_the_largest_overlap(neighbour_outlines):
+    """A contour across two outlines goes to the larger overlap; a mostly outside one stays unmatched."""
+    bathymetry_gdf = gpd.GeoDataFrame({
+        BATHYMETRY_FIELDS['dowlknum']: ['27013301', None, None],
+        BATHYMETRY_FIELDS['depth']: [0.0, -5.0, -5.0]
+    }, geometry=[
+        shapely.box(0, 0, 100, 100),
+        shapely.box(60, 10, 180, 90),   # 1/3 in the first outline, 2/3 in the second
+        shapely.box(180, 10, 280, 90)   # 1/5 in the second outline
+    ], crs=f"EPSG:{CRS_EPSG}")
+    assert 0.2 < SPATIAL_FALLBACK_MIN_OVERLAP <= 2 / 3
+    
+    bathymetry_gdf, fallback_stats = apply_spatial_fallback(bathymetry_gdf, neighbour_outlines)
+    
+    assert fallback_stats['unmatched_contours'] == 2
+    assert fallback_stats['recovered_contours'] == 1
+    assert fallback_stats['still_unmatched_contours'] == 1
+    assert fallback_stats['recovered_lakes'] == ['27013302']
+    assert bathymetry_gdf[DOWLKNUM_KEY_FIELD].tolist()[:2] == ['27013301', '27013302']
+    assert bathymetry_gdf[DOWLKNUM_KEY_FIELD].isna().tolist() == [False, False, True]
+    assert bathymetry_gdf[SPATIAL_MATCH_FIELD].tolist() == [False, True, False]
+
+
+def test_spatial_fallback_adds_categories_for_compact_keys(neighbour_outlines):
+    """A lake recovered into categorical keys is added as a new category."""
+    bathymetry_gdf = gpd.GeoDataFrame({
+        BATHYMETRY_FIELDS['dowlknum']: ['27013301', None],
+        BATHYMETRY_FIELDS['depth']: [0.0, -5.0]
+    }, geometry=[shapely.box(0, 0, 100, 100), shapely.box(110, 10, 190, 90)], crs=f"EPSG:{CRS_EPSG}")
+    bathymetry_gdf = add_dowlknum_key(bathymetry_gdf, BATHYMETRY_FIELDS['dowlknum'])
+    bathymetry_gdf = compact_dtypes(bathymetry_gdf, BATHYMETRY_COMPACT_DTYPES, "bathymetry")
+    assert '27013302' not in bathymetry_gdf[DOWLKNUM_KEY_FIELD].cat.categories
+    
+    bathymetry_gdf, fallback_stats = apply_spatial_fallback(bathymetry_gdf, neighbour_outlines)
+    
+    assert fallback_stats['recovered_lakes'] == ['27013302']
+    assert bathymetry_gdf[DOWLKNUM_KEY_FIELD].dtype == 'category'
+    assert bathymetry_gdf[DOWLKNUM_KEY_FIELD].tolist() == ['27013301', '27013302']
+    
+    matching_dowlknums, _ = find_matching_lakes(bathymetry_gdf, neighbour_outlines)
+    assert set(matching_dowlknums) == {'27013301', '27013302'}
+
+
+def test_validation_table_counts_contours_per_lake():
+    """Contour, vertex and geometry-type counts per matching lake, with zeros for lakes without contours."""
+    bathymetry_gdf = gpd.GeoDataFrame({
+        BATHYMETRY_FIELDS['dowlknum']: ['27013400', '27013300', '27013300', '27099900'],
+        BATHYMETRY_FIELDS['depth']: [0.0, 0.0, -5.0, 0.0]
+    }, geometry=[
+        shapely.box(200, 0, 300, 100),
+        shapely.box(0, 0, 100, 100),
+        shapely.MultiPolygon([shapely.box(10, 10, 40, 40), shapely.box(60, 60, 90, 90)]),
+        shapely.box(900, 0, 1000, 100)
+    ], crs=f"EPSG:{CRS_EPSG}")
+    
+    lake_table = build_lake_validation_table(bathymetry_gdf, {'27013300', '27013400', '27013500'})
+    
+    assert lake_table.to_dict('records') == [
+        {'dowlknum': '27013300', 'contour_count': 2, 'vertex_count': 15, 'multipolygon_count': 1, 'polygon_count': 1},
+        {'dowlknum': '27013400', 'contour_count': 1, 'vertex_count': 5, 'multipolygon_count': 0, 'polygon_count': 1},
+        {'dowlknum': '27013500', 'contour_count': 0, 'vertex_count': 0, 'multipolygon_count': 0, 'polygon_count': 0}
+    ]
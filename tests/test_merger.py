@@ -0,0 +1,342 @@
+"""
+Tests for merging lake contours.
+"""
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+import shapely
+
+from lakemapper import merge_cache, merger
+from lakemapper.config import BATHYMETRY_FIELDS, FISH_SURVEY_FIELDS, CRS_EPSG
+from lakemapper.merger import (
+    build_depth_bands, build_lake_depth_bands, find_intersecting_contours, merge_all_lakes, union_contours
+)
+
+
+@pytest.fixture
+def lake_datasets():
+    """One lake outline with three nested depth contours."""
+    fish_survey_gdf = gpd.GeoDataFrame({
+        FISH_SURVEY_FIELDS['dowlknum']: ['27013300'],
+        FISH_SURVEY_FIELDS['acres']: [50.0],
+        FISH_SURVEY_FIELDS['city_name']: ['Wayzata'],
+        FISH_SURVEY_FIELDS['survey_url']: ['http://example.com/27013300']
+    }, geometry=[shapely.box(0, 0, 100, 100)], crs=f"EPSG:{CRS_EPSG}")
+    
+    bathymetry_gdf = gpd.GeoDataFrame({
+        BATHYMETRY_FIELDS['dowlknum']: ['27013300'] * 3,
+        BATHYMETRY_FIELDS['depth']: [0.0, -5.0, -10.0]
+    }, geometry=[shapely.box(0, 0, 100, 100), shapely.box(10, 10, 90, 90), shapely.box(20, 20, 80, 80)],
+        crs=f"EPSG:{CRS_EPSG}")
+    
+    return bathymetry_gdf, fish_survey_gdf
+
+
+def test_cached_merge_uses_current_depths(tmp_path, monkeypatch, lake_datasets):
+    """A cache hit still reports the depth range of the current contour attributes."""
+    monkeypatch.setattr(merge_cache, 'MERGE_CACHE_FILE', tmp_path / "merge_cache.parquet")
+    bathymetry_gdf, fish_survey_gdf = lake_datasets
+    
+    merged_lakes, stats = merge_all_lakes(bathymetry_gdf, fish_survey_gdf, ['27013300'])
+    assert stats['cache_misses'] == 1
+    assert merged_lakes[0]['depth_range'] == {'min': -10.0, 'max': 0.0}
+    
+    bathymetry_gdf[BATHYMETRY_FIELDS['depth']] = [0.0, -6.0, -12.0]
+    merged_lakes, stats = merge_all_lakes(bathymetry_gdf, fish_survey_gdf, ['27013300'])
+    assert stats['cache_hits'] == 1
+    assert merged_lakes[0]['depth_range'] == {'min': -12.0, 'max': 0.0}
+
+
+
+def test_single_tile_worker_unions_without_threads(monkeypatch):
+    """One tile worker (as in each --parallel-merge process) never starts a thread pool."""
+    def no_thread_pool(*args, **kwargs):
+        raise AssertionError("thread pool started")
+    
+    monkeypatch.setattr(merger, 'ThreadPoolExecutor', no_thread_pool)
+    monkeypatch.setattr(merger, 'TILED_UNION_MIN_VERTICES', 1)
+    contours = np.array([shapely.box(i, 0, i + 1.5, 1) for i in range(20)], dtype=object)
+    expected = union_contours(contours, tiled=False)
+    
+    assert union_contours(contours, tile_workers=1).equals(expected)
+    assert merger.tiled_union(contours, cells_per_side=3, workers=1).equals(expected)
+
+
+
+def test_compact_depths_match_full_precision(tmp_path, monkeypatch, lake_datasets):
+    """float32 depths give the same depth range and band limits as float64 depths."""
+    monkeypatch.setattr(merge_cache, 'MERGE_CACHE_FILE', tmp_path / "merge_cache.parquet")
+    bathymetry_gdf, fish_survey_gdf = lake_datasets
+    depth_field = BATHYMETRY_FIELDS['depth']
+    bathymetry_gdf[depth_field] = [-0.3, -5.1, -12.3]
+    
+    results = []
+    for dtype in ['float64', 'float32']:
+        bathymetry_gdf[depth_field] = bathymetry_gdf[depth_field].astype(dtype)
+        merged_lakes, _ = merge_all_lakes(bathymetry_gdf, fish_survey_gdf, ['27013300'], use_cache=False)
+        build_lake_depth_bands(merged_lakes, interval=0.1)
+        bands = [(band['min_depth'], band['max_depth']) for band in merged_lakes[0]['depth_bands']]
+        results.append((merged_lakes[0]['depth_range'], bands))
+    
+    assert results[0] == results[1]
+    assert results[1][0] == {'min': -12.3, 'max': -0.3}
+    assert results[1][1] == [(0.3, 5.1), (5.1, 12.3), (12.3, None)]
+
+
+@pytest.mark.parametrize('interval, depths, expected', [
+    (0.1, [-0.3, -5.1, -12.3], [(0.3, 5.1), (5.1, 12.3), (12.3, None)]),
+    (0.2, [-0.6, -0.7, -1.0], [(0.6, 1.0), (1.0, None)]),
+    (2.5, [0.0, -4.9, -7.5], [(0.0, 2.5), (2.5, 7.5), (7.5, None)]),
+    (5.0, [0.0, -5.0, -12.3], [(0.0, 5.0), (5.0, 10.0), (10.0, None)]),
+])
+def test_depth_band_edges(interval, depths, expected):
+    """Contours on a band edge open that band, and band limits are rounded to the interval."""
+    contours = [shapely.box(0, 0, 100, 100), shapely.box(10, 10, 90, 90), shapely.box(20, 20, 80, 80)]
+    
+    bands = build_depth_bands(contours, depths, interval)
+    
+    assert [(band['min_depth'], band['max_depth']) for band in bands] == expected
+    assert sum(band['geometry'].area for band in bands) == pytest.approx(100 * 100)
+
+
+@pytest.mark.parametrize('interval', [0, -5.0])
+def test_depth_band_interval_must_be_positive(interval):
+    """A zero or negative band width is rejected instead of replaced by the default."""
+    with pytest.raises(ValueError, match="positive"):
+        build_depth_bands([shapely.box(0, 0, 1, 1)], [-1.0], interval)
+
+
+def make_datasets(outlines, contours):
+    """Build fish survey and bathymetry frames from {dowlknum: outline} and [(dowlknum, depth, contour)]."""
+    fish_survey_gdf = gpd.GeoDataFrame({
+        FISH_SURVEY_FIELDS['dowlknum']: list(outlines),
+        FISH_SURVEY_FIELDS['acres']: [50.0] * len(outlines),
+        FISH_SURVEY_FIELDS['city_name']: ['Wayzata'] * len(outlines),
+        FISH_SURVEY_FIELDS['survey_url']: [f"http://example.com/{dowlknum}" for dowlknum in outlines]
+    }, geometry=list(outlines.values()), crs=f"EPSG:{CRS_EPSG}")
+    
+    bathymetry_gdf = gpd.GeoDataFrame({
+        BATHYMETRY_FIELDS['dowlknum']: [dowlknum for dowlknum, _, _ in contours],
+        BATHYMETRY_FIELDS['depth']: [depth for _, depth, _ in contours]
+    }, geometry=[contour for _, _, contour in contours], crs=f"EPSG:{CRS_EPSG}")
+    
+    return bathymetry_gdf, fish_survey_gdf
+
+
+@pytest.mark.filterwarnings('ignore:invalid value encountered')
+def test_parallel_merge_matches_sequential():
+    """The process pool returns the sequential results and counts a failing lake."""
+    bad_contour = shapely.Polygon([(310, 10), (320, np.nan), (330, 10)])
+    bathymetry_gdf, fish_survey_gdf = make_datasets(
+        {
+            '27013300': shapely.box(0, 0, 100, 100),
+            '27013400': shapely.box(150, 0, 250, 100),
+            '27013500': shapely.box(300, 0, 400, 100),
+            '27013600': shapely.box(450, 0, 550, 100)
+        },
+        [
+            ('27013300', 0.0, shapely.box(0, 0, 100, 100)),
+            ('27013300', -5.0, shapely.box(10, 10, 90, 90)),
+            ('27013400', -1.0, shapely.box(150, 0, 200, 100)),
+            ('27013400', -7.5, shapely.box(190, 0, 250, 100)),
+            ('27013500', -2.0, shapely.box(300, 0, 350, 50)),
+            ('27013500', -4.0, bad_contour),
+            ('27013600', -3.0, shapely.box(450, 0, 500, 50)),
+            ('27013600', -9.0, shapely.box(500, 50, 550, 100))
+        ]
+    )
+    dowlknums = ['27013300', '27013400', '27013500', '27013600']
+    
+    sequential, sequential_stats = merge_all_lakes(bathymetry_gdf, fish_survey_gdf, dowlknums, use_cache=False)
+    parallel, parallel_stats = merge_all_lakes(
+        bathymetry_gdf, fish_survey_gdf, dowlknums, parallel=True, workers=2, use_cache=False
+    )
+    
+    assert [lake['dowlknum'] for lake in parallel] == ['27013300', '27013400', '27013600']
+    assert [lake['dowlknum'] for lake in parallel] == [lake['dowlknum'] for lake in sequential]
+    for parallel_lake, sequential_lake in zip(parallel, sequential):
+        assert parallel_lake['geometry'].equals(sequential_lake['geometry'])
+        assert parallel_lake['depth_range'] == sequential_lake['depth_range']
+        assert parallel_lake['contour_count'] == sequential_lake['contour_count']
+    
+    assert parallel_stats['successful_merges'] == sequential_stats['successful_merges'] == 3
+    assert parallel_stats['failed_merges'] == sequential_stats['failed_merges'] == 1
+    assert parallel_stats['error_details'][0].startswith("Lake 27013500")
+
+
+def test_intersecting_contours_stay_with_their_lake():
+    """Contours inside a neighbour's buffer are only returned for their own lake."""
+    contour_geometries = np.array([
+        shapely.box(10, 10, 90, 90),      # lake A
+        shapely.box(100, 10, 110, 50),    # lake B, inside lake A's buffer
+        shapely.box(95, 10, 104, 50),     # lake A, inside lake B's buffer
+        shapely.box(500, 500, 510, 510),  # lake A, outside its outline
+        shapely.box(120, 10, 190, 90),    # lake B
+        shapely.box(700, 700, 710, 710)   # lake C, outside its outline
+    ], dtype=object)
+    lake_outlines = {
+        'A': shapely.box(0, 0, 100, 100),
+        'B': shapely.box(105, 0, 205, 100),
+        'C': shapely.box(300, 0, 400, 100),
+        'D': shapely.box(900, 0, 1000, 100)
+    }
+    bathymetry_index = {'A': np.array([0, 2, 3]), 'B': np.array([1, 4]), 'C': slice(5, 6)}
+    
+    lake_contours = find_intersecting_contours(contour_geometries, lake_outlines, bathymetry_index)
+    
+    assert list(lake_contours) == ['A', 'B']
+    assert list(lake_contours['A']) == [0, 2]
+    assert list(lake_contours['B']) == [1, 4]
+
+
+def test_coverage_falls_back_for_nested_contours(monkeypatch):
+    """Nested contours are not a coverage, so the coverage strategy unions them with union_all."""
+    contours = np.array([shapely.box(0, 0, 100, 100), shapely.box(10, 10, 90, 90)], dtype=object)
+    
+    def coverage_union_all(geometries):
+        raise AssertionError("coverage_union_all called for overlapping contours")
+    
+    monkeypatch.setattr(shapely, 'coverage_union_all', coverage_union_all)
+    merged = union_contours(contours, 'coverage', tiled=False)
+    
+    assert merged.equals(shapely.union_all(contours))
+
+
+@pytest.mark.parametrize('union_strategy', merger.UNION_STRATEGIES)
+def test_grid_size_snaps_every_strategy(union_strategy):
+    """The union output lies on the precision grid whichever strategy produced it."""
+    contours = np.array([
+        shapely.box(0.123, 0.456, 50.789, 100.012),
+        shapely.box(50.789, 0.456, 100.345, 100.012)
+    ], dtype=object)
+    
+    merged = union_contours(contours, union_strategy, grid_size=0.1, tiled=False)
+    
+    coordinates = shapely.get_coordinates(merged) / 0.1
+    assert np.allclose(coordinates, np.round(coordinates))
+    assert merged.area == pytest.approx(100.2 * 99.5)
+
+
+def test_unknown_union_strategy_raises():
+    """An unknown strategy is rejected before any union runs."""
+    with pytest.raises(ValueError, match="Unknown union strategy"):
+        union_contours(np.array([shapely.box(0, 0, 1, 1)], dtype=object), 'dissolve')
+
+
+@pytest.mark.parametrize('union_strategy', ['unary_union', 'union_all'])
+def test_tiled_union_matches_direct_union(union_strategy):
+    """Overlapping contours crossing cell boundaries union to the same area over several cells and threads."""
+    rng = np.random.default_rng(0)
+    centers = rng.uniform(0, 200, size=(120, 2))
+    contours = shapely.buffer(shapely.points(centers), rng.uniform(5, 30, size=len(centers)))
+    
+    tiled = merger.tiled_union(contours, union_strategy, cells_per_side=4, workers=3)
+    direct = shapely.union_all(contours)
+    
+    assert tiled.is_valid
+    assert tiled.area == pytest.approx(direct.area, rel=1e-9)
+    assert shapely.symmetric_difference(tiled, direct).area < 1e-6
+
+
+MERGED_RECORDS = [
+    {
+        'dowlknum': '27013400', 'lake_name': '', 'contour_count': 2,
+        'depth_range': {'min': -7.5, 'max': -1.0}, 'acres': 20.0, 'city_name': 'Minnetonka',
+        'survey_url': 'http://example.com/27013400', 'basin_dowlknums': ['27013401', '27013402']
+    },
+    {
+        'dowlknum': '27013300', 'lake_name': 'Wayzata Bay', 'contour_count': 3,
+        'depth_range': {'min': -10.0, 'max': 0.0}, 'acres': 50.0, 'city_name': 'Wayzata',
+        'survey_url': 'http://example.com/27013300', 'basin_dowlknums': ['27013300']
+    },
+    {
+        'dowlknum': '27099900', 'lake_name': 'No Outline', 'contour_count': 1,
+        'depth_range': {'min': -1.0, 'max': 0.0}, 'acres': 5.0, 'city_name': None,
+        'survey_url': None, 'basin_dowlknums': ['27099900']
+    }
+]
+MERGED_GEOMETRIES = [
+    shapely.MultiPolygon([shapely.box(150, 0, 250, 100)]),
+    shapely.MultiPolygon([shapely.box(0, 0, 100, 100)]),
+    shapely.MultiPolygon([shapely.box(900, 0, 950, 50)])
+]
+
+
+@pytest.mark.parametrize('form', ['records', 'ragged', 'geoarrow'])
+def test_merged_geodataframe_from_every_input(form):
+    """Records, a columnar frame with ragged geometries and GeoArrow geometries build the same frame."""
+    fish_survey_gdf = gpd.GeoDataFrame({
+        FISH_SURVEY_FIELDS['dowlknum']: ['27013500', '27013300', '27013400'],
+        'PW_BASIN_N': ['Crystal Bay', 'Wayzata Bay', 'Gideon Bay']
+    }, geometry=[shapely.box(300, 0, 400, 100), shapely.box(0, 0, 100, 100), shapely.box(150, 0, 250, 100)],
+        crs=f"EPSG:{CRS_EPSG}")
+    
+    records = [{**record, 'geometry': geometry} for record, geometry in zip(MERGED_RECORDS, MERGED_GEOMETRIES)]
+    if form == 'records':
+        merged_gdf = merger.create_merged_geodataframe(records, fish_survey_gdf)
+    else:
+        attributes = pd.DataFrame([{
+            **record,
+            'min_depth': record['depth_range']['min'],
+            'max_depth': record['depth_range']['max'],
+            'basin_dowlknums': ",".join(record['basin_dowlknums'])
+        } for record in MERGED_RECORDS]).drop(columns='depth_range')
+        if form == 'ragged':
+            geometries = shapely.to_ragged_array(MERGED_GEOMETRIES)
+        else:
+            geometries = gpd.GeoSeries(MERGED_GEOMETRIES).to_arrow()
+        merged_gdf = merger.create_merged_geodataframe(attributes, fish_survey_gdf, geometries=geometries)
+    
+    assert list(merged_gdf.columns) == ['dowlknum', 'geometry', *merger.MERGED_LAKE_COLUMNS[1:]]
+    assert list(merged_gdf['dowlknum']) == ['27013400', '27013300']
+    assert list(merged_gdf['lake_name']) == ['Gideon Bay', 'Wayzata Bay']
+    assert list(merged_gdf['basin_dowlknums']) == ['27013401,27013402', '27013300']
+    assert list(merged_gdf['max_depth']) == [-1.0, 0.0]
+    assert shapely.equals(merged_gdf.geometry.to_numpy(), MERGED_GEOMETRIES[:2]).all()
+    assert merged_gdf.crs == fish_survey_gdf.crs
+
+
+def test_repair_normalizes_to_valid_multipolygons():
+    """A bowtie, a collection and a plain polygon all come out as valid MultiPolygons."""
+    bowtie = shapely.Polygon([(0, 0), (10, 10), (10, 0), (0, 10)])
+    collection = shapely.GeometryCollection([
+        shapely.box(20, 0, 30, 10),
+        shapely.LineString([(40, 0), (50, 10)]),
+        shapely.MultiPolygon([shapely.box(60, 0, 70, 10), shapely.box(80, 0, 90, 10)])
+    ])
+    valid = shapely.MultiPolygon([shapely.box(100, 0, 110, 10)])
+    merged_lakes = [
+        {'dowlknum': dowlknum, 'geometry': geometry}
+        for dowlknum, geometry in zip(['bowtie', 'collection', 'valid', 'polygon'],
+                                      [bowtie, collection, valid, shapely.box(120, 0, 130, 10)])
+    ]
+    
+    repair_stats = merger.repair_merged_geometries(merged_lakes)
+    
+    assert repair_stats['total_lakes'] == 4
+    assert repair_stats['repaired_lakes'] == 3
+    assert repair_stats['made_valid'] == 1
+    assert repair_stats['type_normalized'] == 2
+    assert repair_stats['still_invalid'] == repair_stats['emptied'] == 0
+    assert repair_stats['repaired_dowlknums'] == ['bowtie', 'collection', 'polygon']
+    
+    geometries = [lake_data['geometry'] for lake_data in merged_lakes]
+    assert all(geometry.geom_type == 'MultiPolygon' and geometry.is_valid for geometry in geometries)
+    assert len(geometries[0].geoms) == 2
+    assert geometries[0].area == pytest.approx(50.0)
+    assert len(geometries[1].geoms) == 3
+    assert geometries[2] is valid
+
+
+def test_geometries_without_polygons_become_empty_multipolygons():
+    """Collections with no polygonal parts are emptied rather than dropped."""
+    multipolygons = merger._to_multipolygons(np.array([
+        shapely.GeometryCollection([shapely.Point(0, 0), shapely.LineString([(0, 0), (1, 1)])]),
+        shapely.box(0, 0, 1, 1)
+    ], dtype=object))
+    
+    assert [geometry.geom_type for geometry in multipolygons] == ['MultiPolygon', 'MultiPolygon']
+    assert multipolygons[0].is_empty
+    assert multipolygons[1].equals(shapely.box(0, 0, 1, 1))
@@ -0,0 +1,26 @@
+"""
+Tests for the cached-transformer reprojection helpers.
+"""
+
+import geopandas as gpd
+import shapely
+
+from lakemapper.config import CRS_EPSG
+from lakemapper.projection import to_crs
+
+
+def test_to_crs_keeps_geometry_column_name():
+    """Reprojecting matches GeoDataFrame.to_crs, including a non-default geometry column."""
+    gdf = gpd.GeoDataFrame(
+        {'DOWLKNUM': ['27013300'], 'wkb_geometry': [shapely.box(470000, 4980000, 471000, 4981000)]},
+        geometry='wkb_geometry', crs=f"EPSG:{CRS_EPSG}"
+    )
+    
+    reprojected = to_crs(gdf, 4326)
+    expected = gdf.to_crs(4326)
+    
+    assert reprojected.geometry.name == 'wkb_geometry'
+    assert list(reprojected.columns) == ['DOWLKNUM', 'wkb_geometry']
+    assert reprojected.crs.to_epsg() == 4326
+    assert reprojected.geometry.geom_equals_exact(expected.geometry, 1e-9).all()
+    assert gdf.crs.to_epsg() == CRS_EPSG
@@ -0,0 +1,77 @@
+"""
+Tests for the loader snapshot cache.
+"""
+
+import geopandas as gpd
+import pytest
+import shapely
+
+from lakemapper.config import CRS_EPSG
+from lakemapper.snapshot import compute_snapshot_key, load_snapshot, save_snapshot
+
+
+SETTINGS = {'columns': ['DOWLKNUM', 'depth'], 'compact': False}
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    """A small shapefile dataset with its sidecar files."""
+    path = tmp_path / "bathymetry.shp"
+    gpd.GeoDataFrame({
+        'DOWLKNUM': ['27013300', '27013400'],
+        'depth': [-5.0, -10.0]
+    }, geometry=[shapely.box(0, 0, 100, 100), shapely.box(200, 0, 300, 100)],
+        crs=f"EPSG:{CRS_EPSG}").to_file(path, encoding='UTF-8')
+    return path
+
+
+def test_matching_key_is_a_hit(tmp_path, source_file):
+    """A snapshot saved under a key loads back for the same source and settings."""
+    snapshot_dir = tmp_path / "snapshots"
+    gdf = gpd.read_file(source_file)
+    
+    save_snapshot('bathymetry', compute_snapshot_key(source_file, SETTINGS), gdf, snapshot_dir)
+    snapshot = load_snapshot('bathymetry', compute_snapshot_key(source_file, dict(SETTINGS)), snapshot_dir)
+    
+    assert snapshot is not None
+    assert snapshot.equals(gdf)
+
+
+def test_changed_sidecar_is_a_miss(tmp_path, source_file):
+    """Editing a sidecar file of the shapefile invalidates its snapshot."""
+    snapshot_dir = tmp_path / "snapshots"
+    key = compute_snapshot_key(source_file, SETTINGS)
+    save_snapshot('bathymetry', key, gpd.read_file(source_file), snapshot_dir)
+    
+    source_file.with_suffix('.cpg').write_text("ISO-8859-1")
+    changed_key = compute_snapshot_key(source_file, SETTINGS)
+    
+    assert changed_key != key
+    assert load_snapshot('bathymetry', changed_key, snapshot_dir) is None
+
+
+def test_changed_settings_are_a_miss(tmp_path, source_file):
+    """Loading the same source with other settings does not reuse the snapshot."""
+    snapshot_dir = tmp_path / "snapshots"
+    save_snapshot('bathymetry', compute_snapshot_key(source_file, SETTINGS), gpd.read_file(source_file), snapshot_dir)
+    
+    compact_key = compute_snapshot_key(source_file, {**SETTINGS, 'compact': True})
+    
+    assert load_snapshot('bathymetry', compact_key, snapshot_dir) is None
+
+
+def test_stale_snapshots_are_pruned(tmp_path, source_file):
+    """Saving drops snapshots of older sources with the same settings and keeps other settings."""
+    snapshot_dir = tmp_path / "snapshots"
+    gdf = gpd.read_file(source_file)
+    stale_path = save_snapshot('bathymetry', compute_snapshot_key(source_file, SETTINGS), gdf, snapshot_dir)
+    other_path = save_snapshot(
+        'bathymetry', compute_snapshot_key(source_file, {**SETTINGS, 'compact': True}), gdf, snapshot_dir
+    )
+    fish_path = save_snapshot('fish_survey', compute_snapshot_key(source_file, SETTINGS), gdf, snapshot_dir)
+    
+    source_file.with_suffix('.cpg').write_text("ISO-8859-1")
+    current_path = save_snapshot('bathymetry', compute_snapshot_key(source_file, SETTINGS), gdf, snapshot_dir)
+    
+    assert current_path != stale_path
+    assert sorted(snapshot_dir.glob("*.parquet")) == sorted([current_path, other_path, fish_path])
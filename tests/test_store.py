@@ -0,0 +1,62 @@
+"""
+Tests for the lake-sorted bathymetry store.
+"""
+
+import os
+
+import pytest
+
+from lakemapper import store
+from lakemapper.config import DOWLKNUM_KEY_FIELD
+from tests.test_loader import write_bathymetry
+
+
+RAW_DOWLKNUMS = ['27013301', '01000100', 'bad', '27013301', '48000200', '01000100', '27000100']
+
+
+@pytest.fixture
+def store_paths(tmp_path):
+    """Source, store and index paths in a temporary directory."""
+    source_file = tmp_path / "bathymetry.gpkg"
+    write_bathymetry(source_file, RAW_DOWLKNUMS)
+    return {
+        'source_file': source_file,
+        'store_file': tmp_path / "store.parquet",
+        'index_file': tmp_path / "store_index.json"
+    }
+
+
+def test_streamed_build_sorts_by_lake(store_paths):
+    """Building in small batches gives every lake one contiguous, source-ordered range."""
+    lake_index = store.build_bathymetry_store(batch_size=2, row_group_size=2, **store_paths)
+    
+    assert list(lake_index) == ['01000100', '27000100', '27013301', '48000200']
+    assert lake_index['27013301'] == slice(3, 5)
+    
+    lake_gdf = store.load_lake(
+        '27013301', store_file=store_paths['store_file'], index_file=store_paths['index_file']
+    )
+    assert list(lake_gdf[DOWLKNUM_KEY_FIELD]) == ['27013301'] * 2
+    assert list(lake_gdf['LAKE_NAME']) == ['Lake 0', 'Lake 3']
+    
+    bathymetry_gdf, _ = store.load_bathymetry_store(store_paths['store_file'], store_paths['index_file'])
+    assert len(bathymetry_gdf) == len(RAW_DOWLKNUMS)
+    assert bathymetry_gdf.crs.to_epsg() == 26915
+
+
+def test_stale_store_is_refused_and_rebuilt(store_paths):
+    """A store built before its source changed is refused by readers and rebuilt by ensure."""
+    store.build_bathymetry_store(**store_paths)
+    assert store.store_staleness(**store_paths) is None
+    
+    write_bathymetry(store_paths['source_file'], RAW_DOWLKNUMS[:3])
+    stat = store_paths['source_file'].stat()
+    os.utime(store_paths['source_file'], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    
+    assert store.store_staleness(**store_paths) is not None
+    with pytest.raises(ValueError, match="out of date"):
+        store.load_lake('27013301', store_file=store_paths['store_file'], index_file=store_paths['index_file'])
+    
+    lake_index = store.ensure_bathymetry_store(**store_paths)
+    assert list(lake_index) == ['01000100', '27013301']
+    assert store.store_staleness(**store_paths) is None